@@ -1,8 +1,31 @@
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 import numpy as np
-from rocketcea.cea_obj_w_units import CEA_Obj
 from Core.engine_inputs import EngineInputs
-from typing import List
+from typing import Callable, Iterator, List, Optional
 from CEA.CEA_Outputs import CEAOutputs
+from CEA.cea_cache import get_cea_cache
+from CEA.cea_tables import find_cea_table
+from Core.profiling import profile_stage
+
+# below this many unsolved states, pool start-up costs more than it saves
+PARALLEL_MIN_POINTS = 2000
+
+ProgressCallback = Callable[[int, int], None]   # (done, total)
+CancelCheck = Callable[[], bool]
+
+
+class CEACancelled(Exception):
+    pass
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_worker_cea = {}
 
 
 
@@ -47,45 +70,306 @@ def of_grid(engine_in: EngineInputs) -> np.ndarray:
     return grid
 
 
-def CEArun(engine_in: EngineInputs, eps: float = 40.0) -> CEAOutputs:
-    Pc_bar = engine_in.chamber_pressure / 1e5  # Pa -> bar
+def _make_cea(oxidizer_name: str, fuel_name: str):
+    # rocketcea loads its Fortran extension on import, so it's deferred to the first solve
+    from rocketcea.cea_obj_w_units import CEA_Obj
 
-    cea = CEA_Obj(
-        oxName=engine_in.oxidizer_name,
-        fuelName=engine_in.fuel_name,
+    return CEA_Obj(
+        oxName=oxidizer_name,
+        fuelName=fuel_name,
         pressure_units="bar",
         temperature_units="K",
         density_units="kg/m^3",
     )
 
-    OF_values = of_grid(engine_in).astype(float)
+
+def _solve_chamber_state(cea, Pc_bar: float, MR: float, eps: float):
+    """
+    Solves one (Pc, MR, eps) state with a single CEA call and returns
+    (T_chamber, molecular_weight, gamma, density_chamber).
+
+    The chamber column is equilibrium regardless of the frozen flag (frozen
+    only changes the throat/exit columns), so one equilibrium run yields every
+    field get_Tcomb, get_Chamber_MolWt_gamma and get_Densities would return.
+    """
+    from rocketcea import cea_obj as _cea_obj_module
+
+    base = cea.cea_obj
+    try:
+        base.setupCards(Pc=cea.Pc_U.uval_to_dval(Pc_bar), MR=MR, eps=eps)
+        prtout = _cea_obj_module.py_cea.prtout
+        i = base.i_chm
+    except AttributeError:
+        # rocketcea internals moved; fall back to the public per-quantity calls
+        T_c = cea.get_Tcomb(Pc=Pc_bar, MR=MR)
+        mw, gam = cea.get_Chamber_MolWt_gamma(Pc=Pc_bar, MR=MR, eps=eps)
+        rho = cea.get_Densities(Pc=Pc_bar, MR=MR, eps=eps, frozen=0, frozenAtThroat=0)[0]
+        return T_c, mw, gam, rho
+
+    T_c = cea.temperature_U.dval_to_uval(prtout.ttt[i] * 1.8)  # K -> degR -> user units, same path as get_Tcomb
+
+    try:
+        mw = 1.0 / prtout.totn[i]
+    except ZeroDivisionError:
+        mw = prtout.wm[i]
+    gam = prtout.gammas[i]
+
+    rho = cea.density_U.dval_to_uval(62.42796 * 100.0 / prtout.vlm[i])  # lbm/cuft -> user units
+
+    return float(T_c), float(mw), float(gam), float(rho)
+
+
+def _get_cea(oxidizer_name: str, fuel_name: str):
+    # one CEA_Obj per propellant pair per process (pool workers and the serial path alike)
+    cea = _worker_cea.get((oxidizer_name, fuel_name))
+    if cea is None:
+        cea = _worker_cea[(oxidizer_name, fuel_name)] = _make_cea(oxidizer_name, fuel_name)
+    return cea
+
+
+def _solve_chunk(args):
+    # process-pool task
+    oxidizer_name, fuel_name, pc, mr, eps = args
+    cea = _get_cea(oxidizer_name, fuel_name)
+    return np.array(
+        [_solve_chamber_state(cea, Pc, MR, eps) for Pc, MR in zip(pc, mr)], dtype=float
+    ).reshape(-1, 4)
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    # pool is kept alive between runs so repeated sweeps only pay start-up once
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        shutdown_cea_pool()
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        _pool_workers = workers
+    return _pool
+
+
+def shutdown_cea_pool():
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+    _pool = None
+    _pool_workers = 0
+
+
+atexit.register(shutdown_cea_pool)
+
+
+def resolve_workers(workers) -> int:
+    # None/1 -> serial, <= 0 -> one worker per core
+    cores = os.cpu_count() or 1
+    if workers is None:
+        return 1
+    workers = int(workers)
+    if workers <= 0:
+        return cores
+    return min(workers, cores)
+
+
+def _solve_states(
+    oxidizer_name, fuel_name, pc, mr, eps, workers: int = 1,
+    progress: Optional[ProgressCallback] = None, cancel: Optional[CancelCheck] = None,
+) -> np.ndarray:
+    m = mr.size
+    workers = resolve_workers(workers)
+
+    if workers == 1 or m < PARALLEL_MIN_POINTS:
+        return _solve_serial(oxidizer_name, fuel_name, pc, mr, eps, progress, cancel)
+
+    # a few contiguous shards per worker to even out load; results are collected in shard order
+    bounds = np.linspace(0, m, 4 * workers + 1).astype(int)
+    chunks = [
+        (oxidizer_name, fuel_name, pc[lo:hi], mr[lo:hi], eps)
+        for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo
+    ]
+    try:
+        futures = [_get_pool(workers).submit(_solve_chunk, c) for c in chunks]
+        parts = []
+        for fut in futures:
+            if cancel is not None and cancel():
+                for f in futures:
+                    f.cancel()
+                raise CEACancelled("CEA run cancelled.")
+            parts.append(fut.result())
+            if progress is not None:
+                progress(sum(p.shape[0] for p in parts), m)
+        return np.concatenate(parts)
+    except BrokenProcessPool:
+        shutdown_cea_pool()
+        return _solve_serial(oxidizer_name, fuel_name, pc, mr, eps, progress, cancel)
+
+
+def _solve_serial(oxidizer_name, fuel_name, pc, mr, eps, progress=None, cancel=None) -> np.ndarray:
+    if progress is None and cancel is None:
+        return _solve_chunk((oxidizer_name, fuel_name, pc, mr, eps))
+
+    cea = _get_cea(oxidizer_name, fuel_name)
+    m = mr.size
+    out = np.empty((m, 4), dtype=float)
+    for k in range(m):
+        if cancel is not None and cancel():
+            raise CEACancelled("CEA run cancelled.")
+        out[k] = _solve_chamber_state(cea, pc[k], mr[k], eps)
+        if progress is not None:
+            progress(k + 1, m)
+    return out
+
+
+def cea_batch(
+    oxidizer_name: str,
+    fuel_name: str,
+    pc_bar,
+    of_values,
+    eps: float = 40.0,
+    frozen: bool = False,
+    use_cache: bool = True,
+    workers: int = 1,
+    use_tables: bool = True,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancelCheck] = None,
+) -> CEAOutputs:
+    """
+    Evaluates the chamber state for every mixture ratio in of_values.
+
+    pc_bar may be a scalar or an array broadcastable to of_values. Points
+    covered by a registered CEATable (within its error bound) are
+    interpolated; of the rest, each unique state is solved once and cached
+    states are not solved at all. With workers > 1 (or <= 0 for all cores)
+    large batches are sharded across a process pool.
+
+    progress(done, total) is called as unsolved states complete; cancel() is
+    polled between solves and raises CEACancelled when it returns True.
+    """
+    OF_values = np.atleast_1d(np.asarray(of_values, dtype=float))
+    Pc_values = np.broadcast_to(np.asarray(pc_bar, dtype=float), OF_values.shape).astype(float)
 
     # frozen or equilibrium CEA run
-    frozen_eqm = 1 if engine_in.frozen_flag else 0
+    frozen_eqm = 1 if frozen else 0
     n = OF_values.size
+    states = np.empty((n, 4), dtype=float)
+    live = np.arange(n)
 
-    T_chamber = np.empty(n, dtype=float)
-    gamma = np.empty(n, dtype=float)
-    mol_wt = np.empty(n, dtype=float)
-    density = np.empty(n, dtype=float)
-    
-    for i, MR in enumerate(OF_values):
-        T_chamber[i] = cea.get_Tcomb(Pc=Pc_bar, MR=MR)
+    # precomputed table: vectorized interpolation, live CEA only where it can't vouch for accuracy
+    table = find_cea_table(oxidizer_name, fuel_name, eps, frozen) if use_tables else None
+    if table is not None:
+        with profile_stage("cea.table"):
+            served, ok = table.interpolate(Pc_values, OF_values)
+            states[ok] = served[ok]
+            live = np.flatnonzero(~ok)
 
-        mw_i, gamma_i = cea.get_Chamber_MolWt_gamma(Pc=Pc_bar, MR=MR, eps=eps)
-        mol_wt[i] = mw_i
-        gamma[i] = gamma_i
+    # persistent cache lookup; only misses go to the Fortran solver
+    cache = get_cea_cache() if use_cache and live.size else None
+    if cache is not None:
+        with profile_stage("cea.cache"):
+            ident = [
+                cache.key(oxidizer_name, fuel_name, Pc, MR, eps, frozen_eqm)
+                for Pc, MR in zip(Pc_values[live], OF_values[live])
+            ]
+            cached = cache.get_many(ident)
+    else:
+        ident = list(zip(Pc_values[live].tolist(), OF_values[live].tolist()))
+        cached = {}
 
-        dens_i, _, _ = cea.get_Densities(
-            Pc=Pc_bar, MR=MR, eps=eps, frozen=frozen_eqm, frozenAtThroat=0
-        )
-        density[i] = dens_i
+    todo = {}
+    for i, k in zip(live, ident):
+        hit = cached.get(k)
+        if hit is not None:
+            states[i] = hit
+        elif k not in todo:
+            todo[k] = i  # first occurrence of an unsolved state
+
+    if todo:
+        first = np.fromiter(todo.values(), dtype=int, count=len(todo))
+        with profile_stage("cea.solve"):
+            solved = _solve_states(
+                oxidizer_name, fuel_name, Pc_values[first], OF_values[first], eps, workers, progress, cancel
+            )
+        lookup = {k: tuple(row) for k, row in zip(todo, solved.tolist())}
+
+        for i, k in zip(live, ident):
+            if k in lookup:
+                states[i] = lookup[k]
+
+        if cache is not None:
+            with profile_stage("cea.cache"):
+                cache.put_many(lookup)
 
     return CEAOutputs(
         OF_Ratio=OF_values,
-        p_chamber=np.full(n, Pc_bar, dtype=float),
-        gamma=gamma,
-        T_chamber=T_chamber,
-        molecular_weight=mol_wt,
-        density_chamber=density,
-    )
\ No newline at end of file
+        p_chamber=Pc_values,
+        gamma=states[:, 2].copy(),
+        T_chamber=states[:, 0].copy(),
+        molecular_weight=states[:, 1].copy(),
+        density_chamber=states[:, 3].copy(),
+    )
+
+
+def CEArun(
+    engine_in: EngineInputs,
+    eps: float = 40.0,
+    use_cache: bool = True,
+    workers: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancelCheck] = None,
+) -> CEAOutputs:
+    # workers defaults to engine_in.workers
+    if workers is None:
+        workers = engine_in.workers
+
+    Pc_bar = engine_in.chamber_pressure / 1e5  # Pa -> bar
+
+    return cea_batch(
+        engine_in.oxidizer_name,
+        engine_in.fuel_name,
+        Pc_bar,
+        of_grid(engine_in),
+        eps=eps,
+        frozen=engine_in.frozen_flag,
+        use_cache=use_cache,
+        workers=workers,
+        progress=progress,
+        cancel=cancel,
+    )
+
+
+def CEArun_iter(
+    engine_in: EngineInputs,
+    eps: float = 40.0,
+    chunk_size: int = 64,
+    use_cache: bool = True,
+    workers: Optional[int] = None,
+    cancel: Optional[CancelCheck] = None,
+) -> Iterator[CEAOutputs]:
+    """
+    Yields CEAOutputs for consecutive slices of of_grid(engine_in), in order.
+
+    The first slice is a single point so callers can show results after one
+    CEA solve; later slices double in size up to chunk_size.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1.")
+    if workers is None:
+        workers = engine_in.workers
+
+    Pc_bar = engine_in.chamber_pressure / 1e5  # Pa -> bar
+    OF_values = of_grid(engine_in).astype(float)
+    n = OF_values.size
+
+    start, size = 0, 1
+    while start < n:
+        stop = min(start + size, n)
+        yield cea_batch(
+            engine_in.oxidizer_name,
+            engine_in.fuel_name,
+            Pc_bar,
+            OF_values[start:stop],
+            eps=eps,
+            frozen=engine_in.frozen_flag,
+            use_cache=use_cache,
+            workers=workers,
+            cancel=cancel,
+        )
+        start = stop
+        size = min(2 * size, chunk_size)
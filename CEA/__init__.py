@@ -1,5 +1,13 @@
 from .CEARunner import (
-    CEArun, of_grid
+    CEArun, CEArun_iter, of_grid, cea_batch, shutdown_cea_pool, CEACancelled
 )
 
-from .CEA_Outputs import CEAOutputs
\ No newline at end of file
+from .CEA_Outputs import CEAOutputs
+
+from .cea_cache import (
+    CEACache, get_cea_cache, set_cea_cache, cea_cache_stats
+)
+
+from .cea_tables import (
+    CEATable, build_cea_table, save_cea_table, load_cea_table, register_cea_table, unregister_cea_table, clear_cea_tables
+)
\ No newline at end of file
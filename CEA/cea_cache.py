@@ -0,0 +1,271 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import warnings
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+# (T_chamber, molecular_weight, gamma, density_chamber)
+CEAState = Tuple[float, float, float, float]
+
+DEFAULT_CACHE_PATH = Path.home() / ".prompt" / "cea_cache.sqlite"
+DEFAULT_MAX_ENTRIES = 250_000
+BUSY_TIMEOUT_S = 2.0     # how long a write waits on another process's lock before it's skipped
+
+_SCHEMA_VERSION = "1"
+
+
+def rocketcea_version() -> str:
+    try:
+        from rocketcea._version import __version__
+    except ImportError:
+        return "unknown"
+    return str(__version__)
+
+
+class CEACache:
+    """
+    Persistent, content-addressed cache of CEA chamber states.
+
+    Entries are keyed on a hash of (oxidizer, fuel, Pc [bar], MR, eps, frozen)
+    plus the rocketcea version, stored in SQLite and evicted least-recently-used
+    once max_entries is exceeded. Opening a cache written by a different
+    rocketcea version drops every stored entry.
+
+    The cache never fails a run: a corrupt file is rebuilt, and if the file
+    can't be opened at all (unwritable, or locked by another process) the
+    cache lives in memory for the session, with a warning. Afterwards a
+    lookup that hits a database error counts as misses and a store that
+    does is skipped (both counted in `errors`). The file is in WAL mode so
+    concurrent processes (cli.py -j, a second GUI) mostly don't block each
+    other; writes wait up to `timeout` seconds for a lock.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES, version: Optional[str] = None,
+                 timeout: float = BUSY_TIMEOUT_S):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be > 0.")
+
+        self.path = str(path)
+        self.max_entries = int(max_entries)
+        self.version = version if version is not None else rocketcea_version()
+        self.timeout = float(timeout)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+        self._lock = threading.Lock()
+        self._clock = 0
+        self._conn = self._open()
+
+    # -----------------------
+    # setup
+    # -----------------------
+    def _open(self) -> sqlite3.Connection:
+        if self.path != ":memory:":
+            try:
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                return self._connect(self.path)
+            except sqlite3.OperationalError as e:
+                # locked by another process (or unopenable); leave the file alone
+                reason = e
+            except sqlite3.DatabaseError:
+                # not a database / malformed: start the file over
+                self._remove_files()
+                try:
+                    return self._connect(self.path)
+                except sqlite3.Error as e:
+                    reason = e
+            except OSError as e:
+                reason = e
+            warnings.warn(f"CEA cache {self.path} is unusable ({reason}); caching in memory for this session.",
+                          RuntimeWarning, stacklevel=3)
+            self.path = ":memory:"
+        return self._connect(":memory:")
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(path, timeout=self.timeout, check_same_thread=False)
+        try:
+            if path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+            self._init_schema(conn)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def _remove_files(self):
+        for suffix in ("", "-wal", "-shm", "-journal"):
+            try:
+                os.remove(self.path + suffix)
+            except FileNotFoundError:
+                pass
+
+    def _init_schema(self, c: sqlite3.Connection):
+        with c:
+            c.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            stored = dict(c.execute("SELECT name, value FROM meta").fetchall())
+            if stored.get("rocketcea") != self.version or stored.get("schema") != _SCHEMA_VERSION:
+                # solver or table layout changed; nothing stored is trustworthy anymore
+                c.execute("DROP TABLE IF EXISTS states")
+                c.execute("INSERT OR REPLACE INTO meta VALUES ('rocketcea', ?)", (self.version,))
+                c.execute("INSERT OR REPLACE INTO meta VALUES ('schema', ?)", (_SCHEMA_VERSION,))
+
+            c.execute(
+                "CREATE TABLE IF NOT EXISTS states ("
+                " key TEXT PRIMARY KEY,"
+                " t_chamber REAL, mol_wt REAL, gamma REAL, density REAL,"
+                " last_used INTEGER)"
+            )
+            c.execute("CREATE INDEX IF NOT EXISTS states_last_used ON states(last_used)")
+
+            row = c.execute("SELECT MAX(last_used) FROM states").fetchone()
+            self._clock = int(row[0] or 0)
+
+    # -----------------------
+    # keys
+    # -----------------------
+    def key(self, oxidizer: str, fuel: str, pc_bar: float, mr: float, eps: float, frozen: bool) -> str:
+        payload = json.dumps(
+            [self.version, str(oxidizer), str(fuel), float(pc_bar), float(mr), float(eps), int(bool(frozen))]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # -----------------------
+    # lookups
+    # -----------------------
+    def get_many(self, keys: Iterable[str]) -> Dict[str, CEAState]:
+        keys = list(keys)
+        found: Dict[str, CEAState] = {}
+        if not keys:
+            return found
+
+        with self._lock:
+            try:
+                with self._conn:
+                    unique = list(dict.fromkeys(keys))
+                    for start in range(0, len(unique), 500):  # stay under SQLite's bound-parameter limit
+                        chunk = unique[start:start + 500]
+                        marks = ",".join("?" * len(chunk))
+                        rows = self._conn.execute(
+                            f"SELECT key, t_chamber, mol_wt, gamma, density FROM states WHERE key IN ({marks})", chunk
+                        ).fetchall()
+                        for k, tc, mw, gam, rho in rows:
+                            found[k] = (tc, mw, gam, rho)
+
+                    if found:
+                        self._clock += 1
+                        self._conn.executemany(
+                            "UPDATE states SET last_used = ? WHERE key = ?", [(self._clock, k) for k in found]
+                        )
+            except sqlite3.Error:
+                # whatever couldn't be read is a miss; a failed recency update only costs LRU accuracy
+                self.errors += 1
+
+            hits = sum(1 for k in keys if k in found)
+            self.hits += hits
+            self.misses += len(keys) - hits
+
+        return found
+
+    def get(self, key: str) -> Optional[CEAState]:
+        return self.get_many([key]).get(key)
+
+    def put_many(self, items: Dict[str, CEAState]):
+        if not items:
+            return
+
+        with self._lock:
+            try:
+                with self._conn:
+                    self._clock += 1
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO states VALUES (?, ?, ?, ?, ?, ?)",
+                        [(k, float(v[0]), float(v[1]), float(v[2]), float(v[3]), self._clock) for k, v in items.items()],
+                    )
+                    self._evict()
+            except sqlite3.Error:
+                # locked or damaged: the states were solved anyway, they just aren't kept
+                self.errors += 1
+
+    def put(self, key: str, value: CEAState):
+        self.put_many({key: value})
+
+    def _evict(self):
+        count = self._conn.execute("SELECT COUNT(*) FROM states").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM states WHERE key IN (SELECT key FROM states ORDER BY last_used ASC LIMIT ?)", (excess,)
+            )
+            self.evictions += excess
+
+    # -----------------------
+    # maintenance / stats
+    # -----------------------
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM states")
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM states").fetchone()[0])
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "rocketcea_version": self.version,
+            "path": self.path,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache: Optional[CEACache] = None
+_cache_disabled = False
+
+
+def get_cea_cache() -> Optional[CEACache]:
+    """
+    Returns the process-wide cache, creating it on first use.
+
+    PROMPT_CEA_CACHE overrides the file location; set it to "off" to disable
+    persistent caching entirely.
+    """
+    global _default_cache
+    if _cache_disabled:
+        return None
+    if _default_cache is None:
+        env = os.environ.get("PROMPT_CEA_CACHE", "").strip()
+        if env.lower() in ("off", "0", "false", "none"):
+            return None
+        _default_cache = CEACache(env or DEFAULT_CACHE_PATH)
+    return _default_cache
+
+
+def set_cea_cache(cache: Optional[CEACache]):
+    # pass None to disable caching for the rest of the session
+    global _default_cache, _cache_disabled
+    _default_cache = cache
+    _cache_disabled = cache is None
+
+
+def cea_cache_stats() -> dict:
+    cache = get_cea_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
@@ -0,0 +1,211 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from CEA.cea_cache import rocketcea_version
+
+# order of the stacked value planes in CEATable.values
+TABLE_FIELDS = ("T_chamber", "molecular_weight", "gamma", "density_chamber")
+
+DEFAULT_ERROR_BOUND = 1e-3  # max relative interpolation error served from a table
+
+
+@dataclass
+class CEATable:
+    oxidizer_name: str
+    fuel_name: str
+    eps: float
+    frozen: bool
+    pc_bar: NDArray[np.float64]          # (n_pc,) ascending
+    of: NDArray[np.float64]              # (n_of,) ascending
+    values: NDArray[np.float64]          # (4, n_pc, n_of) in TABLE_FIELDS order
+    cell_error: NDArray[np.float64]      # (n_pc - 1, n_of - 1) max relative error at cell centres
+    rocketcea_version: str = "unknown"
+    error_bound: float = DEFAULT_ERROR_BOUND
+    # log(values), taken once here rather than on every interpolate() call
+    log_values: NDArray[np.float64] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.values = np.asarray(self.values, dtype=float)
+        self.log_values = np.log(self.values)
+
+    @property
+    def key(self) -> Tuple[str, str, float, bool]:
+        return _table_key(self.oxidizer_name, self.fuel_name, self.eps, self.frozen)
+
+    def interpolate(self, pc_bar, of) -> Tuple[NDArray[np.float64], NDArray[np.bool_]]:
+        """
+        Bilinear interpolation of log(value) in (log Pc, O/F); density scales
+        almost linearly with Pc, so log-log keeps it accurate along the Pc axis.
+
+        Returns (values, ok) where values is (n, 4) in TABLE_FIELDS order and
+        ok marks points inside the table whose cell error is within
+        error_bound. Rows where ok is False are NaN.
+        """
+        pc = np.atleast_1d(np.asarray(pc_bar, dtype=float))
+        of = np.atleast_1d(np.asarray(of, dtype=float))
+        pc, of = np.broadcast_arrays(pc, of)
+
+        x_axis = np.log(self.pc_bar)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = np.log(pc)
+        y = of
+
+        inside = (x >= x_axis[0]) & (x <= x_axis[-1]) & (y >= self.of[0]) & (y <= self.of[-1])
+
+        i = np.clip(np.searchsorted(x_axis, x, side="right") - 1, 0, x_axis.size - 2)
+        j = np.clip(np.searchsorted(self.of, y, side="right") - 1, 0, self.of.size - 2)
+
+        tx = (x - x_axis[i]) / (x_axis[i + 1] - x_axis[i])
+        ty = (y - self.of[j]) / (self.of[j + 1] - self.of[j])
+
+        v = self.log_values
+        out = np.exp(
+            v[:, i, j] * (1 - tx) * (1 - ty)
+            + v[:, i + 1, j] * tx * (1 - ty)
+            + v[:, i, j + 1] * (1 - tx) * ty
+            + v[:, i + 1, j + 1] * tx * ty
+        ).T
+
+        ok = inside & (self.cell_error[i, j] <= self.error_bound)
+        out[~ok] = np.nan
+        return out, ok
+
+
+def _table_key(oxidizer_name: str, fuel_name: str, eps: float, frozen: bool) -> Tuple[str, str, float, bool]:
+    return (str(oxidizer_name), str(fuel_name), float(eps), bool(frozen))
+
+
+def build_cea_table(
+    oxidizer_name: str,
+    fuel_name: str,
+    pc_bar,
+    of,
+    eps: float = 40.0,
+    frozen: bool = False,
+    error_bound: float = DEFAULT_ERROR_BOUND,
+    workers: int = 1,
+) -> CEATable:
+    """
+    Solves CEA on the full (pc_bar x of) grid and at every cell centre.
+
+    The cell-centre solves give a measured interpolation error per cell, so
+    lookups can refuse cells that are too coarse (e.g. near stoichiometric
+    where Tc bends sharply) and fall back to live CEA there.
+    """
+    from CEA.CEARunner import cea_batch
+
+    pc_axis = np.unique(np.asarray(pc_bar, dtype=float))
+    of_axis = np.unique(np.asarray(of, dtype=float))
+    if pc_axis.size < 2 or of_axis.size < 2:
+        raise ValueError("CEA tables need at least two Pc and two O/F values.")
+    if pc_axis[0] <= 0.0 or of_axis[0] <= 0.0:
+        raise ValueError("Table Pc and O/F values must be positive.")
+
+    def solve(pc_1d, of_1d):
+        P, F = np.meshgrid(pc_1d, of_1d, indexing="ij")
+        out = cea_batch(oxidizer_name, fuel_name, P.ravel(), F.ravel(), eps=eps, frozen=frozen,
+                        use_tables=False, workers=workers)
+        return np.stack([getattr(out, name).reshape(P.shape) for name in TABLE_FIELDS])
+
+    values = solve(pc_axis, of_axis)
+
+    table = CEATable(
+        oxidizer_name=str(oxidizer_name),
+        fuel_name=str(fuel_name),
+        eps=float(eps),
+        frozen=bool(frozen),
+        pc_bar=pc_axis,
+        of=of_axis,
+        values=values,
+        cell_error=np.zeros((pc_axis.size - 1, of_axis.size - 1)),
+        rocketcea_version=rocketcea_version(),
+        error_bound=float(error_bound),
+    )
+
+    # geometric midpoint in Pc matches the log-Pc interpolation
+    pc_mid = np.sqrt(pc_axis[:-1] * pc_axis[1:])
+    of_mid = 0.5 * (of_axis[:-1] + of_axis[1:])
+    exact = solve(pc_mid, of_mid)
+
+    P, F = np.meshgrid(pc_mid, of_mid, indexing="ij")
+    table.error_bound = np.inf  # measure without the bound applied
+    approx, _ = table.interpolate(P.ravel(), F.ravel())
+    approx = approx.T.reshape(exact.shape)
+    table.cell_error = np.max(np.abs(approx / exact - 1.0), axis=0)
+    table.error_bound = float(error_bound)
+
+    return table
+
+
+def save_cea_table(table: CEATable, path, compressed: bool = True) -> str:
+    path = Path(path)
+    if path.suffix.lower() != ".npz":
+        path = path.with_suffix(".npz")
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    writer = np.savez_compressed if compressed else np.savez
+    writer(
+        path,
+        oxidizer_name=np.array(table.oxidizer_name),
+        fuel_name=np.array(table.fuel_name),
+        eps=np.array(table.eps),
+        frozen=np.array(table.frozen),
+        pc_bar=table.pc_bar,
+        of=table.of,
+        values=table.values,
+        cell_error=table.cell_error,
+        rocketcea_version=np.array(table.rocketcea_version),
+        error_bound=np.array(table.error_bound),
+    )
+    return str(path)
+
+
+def load_cea_table(path, error_bound: Optional[float] = None) -> CEATable:
+    with np.load(path, allow_pickle=False) as data:
+        table = CEATable(
+            oxidizer_name=str(data["oxidizer_name"]),
+            fuel_name=str(data["fuel_name"]),
+            eps=float(data["eps"]),
+            frozen=bool(data["frozen"]),
+            pc_bar=np.array(data["pc_bar"], dtype=float),
+            of=np.array(data["of"], dtype=float),
+            values=np.array(data["values"], dtype=float),
+            cell_error=np.array(data["cell_error"], dtype=float),
+            rocketcea_version=str(data["rocketcea_version"]),
+            error_bound=float(data["error_bound"]),
+        )
+
+    if table.rocketcea_version != rocketcea_version():
+        raise ValueError(
+            f"CEA table was built with rocketcea {table.rocketcea_version}, "
+            f"installed version is {rocketcea_version()}; rebuild the table."
+        )
+    if error_bound is not None:
+        table.error_bound = float(error_bound)
+    return table
+
+
+_tables: Dict[Tuple[str, str, float, bool], CEATable] = {}
+
+
+def register_cea_table(table: CEATable):
+    # cea_batch / CEArun serve matching requests from registered tables
+    _tables[table.key] = table
+
+
+def unregister_cea_table(table: CEATable):
+    _tables.pop(table.key, None)
+
+
+def clear_cea_tables():
+    _tables.clear()
+
+
+def find_cea_table(oxidizer_name: str, fuel_name: str, eps: float, frozen: bool) -> Optional[CEATable]:
+    if not _tables:
+        return None
+    return _tables.get(_table_key(oxidizer_name, fuel_name, eps, frozen))
@@ -0,0 +1,310 @@
+"""
+Headless batch runner: reads EngineInputs cases from JSON/YAML/CSV files,
+runs engine_design_run on each and writes the CSV exports per case.
+
+    python cli.py cases.json -o results -j 4
+    python cli.py cases.json --results-format parquet --compression zstd
+    python cli.py huge_sweep.json --stream          # CSVs written chunk by chunk
+
+Nothing here imports Qt or matplotlib.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import MISSING, dataclass, fields
+from multiprocessing import get_context
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union, get_args, get_origin
+
+import numpy as np
+
+from .engine_inputs import EngineInputs
+
+_TRUE = {"1", "true", "yes", "y", "on"}
+_FALSE = {"0", "false", "no", "n", "off"}
+
+
+@dataclass
+class BatchCase:
+    name: str
+    inputs: EngineInputs
+
+
+@dataclass
+class CaseOutcome:
+    name: str
+    ok: bool
+    n_points: int = 0
+    best_isp: float = float("nan")
+    best_of: float = float("nan")
+    seconds: float = 0.0
+    paths: Optional[dict] = None
+    error: str = ""
+
+
+# -----------------------
+# reading cases
+# -----------------------
+def _coerce(name: str, value, annotation):
+    if value is None or (isinstance(value, str) and value.strip() == ""):
+        return None
+
+    # bell_percent is annotated str but sizing divides it by 100
+    if name == "bell_percent":
+        m = re.search(r"\d+(\.\d+)?", str(value))
+        if not m:
+            raise ValueError(f"bell_percent must be numeric (got '{value}').")
+        pct = float(m.group(0))
+        return int(pct) if pct.is_integer() else pct
+
+    if get_origin(annotation) is Union:  # Optional[X]
+        annotation = next(a for a in get_args(annotation) if a is not type(None))
+
+    if annotation is bool:
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in _TRUE:
+            return True
+        if text in _FALSE:
+            return False
+        raise ValueError(f"{name} must be true/false (got '{value}').")
+    if annotation is int:
+        return int(float(value))
+    if annotation is float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{name} must be numeric (got '{value}').")
+    if name == "nozzle_type":
+        text = str(value).strip().lower()
+        return "bell" if "bell" in text else text
+    return str(value).strip()
+
+
+def case_from_mapping(data: dict, default_name: str) -> BatchCase:
+    data = dict(data)
+    name = str(data.pop("name", "") or default_name)
+
+    known = {f.name: f for f in fields(EngineInputs)}
+    unknown = sorted(set(data) - set(known))
+    if unknown:
+        raise ValueError(f"Case '{name}': unknown field(s) {unknown}.")
+
+    kwargs = {}
+    for fname, f in known.items():
+        value = _coerce(fname, data[fname], f.type) if fname in data else None
+        if value is not None:
+            kwargs[fname] = value
+        elif f.default is MISSING:
+            if fname != "bell_percent":  # only meaningful for bell nozzles
+                raise ValueError(f"Case '{name}': missing required field '{fname}'.")
+            kwargs[fname] = None
+
+    kwargs.setdefault("source", "batch")
+    return BatchCase(name=name, inputs=EngineInputs(**kwargs))
+
+
+def _load_records(path: Path) -> List[dict]:
+    suffix = path.suffix.lower()
+
+    if suffix == ".csv":
+        with path.open(newline="") as f:
+            return [dict(row) for row in csv.DictReader(f)]
+
+    text = path.read_text()
+    if suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("Reading YAML cases requires PyYAML (pip install pyyaml).")
+        data = yaml.safe_load(text)
+    elif suffix == ".json":
+        data = json.loads(text)
+    else:
+        raise ValueError(f"Unsupported case file type '{path.suffix}' (use .json, .yaml/.yml or .csv).")
+
+    # a single case, a list of cases, or {"defaults": {...}, "cases": [...]}
+    if isinstance(data, dict) and "cases" in data:
+        defaults = data.get("defaults") or {}
+        return [{**defaults, **case} for case in data["cases"]]
+    if isinstance(data, dict):
+        return [data]
+    if isinstance(data, list):
+        return data
+    raise ValueError(f"{path}: expected a case object or a list of cases.")
+
+
+def load_cases(paths: Sequence[Union[str, Path]]) -> List[BatchCase]:
+    cases: List[BatchCase] = []
+    for p in paths:
+        path = Path(p)
+        for i, record in enumerate(_load_records(path)):
+            cases.append(case_from_mapping(record, default_name=f"{path.stem}_{i + 1:03d}"))
+
+    # output folders are named after cases, so names must be unique
+    seen = {}
+    for case in cases:
+        n = seen.get(case.name, 0)
+        seen[case.name] = n + 1
+        if n:
+            case.name = f"{case.name}_{n + 1}"
+    return cases
+
+
+# -----------------------
+# running cases
+# -----------------------
+def run_case(case: BatchCase, out_dir: Union[str, Path], results_file: Optional[str] = None,
+             compression: Optional[str] = None, stream_chunk: Optional[int] = None) -> CaseOutcome:
+    # results_file (e.g. "results.parquet") also writes the full arrays with exportResults;
+    # stream_chunk writes the CSVs every that many O/F points instead of holding the whole sweep
+    from .engine_analysis import engine_design_run, engine_design_stream
+    from .exports import exportCEAResults, exportEngineData, exportEngineDataStream, exportResults
+
+    t0 = time.perf_counter()
+    case_dir = Path(out_dir) / case.name
+    best = {"n": 0, "isp": float("nan"), "of": float("nan")}
+
+    def track(results):
+        isp = np.atleast_1d(results.perf.Isp)
+        best["n"] += isp.size
+        if isp.size and not np.all(np.isnan(isp)):
+            i = int(np.nanargmax(isp))
+            if np.isnan(best["isp"]) or isp[i] > best["isp"]:
+                best["isp"] = float(isp[i])
+                best["of"] = float(np.atleast_1d(results.cea.OF_Ratio)[i])
+
+    try:
+        paths = {}
+        if stream_chunk:
+            chunks = engine_design_stream(case.inputs, chunk_size=stream_chunk)
+            paths.update(exportEngineDataStream(chunks, case.inputs, out_dir=str(case_dir), filename="engine_data.csv",
+                                                cea_filename="cea_results.csv", on_chunk=track))
+        else:
+            results = engine_design_run(case.inputs)
+            paths.update(exportCEAResults(results.cea, out_dir=str(case_dir), filename="cea_results.csv"))
+            paths.update(exportEngineData(results, case.inputs, out_dir=str(case_dir), filename="engine_data.csv"))
+            if results_file:
+                paths.update(exportResults(results, case.inputs, out_dir=str(case_dir), filename=results_file,
+                                           compression=compression))
+            track(results)
+    except Exception as e:
+        return CaseOutcome(name=case.name, ok=False, seconds=time.perf_counter() - t0, error=repr(e))
+
+    return CaseOutcome(
+        name=case.name,
+        ok=True,
+        n_points=best["n"],
+        best_isp=best["isp"],
+        best_of=best["of"],
+        seconds=time.perf_counter() - t0,
+        paths=paths,
+    )
+
+
+def _run_case_args(args: Tuple[BatchCase, str, Optional[str], Optional[str], Optional[int]]) -> CaseOutcome:
+    return run_case(*args)
+
+
+def run_batch(cases: Sequence[BatchCase], out_dir: Union[str, Path], jobs: int = 1, on_done=None,
+              results_file: Optional[str] = None, compression: Optional[str] = None,
+              stream_chunk: Optional[int] = None) -> List[CaseOutcome]:
+    """
+    Runs every case, optionally across `jobs` processes (<= 0 = all cores).
+    Outcomes are returned in input order; on_done(outcome) fires as each finishes.
+    """
+    import os
+
+    jobs = (os.cpu_count() or 1) if jobs <= 0 else jobs
+    jobs = min(jobs, len(cases)) if cases else 1
+    outcomes: List[Optional[CaseOutcome]] = [None] * len(cases)
+
+    if jobs <= 1:
+        for i, case in enumerate(cases):
+            outcomes[i] = run_case(case, out_dir, results_file, compression, stream_chunk)
+            if on_done is not None:
+                on_done(outcomes[i])
+        return outcomes
+
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=get_context("spawn")) as pool:
+        futures = {pool.submit(_run_case_args, (case, str(out_dir), results_file, compression, stream_chunk)): i for i, case in enumerate(cases)}
+        for fut in as_completed(futures):
+            i = futures[fut]
+            outcomes[i] = fut.result()
+            if on_done is not None:
+                on_done(outcomes[i])
+    return outcomes
+
+
+# -----------------------
+# command line
+# -----------------------
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="prompt-batch",
+        description="Run PROMPT engine design cases headlessly and export results as CSV.",
+    )
+    parser.add_argument("case_files", nargs="+", help="JSON, YAML or CSV files of EngineInputs cases (SI units: Pa, N, m, deg).")
+    parser.add_argument("-o", "--out-dir", default="results", help="output folder; each case gets a subfolder (default: results)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="cases to run in parallel (<= 0 = all cores, default 1)")
+    parser.add_argument("--no-cache", action="store_true", help="disable the persistent CEA cache for this run")
+    parser.add_argument("--results-format", choices=["npz", "parquet", "feather", "hdf5"],
+                        help="also write every result array to results.<ext> in this format (readable with loadResults)")
+    parser.add_argument("--compression", help="compression for --results-format, e.g. zstd (Parquet/Feather), gzip (HDF5); any value zips NPZ")
+    parser.add_argument("--stream", type=int, nargs="?", const=4096, metavar="CHUNK",
+                        help="write the CSVs CHUNK O/F points at a time (default 4096) so memory stays flat on huge sweeps")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only print failures and the summary")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.no_cache:
+        import os
+        os.environ["PROMPT_CEA_CACHE"] = "off"  # inherited by spawned workers too
+
+    try:
+        cases = load_cases(args.case_files)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    if not cases:
+        print("error: no cases found.", file=sys.stderr)
+        return 2
+
+    def report(o: CaseOutcome):
+        if not o.ok:
+            print(f"[FAIL] {o.name}: {o.error}", file=sys.stderr)
+        elif not args.quiet:
+            print(f"[ok]   {o.name}: {o.n_points} O/F point(s), best Isp {o.best_isp:.2f} s "
+                  f"at O/F {o.best_of:.3f} ({o.seconds:.2f} s)")
+
+    t0 = time.perf_counter()
+    results_file = None
+    if args.results_format and args.stream:
+        print("error: --results-format needs the whole sweep in memory; it can't be combined with --stream.", file=sys.stderr)
+        return 2
+    if args.results_format:
+        ext = {"npz": ".npz", "parquet": ".parquet", "feather": ".feather", "hdf5": ".h5"}[args.results_format]
+        results_file = "results" + ext
+
+    outcomes = run_batch(cases, args.out_dir, jobs=args.jobs, on_done=report,
+                         results_file=results_file, compression=args.compression, stream_chunk=args.stream)
+    failed = sum(1 for o in outcomes if not o.ok)
+
+    print(f"{len(outcomes) - failed}/{len(outcomes)} case(s) succeeded in {time.perf_counter() - t0:.2f} s; "
+          f"results in {Path(args.out_dir).resolve()}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
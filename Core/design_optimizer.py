@@ -0,0 +1,508 @@
+from __future__ import annotations
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .engine_inputs import EngineInputs
+from .design_sweep import NUMERIC_AXES, CEAMemo, evaluate_points
+
+# relative step (of each variable's range) designs are snapped to, so revisits hit the CEA memo
+DEFAULT_RESOLUTION = 1e-4
+
+
+def engine_length(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    # conical rows carry length_total; bell rows are chamber + convergent + bell section
+    n = columns["OF"].size
+    length = np.full(n, np.nan)
+    if "length_total" in columns:
+        length = np.where(np.isnan(length), columns["length_total"], length)
+    if "nozzle_length" in columns:
+        bell = columns["length_chamber"] + columns["length_convergent"] + columns["nozzle_length"]
+        length = np.where(np.isnan(length), bell, length)
+    return length
+
+
+def chamber_radius(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    n = columns["OF"].size
+    radius = np.full(n, np.nan)
+    for name in ("radius_chamber", "chamber_radius"):  # conical / bell field names
+        if name in columns:
+            radius = np.where(np.isnan(radius), columns[name], radius)
+    return radius
+
+
+# objective name -> (value from design columns, "max" or "min")
+OBJECTIVES: Dict[str, Tuple[Callable[[Dict[str, np.ndarray]], np.ndarray], str]] = {
+    "Isp": (lambda c: c["Isp"], "max"),
+    "Isp_per_length": (lambda c: c["Isp"] / engine_length(c), "max"),
+    "length": (engine_length, "min"),
+    "chamber_radius": (chamber_radius, "min"),
+    "c_star": (lambda c: c["c_star"], "max"),
+    "mdot": (lambda c: c["mdot"], "min"),
+}
+
+
+def design_value(columns: Dict[str, np.ndarray], name: str) -> np.ndarray:
+    # an OBJECTIVES entry or any design column, e.g. "Isp", "length", "ER", "p_exit"
+    if name in OBJECTIVES:
+        return np.asarray(OBJECTIVES[name][0](columns), dtype=float)
+    if name not in columns:
+        raise ValueError(f"Unknown design quantity '{name}'. Use an objective ({sorted(OBJECTIVES)}) or a design column.")
+    return np.asarray(columns[name], dtype=float)
+
+
+class DesignProblem:
+    """
+    Box-bounded design variables (numeric EngineInputs fields, as in
+    design_sweep) evaluated a population at a time.
+
+    Candidates are snapped to `resolution`; a design already evaluated is
+    looked up rather than re-run, and CEA states go through one CEAMemo for
+    the whole search, so only (Pc, O/F) pairs never seen before reach CEA.
+    history holds every distinct design in evaluation order.
+    """
+
+    def __init__(
+        self,
+        base: EngineInputs,
+        bounds: Dict[str, Tuple[float, float]],
+        constraints: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        resolution: Optional[Dict[str, float]] = None,
+        memo: Optional[CEAMemo] = None,
+    ):
+        if not bounds:
+            raise ValueError("Give at least one design variable in bounds.")
+        for name, (lo, hi) in bounds.items():
+            if name not in NUMERIC_AXES:
+                raise ValueError(f"'{name}' can't be optimized. Design variables: {list(NUMERIC_AXES)}")
+            if not lo < hi:
+                raise ValueError(f"Bounds for '{name}' must have lower < upper (got {lo}, {hi}).")
+        if "OF" not in bounds and base.OF is None:
+            raise ValueError("Either optimize 'OF' or set a single O/F on the base inputs.")
+
+        self.base = base
+        self.names: List[str] = list(bounds)
+        self.lower = np.array([float(bounds[k][0]) for k in self.names])
+        self.upper = np.array([float(bounds[k][1]) for k in self.names])
+
+        resolution = resolution or {}
+        self.step = np.array([
+            float(resolution.get(k, DEFAULT_RESOLUTION * (hi - lo)))
+            for k, lo, hi in zip(self.names, self.lower, self.upper)
+        ])
+        if np.any(self.step <= 0.0):
+            raise ValueError("resolution steps must be > 0.")
+
+        self.constraints = dict(constraints or {})
+        self.memo = memo if memo is not None else CEAMemo(workers=base.workers)
+        self.history: Dict[str, np.ndarray] = {}
+        self._index: Dict[bytes, int] = {}  # snapped design -> row in history
+
+    @property
+    def n_evaluations(self) -> int:
+        return len(self._index)
+
+    def snap(self, X: np.ndarray) -> np.ndarray:
+        X = np.clip(np.atleast_2d(np.asarray(X, dtype=float)), self.lower, self.upper)
+        return np.clip(self.lower + np.round((X - self.lower) / self.step) * self.step, self.lower, self.upper)
+
+    def evaluate(self, X: np.ndarray) -> Dict[str, np.ndarray]:
+        # X is (n_candidates, n_variables); returns design columns, one row per candidate
+        X = self.snap(X)
+        keys = [row.tobytes() for row in X]
+
+        new = {}
+        for k, row in zip(keys, X):
+            if k not in self._index:
+                new.setdefault(k, row)
+
+        if new:
+            rows = np.array(list(new.values()))
+            n = rows.shape[0]
+            points = {name: rows[:, j] for j, name in enumerate(self.names)}
+            if "OF" not in points:
+                points["OF"] = np.full(n, float(self.base.OF))
+            columns = evaluate_points(self.base, points, n, self.memo)
+
+            start = len(self._index)
+            for i, k in enumerate(new):
+                self._index[k] = start + i
+            if self.history:
+                columns = {name: np.concatenate([self.history[name], columns[name]]) for name in self.history}
+            self.history = columns
+
+        rows = np.fromiter((self._index[k] for k in keys), dtype=int, count=len(keys))
+        return {name: values[rows] for name, values in self.history.items()}
+
+    def violation(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        # summed relative distance outside every constraint; 0 = feasible, NaN designs count as infeasible
+        total = np.zeros(columns["OF"].size)
+        for name, (lo, hi) in self.constraints.items():
+            v = design_value(columns, name)
+            if lo is not None:
+                total += np.maximum(lo - v, 0.0) / max(abs(lo), 1e-12)
+            if hi is not None:
+                total += np.maximum(v - hi, 0.0) / max(abs(hi), 1e-12)
+            total[np.isnan(v)] = np.inf
+        return total
+
+    def costs(self, columns: Dict[str, np.ndarray], objectives) -> np.ndarray:
+        # (n_designs, n_objectives), every objective turned into "smaller is better"; NaN -> inf
+        F = np.column_stack([
+            (-1.0 if OBJECTIVES[name][1] == "max" else 1.0) * design_value(columns, name) for name in objectives
+        ])
+        return np.where(np.isnan(F), np.inf, F)
+
+    def inputs_at(self, x: np.ndarray) -> EngineInputs:
+        values = dict(zip(self.names, self.snap(x)[0].tolist()))
+        of = values.pop("OF", self.base.OF)
+        return replace(self.base, OF=of, OF_min=None, OF_max=None, OF_increment=None, **values)
+
+
+@dataclass
+class OptimizationResult:
+    inputs: EngineInputs                 # base inputs with the optimum filled in (single O/F)
+    x: Dict[str, float]                  # optimum design variables
+    objective: str
+    value: float                         # objective at the optimum
+    feasible: bool
+    design: Dict[str, float]             # every design column at the optimum
+    history: Dict[str, np.ndarray]       # every evaluated design, in evaluation order
+    n_evaluations: int
+    n_cea_states: int                    # unique CEA states solved for the whole search
+    n_generations: int
+    converged: bool
+    message: str = ""
+
+
+def optimize_design(
+    base: EngineInputs,
+    bounds: Dict[str, Tuple[float, float]],
+    objective: str = "Isp",
+    *,
+    constraints: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+    resolution: Optional[Dict[str, float]] = None,
+    popsize: int = 10,
+    max_generations: int = 60,
+    tol: float = 1e-6,
+    seed: Optional[int] = None,
+    eps: float = 40.0,
+    use_cache: bool = True,
+) -> OptimizationResult:
+    """
+    Maximizes (or minimizes, per OBJECTIVES) one objective over the numeric
+    EngineInputs fields in bounds, e.g.
+
+        optimize_design(base, {"OF": (1.5, 3.5), "chamber_pressure": (1e6, 6e6)},
+                        "length", constraints={"Isp": (280.0, None)})
+
+    constraints bound any objective or design column; infeasible designs
+    always rank below feasible ones. Anything not in bounds comes from base.
+
+    The search is differential evolution with each generation evaluated as
+    one vectorized batch (popsize * n_variables designs); with the CEA memo
+    and snapping to resolution, a run typically solves a few hundred CEA
+    states, about what one dense O/F sweep does.
+    """
+    from scipy.optimize import NonlinearConstraint, differential_evolution
+
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}'. Valid objectives: {sorted(OBJECTIVES)}")
+
+    problem = DesignProblem(base, bounds, constraints, resolution,
+                            CEAMemo(eps=eps, use_cache=use_cache, workers=base.workers))
+    fn, sense = OBJECTIVES[objective]
+    sign = -1.0 if sense == "max" else 1.0
+
+    def cost(X):
+        # scipy passes (n_variables, n_candidates) when vectorized
+        values = sign * np.asarray(fn(problem.evaluate(X.T)), dtype=float)
+        return np.where(np.isnan(values), np.inf, values)
+
+    kwargs = {}
+    if problem.constraints:
+        # scipy checks constraints first and ranks infeasible candidates by violation;
+        # cost() then finds those designs already evaluated
+        kwargs["constraints"] = NonlinearConstraint(
+            lambda X: problem.violation(problem.evaluate(np.atleast_2d(X.T)))[None, :], -np.inf, 0.0
+        )
+
+    res = differential_evolution(
+        cost,
+        bounds=list(zip(problem.lower, problem.upper)),
+        popsize=popsize,
+        maxiter=max_generations,
+        tol=tol,
+        seed=seed,
+        polish=False,
+        init="latinhypercube",
+        updating="deferred",
+        vectorized=True,
+        **kwargs,
+    )
+
+    best = problem.snap(res.x)
+    columns = problem.evaluate(best)
+    design = {k: (v[0].item() if isinstance(v[0], np.generic) else v[0]) for k, v in columns.items()}
+
+    return OptimizationResult(
+        inputs=problem.inputs_at(best),
+        x=dict(zip(problem.names, best[0].tolist())),
+        objective=objective,
+        value=float(design_value(columns, objective)[0]),
+        feasible=bool(problem.violation(columns)[0] == 0.0),
+        design=design,
+        history=problem.history,
+        n_evaluations=problem.n_evaluations,
+        n_cea_states=problem.memo.n_states,
+        n_generations=int(res.nit),
+        converged=bool(res.success),
+        message=str(res.message),
+    )
+
+
+# -----------------------
+# multi-objective (NSGA-II)
+# -----------------------
+@dataclass
+class ParetoResult:
+    objectives: Tuple[str, ...]
+    variables: Tuple[str, ...]
+    base: EngineInputs
+    front: Dict[str, np.ndarray]         # design columns of the non-dominated designs, by first objective
+    values: np.ndarray                   # (n_front, n_objectives) objective values on the front
+    history: Dict[str, np.ndarray]       # every evaluated design, in evaluation order
+    n_evaluations: int
+    n_cea_states: int
+    n_generations: int
+
+    @property
+    def size(self) -> int:
+        return int(self.values.shape[0])
+
+    def inputs_at(self, i: int) -> EngineInputs:
+        # base inputs with front design i filled in (single O/F)
+        values = {name: float(self.front[name][i]) for name in self.variables}
+        of = values.pop("OF", self.base.OF)
+        return replace(self.base, OF=of, OF_min=None, OF_max=None, OF_increment=None, **values)
+
+
+def _dominance(F: np.ndarray, cv: np.ndarray) -> np.ndarray:
+    """
+    D[i, j] = design i constrained-dominates design j (Deb): a feasible design
+    beats an infeasible one, of two infeasible ones the smaller violation
+    wins, and feasible designs compare by Pareto dominance.
+    """
+    le = np.all(F[:, None, :] <= F[None, :, :], axis=2)
+    lt = np.any(F[:, None, :] < F[None, :, :], axis=2)
+    feas = cv == 0.0
+    both = feas[:, None] & feas[None, :]
+    return (both & le & lt) | (feas[:, None] & ~feas[None, :]) | (~feas[:, None] & ~feas[None, :] & (cv[:, None] < cv[None, :]))
+
+
+def _front_ranks(F: np.ndarray, cv: np.ndarray) -> np.ndarray:
+    # 0 for the non-dominated front, 1 for the front behind it, ...
+    D = _dominance(F, cv)
+    rank = np.full(F.shape[0], -1)
+    left = np.ones(F.shape[0], dtype=bool)
+    r = 0
+    while left.any():
+        front = left & ~D[left].any(axis=0)  # not dominated by anything still unranked
+        rank[front] = r
+        left &= ~front
+        r += 1
+    return rank
+
+
+def _non_dominated(F: np.ndarray, block: int = 256, max_elems: int = 1 << 22) -> np.ndarray:
+    """
+    Mask of the Pareto non-dominated rows of F (minimizing every column),
+    without _dominance's N x N matrix. Rows are taken in lexicographic
+    order, where anything that dominates a row comes before it: with two
+    objectives a running minimum of the second settles it, otherwise each
+    block of rows is checked against the front found so far and itself.
+    Identical rows don't dominate each other, as in _front_ranks.
+    """
+    n, k = F.shape
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    order = np.lexsort(F.T[::-1])
+    Fs = F[order]
+
+    if k == 2:
+        # one entry per distinct row; dominated iff an earlier distinct row has f1 <= ours
+        start = np.ones(n, dtype=bool)
+        start[1:] = np.any(Fs[1:] != Fs[:-1], axis=1)
+        group = np.cumsum(start) - 1
+        f1 = Fs[start, 1]
+        best_before = np.concatenate([[np.inf], np.minimum.accumulate(f1)[:-1]])
+        keep[order] = ~(best_before <= f1)[group]
+        return keep
+
+    def dominated_by(A, B):
+        # rows of B dominated by any row of A, A in chunks so memory stays near max_elems
+        out = np.zeros(B.shape[0], dtype=bool)
+        step = max(1, max_elems // max(B.shape[0] * k, 1))
+        for s in range(0, A.shape[0], step):
+            a = A[s:s + step, None, :]
+            out |= np.any(np.all(a <= B[None], axis=2) & np.any(a < B[None], axis=2), axis=0)
+        return out
+
+    front = np.empty((0, k))
+    for s in range(0, n, block):
+        B = Fs[s:s + block]
+        dom = dominated_by(front, B) | dominated_by(B, B)
+        front = np.concatenate([front, B[~dom]])
+        keep[order[s:s + block][~dom]] = True
+    return keep
+
+
+def _first_front(F: np.ndarray, cv: np.ndarray) -> np.ndarray:
+    # indices with _front_ranks(F, cv) == 0: the non-dominated feasible designs, or if none is
+    # feasible the least-violating ones
+    feas = cv == 0.0
+    if not feas.any():
+        return np.flatnonzero(cv == cv.min())
+    idx = np.flatnonzero(feas)
+    return idx[_non_dominated(F[idx])]
+
+
+def _crowding(F: np.ndarray, rank: np.ndarray) -> np.ndarray:
+    # NSGA-II crowding distance within each front; boundary designs get inf
+    dist = np.zeros(F.shape[0])
+    for r in np.unique(rank):
+        idx = np.flatnonzero(rank == r)
+        if idx.size <= 2:
+            dist[idx] = np.inf
+            continue
+        for k in range(F.shape[1]):
+            f = F[idx, k]
+            order = np.argsort(f, kind="stable")
+            span = f[order[-1]] - f[order[0]]
+            dist[idx[order[[0, -1]]]] = np.inf
+            if np.isfinite(span) and span > 0:
+                dist[idx[order[1:-1]]] += (f[order[2:]] - f[order[:-2]]) / span
+    return dist
+
+
+def _variation(parents: np.ndarray, rng, eta_c: float = 15.0, eta_m: float = 20.0, p_cross: float = 0.9) -> np.ndarray:
+    # SBX crossover + polynomial mutation on [0, 1]-scaled variables, whole population at once
+    n, d = parents.shape
+    a, b = parents[0::2], parents[1::2]
+    m = min(a.shape[0], b.shape[0])
+    a, b = a[:m], b[:m]
+
+    u = rng.random((m, d))
+    beta = np.where(u <= 0.5, (2.0 * u) ** (1.0 / (eta_c + 1.0)), (0.5 / (1.0 - u)) ** (1.0 / (eta_c + 1.0)))
+    cross = (rng.random((m, 1)) < p_cross) & (rng.random((m, d)) < 0.5)
+    beta = np.where(cross, beta, 1.0)
+    c1 = 0.5 * ((1.0 + beta) * a + (1.0 - beta) * b)
+    c2 = 0.5 * ((1.0 - beta) * a + (1.0 + beta) * b)
+    children = np.concatenate([c1, c2, parents[2 * m:]])[:n]
+
+    u = rng.random(children.shape)
+    delta = np.where(u < 0.5, (2.0 * u) ** (1.0 / (eta_m + 1.0)) - 1.0, 1.0 - (2.0 * (1.0 - u)) ** (1.0 / (eta_m + 1.0)))
+    mutate = rng.random(children.shape) < 1.0 / d
+    return np.clip(children + np.where(mutate, delta, 0.0), 0.0, 1.0)
+
+
+def pareto_search(
+    base: EngineInputs,
+    bounds: Dict[str, Tuple[float, float]],
+    objectives: Tuple[str, ...] = ("Isp", "length"),
+    *,
+    constraints: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+    resolution: Optional[Dict[str, float]] = None,
+    pop_size: int = 40,
+    generations: int = 30,
+    seed: Optional[int] = None,
+    eps: float = 40.0,
+    use_cache: bool = True,
+    progress: Optional[Callable[[int, int], None]] = None,
+    cancel: Optional[Callable[[], bool]] = None,
+) -> ParetoResult:
+    """
+    NSGA-II search for the trade-off between several OBJECTIVES (e.g. Isp
+    against engine length or chamber radius) over the numeric EngineInputs
+    fields in bounds.
+
+    Each generation's offspring go through one vectorized engine_analysis +
+    sizing pass, and CEA states are shared through one CEAMemo, so designs
+    that only differ in non-CEA inputs never cost a CEA call. The returned
+    front is the non-dominated set of every design evaluated, not just the
+    last population. progress(generation, generations) is called after each
+    generation; cancel() is polled between them and stops the search early
+    with the front found so far.
+    """
+    objectives = tuple(objectives)
+    if len(objectives) < 2:
+        raise ValueError("A Pareto search needs at least two objectives.")
+    for name in objectives:
+        if name not in OBJECTIVES:
+            raise ValueError(f"Unknown objective '{name}'. Valid objectives: {sorted(OBJECTIVES)}")
+    if pop_size < 4:
+        raise ValueError("pop_size must be >= 4.")
+
+    problem = DesignProblem(base, bounds, constraints, resolution,
+                            CEAMemo(eps=eps, use_cache=use_cache, workers=base.workers))
+    rng = np.random.default_rng(seed)
+    span = problem.upper - problem.lower
+
+    def evaluate(U):
+        columns = problem.evaluate(problem.lower + U * span)
+        return problem.costs(columns, objectives), problem.violation(columns)
+
+    # Latin-hypercube start
+    d = len(problem.names)
+    U = (rng.permuted(np.tile(np.arange(pop_size), (d, 1)), axis=1).T + rng.random((pop_size, d))) / pop_size
+    F, cv = evaluate(U)
+    rank = _front_ranks(F, cv)
+    crowd = _crowding(F, rank)
+
+    done = 0
+    for gen in range(generations):
+        if cancel is not None and cancel():
+            break
+
+        # binary tournaments on (rank, -crowding)
+        i, j = rng.integers(pop_size, size=(2, pop_size))
+        better = (rank[i] < rank[j]) | ((rank[i] == rank[j]) & (crowd[i] > crowd[j]))
+        children = _variation(U[np.where(better, i, j)], rng)
+        Fc, cvc = evaluate(children)
+
+        # elitist survival from parents + children
+        U = np.concatenate([U, children])
+        F = np.concatenate([F, Fc])
+        cv = np.concatenate([cv, cvc])
+        rank = _front_ranks(F, cv)
+        crowd = _crowding(F, rank)
+        keep = np.lexsort((-crowd, rank))[:pop_size]
+        U, F, cv, rank, crowd = U[keep], F[keep], cv[keep], rank[keep], crowd[keep]
+
+        done = gen + 1
+        if progress is not None:
+            progress(done, generations)
+
+    # non-dominated set over everything evaluated; only the first front is needed, so this
+    # skips _front_ranks' N x N dominance matrix (history can run to 100k+ designs)
+    history = problem.history
+    F_all = problem.costs(history, objectives)
+    cv_all = problem.violation(history)
+    front = _first_front(F_all, cv_all)
+    values = np.column_stack([design_value(history, name)[front] for name in objectives])
+    order = np.argsort(values[:, 0], kind="stable")
+    front, values = front[order], values[order]
+
+    return ParetoResult(
+        objectives=objectives,
+        variables=tuple(problem.names),
+        base=base,
+        front={name: v[front] for name, v in history.items()},
+        values=values,
+        history=history,
+        n_evaluations=problem.n_evaluations,
+        n_cea_states=problem.memo.n_states,
+        n_generations=done,
+    )
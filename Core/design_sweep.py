@@ -0,0 +1,306 @@
+from __future__ import annotations
+from dataclasses import dataclass, field, fields, replace
+from numbers import Real
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .engine_inputs import EngineInputs
+from .nozzle_pipeline import engine_analysis, conical_nozzle_sizing, bell_nozzle_sizing
+from CEA.CEA_Outputs import CEAOutputs
+from CEA.CEARunner import cea_batch, of_grid
+
+
+# axes that only feed the isentropic/sizing math; these never trigger extra CEA work
+NUMERIC_AXES = (
+    "OF", "chamber_pressure", "thrust", "ambient_pressure", "expansion_ratio",
+    "convergent_angle", "divergent_angle", "contraction_ratio", "throat_ratio", "l_star",
+)
+
+# axes that change which CEA problem / sizing routine is used; points are grouped on these
+CATEGORICAL_AXES = ("propellants", "oxidizer_name", "fuel_name", "frozen_flag", "nozzle_type", "bell_percent")
+
+
+@dataclass
+class SweepResult:
+    axes: Dict[str, np.ndarray]                # requested axis values, in axis order
+    columns: Dict[str, np.ndarray]             # one entry per design point
+    method: str = "grid"
+    n_cea_states: int = 0                      # unique thermochemical states actually evaluated
+    shape: Tuple[int, ...] = field(default_factory=tuple)
+
+    @property
+    def n_points(self) -> int:
+        return int(next(iter(self.columns.values())).size) if self.columns else 0
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def grid(self, name: str) -> np.ndarray:
+        # column reshaped onto the Cartesian axes (axis order = order given to design_sweep)
+        if self.method != "grid":
+            raise ValueError("grid() is only available for Cartesian sweeps.")
+        return self.columns[name].reshape(self.shape)
+
+    def to_dataframe(self):
+        import pandas as pd
+        return pd.DataFrame(self.columns)
+
+    def to_xarray(self):
+        import xarray as xr
+
+        if self.method != "grid":
+            return xr.Dataset({k: ("point", v) for k, v in self.columns.items()})
+
+        dims = list(self.axes)
+        coords = {k: _axis_coord(v) for k, v in self.axes.items()}
+        data = {k: (dims, v.reshape(self.shape)) for k, v in self.columns.items() if k not in self.axes}
+        return xr.Dataset(data, coords=coords)
+
+
+def _axis_coord(values: np.ndarray) -> np.ndarray:
+    if values.dtype == object:
+        return np.array(["/".join(v) if isinstance(v, tuple) else str(v) for v in values])
+    return values
+
+
+def _is_numeric(values) -> bool:
+    return all(isinstance(v, Real) and not isinstance(v, bool) for v in values)
+
+
+def _normalize_axes(base: EngineInputs, axes: Dict[str, Sequence]) -> Dict[str, np.ndarray]:
+    known = set(NUMERIC_AXES) | set(CATEGORICAL_AXES)
+    out: Dict[str, np.ndarray] = {}
+
+    for name, values in axes.items():
+        if name not in known:
+            raise ValueError(f"Unknown sweep axis '{name}'. Valid axes: {sorted(known)}")
+
+        values = list(np.atleast_1d(values)) if not isinstance(values, (list, tuple)) else list(values)
+        if not values:
+            raise ValueError(f"Sweep axis '{name}' is empty.")
+
+        if name in NUMERIC_AXES:
+            if not _is_numeric(values):
+                raise ValueError(f"Sweep axis '{name}' must be numeric.")
+            out[name] = np.asarray(values, dtype=float)
+        else:
+            if name == "propellants":
+                values = [tuple(v) for v in values]
+                if any(len(v) != 2 for v in values):
+                    raise ValueError("'propellants' entries must be (oxidizer, fuel) pairs.")
+            arr = np.empty(len(values), dtype=object)
+            arr[:] = values
+            out[name] = arr
+
+    if "propellants" in out and ("oxidizer_name" in out or "fuel_name" in out):
+        raise ValueError("Use either 'propellants' or 'oxidizer_name'/'fuel_name' axes, not both.")
+
+    # the base inputs' own O/F mode (single or sweep) becomes the O/F axis if none was given
+    if "OF" not in out:
+        out["OF"] = of_grid(base).astype(float)
+
+    return out
+
+
+def _cartesian_points(axes: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    shape = tuple(v.size for v in axes.values())
+    index = np.indices(shape).reshape(len(shape), -1)
+    return {name: values[index[i]] for i, (name, values) in enumerate(axes.items())}
+
+
+def _latin_hypercube_points(axes: Dict[str, np.ndarray], n_samples: int, seed: Optional[int]) -> Dict[str, np.ndarray]:
+    # numeric axes are treated as [min, max] ranges, categorical axes as uniform choices
+    rng = np.random.default_rng(seed)
+    points = {}
+    for name, values in axes.items():
+        u = (rng.permutation(n_samples) + rng.random(n_samples)) / n_samples
+        if values.dtype == object:
+            points[name] = values[np.minimum((u * values.size).astype(int), values.size - 1)]
+        else:
+            lo, hi = float(np.min(values)), float(np.max(values))
+            points[name] = lo + u * (hi - lo)
+    return points
+
+
+def _group_keys(base: EngineInputs, points: Dict[str, np.ndarray], n: int) -> List[Tuple]:
+    def col(name, default):
+        return points[name] if name in points else [default] * n
+
+    if "propellants" in points:
+        ox = [p[0] for p in points["propellants"]]
+        fuel = [p[1] for p in points["propellants"]]
+    else:
+        ox = col("oxidizer_name", base.oxidizer_name)
+        fuel = col("fuel_name", base.fuel_name)
+
+    return list(zip(
+        ox, fuel,
+        col("frozen_flag", base.frozen_flag),
+        col("nozzle_type", base.nozzle_type),
+        col("bell_percent", base.bell_percent),
+    ))
+
+
+def _groups(keys: List[Tuple]) -> Dict[Tuple, np.ndarray]:
+    groups: Dict[Tuple, List[int]] = {}
+    for i, k in enumerate(keys):
+        groups.setdefault(k, []).append(i)
+    return {k: np.asarray(v, dtype=int) for k, v in groups.items()}
+
+
+def _dataclass_columns(obj, n: int) -> Dict[str, np.ndarray]:
+    return {f.name: np.broadcast_to(np.asarray(getattr(obj, f.name), dtype=float), (n,)) for f in fields(obj)}
+
+
+class CEAMemo:
+    """
+    In-process memo of chamber states keyed by (oxidizer, fuel, frozen, Pc,
+    O/F), shared by every evaluate_points call it is passed to. Only states
+    it hasn't seen go to cea_batch, so an optimizer revisiting the same
+    (Pc, O/F) across iterations never re-solves them.
+    """
+
+    def __init__(self, eps: float = 40.0, use_cache: bool = True, workers: int = 1):
+        self.eps = eps
+        self.use_cache = use_cache
+        self.workers = workers
+        self._states: Dict[Tuple, Tuple[float, ...]] = {}
+        self.hits = 0
+
+    @property
+    def n_states(self) -> int:
+        return len(self._states)
+
+    def lookup(self, ox: str, fuel: str, frozen: bool, pc_bar: np.ndarray, of_values: np.ndarray) -> Dict[str, np.ndarray]:
+        # CEAOutputs fields for each (pc_bar[i], of_values[i]); each unique state is solved at most once
+        states, inverse = np.unique(np.column_stack([pc_bar, of_values]), axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+
+        keys = [(ox, fuel, bool(frozen), pc, of) for pc, of in states.tolist()]
+        new = [i for i, k in enumerate(keys) if k not in self._states]
+        self.hits += len(keys) - len(new)
+
+        if new:
+            cea = cea_batch(ox, fuel, states[new, 0], states[new, 1], eps=self.eps, frozen=frozen,
+                            use_cache=self.use_cache, workers=self.workers)
+            solved = np.column_stack([np.broadcast_to(getattr(cea, f.name), len(new)) for f in fields(CEAOutputs)])
+            for i, row in zip(new, solved.tolist()):
+                self._states[keys[i]] = tuple(row)
+
+        table = np.array([self._states[k] for k in keys], dtype=float).reshape(len(keys), -1)
+        return {f.name: table[inverse, j] for j, f in enumerate(fields(CEAOutputs))}
+
+
+def evaluate_points(base: EngineInputs, points: Dict[str, np.ndarray], n: int, memo: CEAMemo) -> Dict[str, np.ndarray]:
+    """
+    Designs n explicit points: points maps axis names (as in design_sweep,
+    "OF" required) to one value per point, anything else comes from base.
+    Returns one column per input and output, like SweepResult.columns.
+    """
+    # per-point numeric inputs (Pa, N, deg, ...) broadcast from base where not swept
+    numeric = {
+        name: (points[name] if name in points else np.full(n, float(getattr(base, name))))
+        for name in NUMERIC_AXES if name != "OF" and (name in points or getattr(base, name) is not None)
+    }
+    of_values = points["OF"]
+
+    keys = _group_keys(base, points, n)
+    pc_bar = numeric["chamber_pressure"] / 1e5  # Pa -> bar
+
+    # CEA only sees (oxidizer, fuel, frozen, Pc, O/F); thrust, L*, angles, nozzle type etc. reuse states
+    cea_cols = {f.name: np.empty(n, dtype=float) for f in fields(CEAOutputs)}
+    for (ox, fuel, frozen), idx in _groups([k[:3] for k in keys]).items():
+        for name, values in memo.lookup(ox, fuel, frozen, pc_bar[idx], of_values[idx]).items():
+            cea_cols[name][idx] = values
+
+    columns: Dict[str, np.ndarray] = {}
+
+    def put(name, idx, values, dtype=float):
+        if name not in columns:
+            columns[name] = np.full(n, np.nan) if dtype is float else np.empty(n, dtype=object)
+        columns[name][idx] = values
+
+    # one vectorized isentropic + sizing pass per propellant/nozzle group
+    for (ox, fuel, frozen, nozzle_type, bell_percent), idx in _groups(keys).items():
+        cea = CEAOutputs(**{name: arr[idx] for name, arr in cea_cols.items()})
+
+        group_in = replace(
+            base,
+            oxidizer_name=ox, fuel_name=fuel, frozen_flag=frozen,
+            nozzle_type=nozzle_type, bell_percent=bell_percent,
+            OF=None, OF_min=None, OF_max=None, OF_increment=None,
+            **{name: numeric[name][idx] for name in numeric},
+        )
+
+        perf = engine_analysis(group_in, cea)
+        if nozzle_type == "bell":
+            nozzle = bell_nozzle_sizing(perf, group_in)
+        else:
+            nozzle = conical_nozzle_sizing(perf, group_in)
+
+        put("oxidizer_name", idx, ox, object)
+        put("fuel_name", idx, fuel, object)
+        put("frozen_flag", idx, bool(frozen), object)
+        put("nozzle_type", idx, nozzle_type, object)
+        put("bell_percent", idx, bell_percent, object)
+        for name in numeric:
+            put(name, idx, numeric[name][idx])
+
+        m = idx.size
+        for name, values in {**_dataclass_columns(cea, m), **_dataclass_columns(perf, m),
+                             **_dataclass_columns(nozzle, m)}.items():
+            if name in numeric:
+                continue  # e.g. conical angles echo the inputs
+            put(name, idx, values)
+
+    if "propellants" in points:
+        columns["propellants"] = points["propellants"]
+    columns["OF"] = of_values
+    return columns
+
+
+def design_sweep(
+    base: EngineInputs,
+    axes: Dict[str, Sequence],
+    *,
+    method: str = "grid",
+    n_samples: Optional[int] = None,
+    seed: Optional[int] = None,
+    eps: float = 40.0,
+    use_cache: bool = True,
+    workers: Optional[int] = None,
+) -> SweepResult:
+    """
+    Runs engine_design_run over an N-dimensional design space.
+
+    axes maps EngineInputs field names (plus 'propellants' for (ox, fuel)
+    pairs) to the values to sweep; any field not given is taken from base.
+    method='grid' evaluates the Cartesian product, method='lhs' draws
+    n_samples Latin-hypercube points over the axis ranges.
+
+    CEA is only evaluated once per unique (oxidizer, fuel, frozen, Pc, O/F)
+    state; everything downstream runs as one vectorized pass per
+    propellant/nozzle group.
+    """
+    axes_n = _normalize_axes(base, axes)
+
+    if method == "grid":
+        points = _cartesian_points(axes_n)
+        shape = tuple(v.size for v in axes_n.values())
+    elif method == "lhs":
+        if not n_samples or n_samples <= 0:
+            raise ValueError("Latin-hypercube sweeps require n_samples > 0.")
+        points = _latin_hypercube_points(axes_n, int(n_samples), seed)
+        shape = (int(n_samples),)
+    else:
+        raise ValueError(f"Unknown sweep method '{method}' (expected 'grid' or 'lhs').")
+
+    n = int(np.prod(shape))
+    if workers is None:
+        workers = base.workers
+
+    memo = CEAMemo(eps=eps, use_cache=use_cache, workers=workers)
+    columns = evaluate_points(base, points, n, memo)
+
+    return SweepResult(axes=axes_n, columns=columns, method=method, n_cea_states=memo.n_states, shape=shape)
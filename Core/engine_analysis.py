@@ -1,11 +1,15 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Union
+from contextlib import nullcontext
+from dataclasses import dataclass, field, fields
+from typing import Callable, Iterator, Optional, Union
+
+import numpy as np
 
 from .engine_inputs import EngineInputs
 from .nozzle_pipeline import engine_analysis, bell_nozzle_sizing, conical_nozzle_sizing, EngineDesignResult, ConicalNozzleGeometry, BellNozzleGeometry
 from CEA.CEA_Outputs import CEAOutputs
-from CEA.CEARunner import CEArun
+from CEA.CEARunner import CEArun, CEArun_iter
+from .profiling import Profiler, merge_profiles, profile_stage, profiling_enabled
 
 
 @dataclass
@@ -13,18 +17,150 @@ class FullDesignResult:
     cea: CEAOutputs
     perf: EngineDesignResult
     nozzle: Union[ConicalNozzleGeometry, BellNozzleGeometry]
+    # per-stage {"calls", "wall_s", "peak_mb"} when the run was profiled, else None
+    profile: Optional[dict] = field(default=None, repr=False, compare=False)
+
+
+def _design_from_cea(inputs: EngineInputs, cea: CEAOutputs) -> FullDesignResult:
+    with profile_stage("isentropic"):
+        perf = engine_analysis(inputs, cea)  # returns arrays in EngineDesignResult
+    if inputs.expansion_ratio is not None and np.all(np.isnan(perf.Isp)):
+        raise ValueError(
+            f"Expansion ratio {inputs.expansion_ratio:g} over-expands the nozzle so far at this ambient "
+            "pressure that it makes no net thrust; lower it or the ambient pressure."
+        )
+
+    with profile_stage("geometry"):
+        if inputs.nozzle_type == "bell":
+            nozzle = bell_nozzle_sizing(perf, inputs)
+        else:
+            nozzle = conical_nozzle_sizing(perf, inputs)
+
+    return FullDesignResult(cea=cea, perf=perf, nozzle=nozzle)
+
+
+def engine_design_run(
+    inputs: EngineInputs,
+    progress: Optional[Callable[[int, int], None]] = None,
+    cancel: Optional[Callable[[], bool]] = None,
+    profile: Optional[bool] = None,
+) -> FullDesignResult:
+    # progress/cancel are forwarded to CEArun (the only slow stage)
+    # profile=None follows profiling_enabled(); stage timings land on result.profile
+    if profile is None:
+        profile = profiling_enabled()
+
+    prof = Profiler() if profile else None
+    with (prof or nullcontext()):
+        with profile_stage("cea"):
+            cea = CEArun(inputs, progress=progress, cancel=cancel)
+        if cea is None:
+            raise ValueError("CEA returned no results.")
+
+        result = _design_from_cea(inputs, cea)
+
+    if prof is not None:
+        result.profile = prof.as_dict()
+    return result
+
+
+def engine_design_stream(
+    inputs: EngineInputs,
+    chunk_size: int = 64,
+    cancel: Optional[Callable[[], bool]] = None,
+    profile: Optional[bool] = None,
+) -> Iterator[FullDesignResult]:
+    # same pipeline as engine_design_run, yielded chunk by chunk (first chunk = one O/F point);
+    # each chunk carries its own profile and ResultBuffer adds them up
+    if profile is None:
+        profile = profiling_enabled()
+
+    chunks = CEArun_iter(inputs, chunk_size=chunk_size, cancel=cancel)
+    while True:
+        prof = Profiler() if profile else None
+        # the profiler is only active while this generator is running, never across a yield
+        with (prof or nullcontext()):
+            with profile_stage("cea"):
+                cea = next(chunks, None)
+            if cea is None:
+                return
+            result = _design_from_cea(inputs, cea)
+        if prof is not None:
+            result.profile = prof.as_dict()
+        yield result
+
+
+class ResultBuffer:
+    """
+    Collects streamed chunks into arrays preallocated for `capacity` points,
+    so each append copies only the new rows. result() returns views of the
+    rows filled so far; they stay valid (and unchanged) as later chunks come
+    in, even if the buffer has to grow.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(int(capacity), 1)
+        self.size = 0
+        self._arrays = None    # {part: {field: array or per-design scalar}}
+        self._types = None
+        self._profiles = []
+
+    def _allocate(self, chunk: FullDesignResult, capacity: int):
+        arrays = {}
+        for part in ("cea", "perf", "nozzle"):
+            obj = getattr(chunk, part)
+            arrays[part] = {}
+            for f in fields(obj):
+                v = getattr(obj, f.name)
+                if np.ndim(v) == 0:
+                    arrays[part][f.name] = v
+                else:
+                    v = np.atleast_1d(v)
+                    arrays[part][f.name] = np.empty((capacity,) + v.shape[1:], dtype=v.dtype)
+        return arrays
+
+    def _grow(self, needed: int):
+        capacity = max(needed, 2 * self.capacity)
+        for part in self._arrays.values():
+            for name, old in part.items():
+                if isinstance(old, np.ndarray):
+                    new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+                    new[:self.size] = old[:self.size]
+                    part[name] = new
+        self.capacity = capacity
 
+    def append(self, chunk: FullDesignResult) -> FullDesignResult:
+        n = np.atleast_1d(chunk.cea.OF_Ratio).size
+        if self._arrays is None:
+            self._arrays = self._allocate(chunk, max(self.capacity, n))
+            self._types = {part: type(getattr(chunk, part)) for part in self._arrays}
+            self.capacity = max(self.capacity, n)
+        elif self.size + n > self.capacity:
+            self._grow(self.size + n)
 
-def engine_design_run(inputs: EngineInputs) -> FullDesignResult:
-    cea = CEArun(inputs)  
-    if cea is None:
-        raise ValueError("CEA returned no results.")
+        stop = self.size + n
+        for part, arrays in self._arrays.items():
+            obj = getattr(chunk, part)
+            for name, buf in arrays.items():
+                if isinstance(buf, np.ndarray):
+                    buf[self.size:stop] = np.atleast_1d(getattr(obj, name))
+        self.size = stop
+        self._profiles.append(chunk.profile)
+        return self.result()
 
-    perf = engine_analysis(inputs, cea)  # returns arrays in EngineDesignResult
+    def result(self) -> FullDesignResult:
+        if self._arrays is None:
+            raise ValueError("No results appended yet.")
 
-    if inputs.nozzle_type == "bell":
-        nozzle = bell_nozzle_sizing(perf, inputs)
-    else:
-        nozzle = conical_nozzle_sizing(perf, inputs)
+        def view(part):
+            return self._types[part](**{
+                name: v[:self.size] if isinstance(v, np.ndarray) else v
+                for name, v in self._arrays[part].items()
+            })
 
-    return FullDesignResult(cea=cea, perf=perf, nozzle=nozzle)
\ No newline at end of file
+        return FullDesignResult(
+            cea=view("cea"),
+            perf=view("perf"),
+            nozzle=view("nozzle"),
+            profile=merge_profiles(self._profiles),
+        )
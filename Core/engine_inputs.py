@@ -24,6 +24,9 @@ class EngineInputs:
     external_pressure_flag: bool = False
     ambient_pressure: float = 101325.0   # Pa
 
+    # fixed expansion ratio Ae/At; None sizes the nozzle so p_exit = ambient_pressure
+    expansion_ratio: Optional[float] = None
+
     # frozen vs equilibrium
     frozen_flag: bool = False
 
@@ -35,4 +38,7 @@ class EngineInputs:
     OF_max: Optional[float] = None
     OF_increment: Optional[float] = None
 
+    # CEA process-pool size (1 = serial, <= 0 = all cores)
+    workers: int = 1
+
     source: str = "GUI"
\ No newline at end of file
@@ -1,19 +1,25 @@
+from __future__ import annotations
 from pathlib import Path
-from CEA.CEA_Outputs import CEAOutputs
-from Core.engine_analysis import FullDesignResult
-import pandas as pd
+from typing import TYPE_CHECKING
 import numpy as np
-import pandas as pd
-from pathlib import Path
 
-def exportCEAResults(cea: CEAOutputs, out_dir: str, filename: str = "cea_results.csv") -> dict[str, str]:
-    out_dir = Path(out_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
+if TYPE_CHECKING:
+    from CEA.CEA_Outputs import CEAOutputs
+    from Core.engine_analysis import FullDesignResult
 
-    if not filename.lower().endswith(".csv"):
-        filename += ".csv"
+# pandas is imported inside each export so importing this module stays cheap
+
+# column order of _cea_columns / _engine_columns, so a streamed CSV can have its header before any rows
+CEA_COLUMNS = ('OF', 'P_chamber(Bar)', 'T_chamber(K)', 'gamma', 'density(kg/m^3)', 'mw(kg/mol)')
+ENGINE_COLUMNS = (
+    "OF", "Density", "Gamma", "P_chamber (Pa)", "T_chamber(K)", "MW (g/mol)", "Mach_exit", "T_throat(K)",
+    "T_exit(K)", "v_exit(m/s)", "ER", "mdot(kg/s)", "At(m^2)", "Ae(m^2)", "Isp(s)", "cstar(m/s)", "nozzle_type",
+    "Rc(m)", "Rt(m)", "Re(m)", "L_chamber(m)", "L_convergent(m)", "L_throat(m)", "L_divergent(m)", "L_total(m)",
+    "divergent_angle(deg)", "theta_n(deg)", "theta_e(deg)", "bell_percent", "L_nozzle(m)", "Ac(m^2)",
+)
 
-    CEAResults = {
+def _cea_columns(cea: CEAOutputs) -> dict:
+    columns = {
         'OF': cea.OF_Ratio,
         'P_chamber(Bar)': cea.p_chamber,
         'T_chamber(K)': cea.T_chamber,
@@ -23,25 +29,28 @@ def exportCEAResults(cea: CEAOutputs, out_dir: str, filename: str = "cea_results
     }
 
     n = len(cea.OF_Ratio)
-    assert all(len(v) == n for v in CEAResults.values()), "CEA array length mismatch"
+    assert all(len(v) == n for v in columns.values()), "CEA array length mismatch"
+    return columns
 
-    df = pd.DataFrame(CEAResults)
 
-    path = out_dir / filename
+def exportCEAResults(cea: CEAOutputs, out_dir: str, filename: str = "cea_results.csv") -> dict[str, str]:
+    import pandas as pd
 
-    for col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="raise")
-    
-    df.to_csv(path, index = False, float_format="%.8g")
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
 
-    return {"CEA": str(path)}
+    if not filename.lower().endswith(".csv"):
+        filename += ".csv"
 
+    df = pd.DataFrame(_cea_columns(cea))
 
+    path = out_dir / filename
+    df.to_csv(path, index = False, float_format="%.8g")
+
+    return {"CEA": str(path)}
 
-def exportEngineData(results: FullDesignResult, inputs, out_dir: str, filename="engine_data.csv"):
-    out_dir = Path(out_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
 
+def _engine_columns(results: FullDesignResult, inputs) -> dict:
     OF = np.asarray(results.cea.OF_Ratio)
     n = OF.size
     nan = np.full(n, np.nan)
@@ -109,13 +118,109 @@ def exportEngineData(results: FullDesignResult, inputs, out_dir: str, filename="
             "Ac(m^2)": noz.chamber_area,
         })
 
-    df = pd.DataFrame(df)
+    return df
+
+
+def exportEngineData(results: FullDesignResult, inputs, out_dir: str, filename="engine_data.csv"):
+    import pandas as pd
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    df = pd.DataFrame(_engine_columns(results, inputs))
     path = out_dir / filename
     df.to_csv(path, index=False, float_format="%.8g")
     return {"engine": str(path)}
 
+
+class CSVStreamWriter:
+    """
+    Appends blocks of rows to one CSV as they are produced, so memory stays
+    at one block however long the sweep is. Each write() takes a
+    {column: array} dict. With `columns` the header is written straight
+    away, so a stream that yields nothing still leaves a valid (header-only)
+    CSV; otherwise the header comes from the first block, and a file that
+    never got one is removed on close. Every block must have the header's
+    columns. The file is the same as writing all the rows at once.
+    exportEngineDataStream drives one of these per file.
+    """
+
+    def __init__(self, out_dir: str, filename: str, columns=None):
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        if not filename.lower().endswith(".csv"):
+            filename += ".csv"
+
+        self.path = out_dir / filename
+        self.rows = 0
+        self._columns = None
+        self._file = open(self.path, "w", newline="")
+        if columns is not None:
+            import pandas as pd
+
+            self._columns = list(columns)
+            pd.DataFrame(columns=self._columns).to_csv(self._file, index=False)
+
+    def write(self, columns: dict):
+        import pandas as pd
+
+        if self._columns is None:
+            self._columns = list(columns)
+        elif list(columns) != self._columns:
+            raise ValueError(f"Block columns {list(columns)} don't match the CSV header {self._columns}.")
+
+        df = pd.DataFrame(columns)
+        df.to_csv(self._file, index=False, header=self._file.tell() == 0, float_format="%.8g")
+        self.rows += len(df)
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.close()
+        if self._columns is None:
+            self.path.unlink(missing_ok=True)  # no header, no rows: not a CSV
+
+    def __enter__(self) -> "CSVStreamWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def exportEngineDataStream(chunks, inputs, out_dir: str, filename: str = "engine_data.csv",
+                           cea_filename: str | None = None, on_chunk=None) -> dict[str, str]:
+    """
+    exportEngineData for a sweep that is still running: chunks is an iterable
+    of FullDesignResult slices (e.g. engine_design_stream(inputs)), and each
+    one is written as it arrives and then dropped. cea_filename also streams
+    the exportCEAResults columns. on_chunk(chunk) is called after each write,
+    for callers that want to keep running totals. The headers are written
+    up front, so a stream with no chunks gives header-only files.
+    """
+    engine = CSVStreamWriter(out_dir, filename, columns=ENGINE_COLUMNS)
+    cea = CSVStreamWriter(out_dir, cea_filename, columns=CEA_COLUMNS) if cea_filename else None
+    try:
+        for chunk in chunks:
+            engine.write(_engine_columns(chunk, inputs))
+            if cea is not None:
+                cea.write(_cea_columns(chunk.cea))
+            if on_chunk is not None:
+                on_chunk(chunk)
+    finally:
+        engine.close()
+        if cea is not None:
+            cea.close()
+
+    paths = {"engine": str(engine.path)}
+    if cea is not None:
+        paths["CEA"] = str(cea.path)
+    return paths
+
     
 def exportNozzleDatapoints(x, y, out_dir: str, filename: str = "cea_results.csv") -> dict[str, str]:
+    import pandas as pd
+
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -136,4 +241,236 @@ def exportNozzleDatapoints(x, y, out_dir: str, filename: str = "cea_results.csv"
     path = out_dir / filename
     df.to_csv(path, index=False, float_format="%.8g")
 
-    return {"nozzle": str(path)}
\ No newline at end of file
+    return {"nozzle": str(path)}
+
+def exportNozzleContours(x, y, of, out_dir: str, filename: str = "nozzle_contours.csv") -> dict[str, str]:
+    # (n_OF, n_points) contours from *_nozzle_contours, written long-format: one row per point
+    import pandas as pd
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if not filename.lower().endswith(".csv"):
+        filename += ".csv"
+
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    y = np.atleast_2d(np.asarray(y, dtype=float))
+    of = np.atleast_1d(np.asarray(of, dtype=float))
+
+    if x.shape != y.shape:
+        raise ValueError(f"x and y shape mismatch: {x.shape} vs {y.shape}")
+    if of.size != x.shape[0]:
+        raise ValueError(f"Expected one O/F per contour: {of.size} vs {x.shape[0]}")
+
+    n_of, n_pts = x.shape
+    df = pd.DataFrame({
+        "OF": np.repeat(of, n_pts),
+        "point": np.tile(np.arange(n_pts), n_of),
+        "x_m": x.ravel(),
+        "y_m": y.ravel(),
+    })
+
+    path = out_dir / filename
+    df.to_csv(path, index=False, float_format="%.8g")
+
+    return {"nozzle_contours": str(path)}
+
+
+# -----------------------
+# binary result files
+# -----------------------
+# every array field of results.cea / .perf / .nozzle is stored as a float64
+# column named "<group>.<field>" (e.g. "perf.Isp"), so nothing is formatted or
+# rounded and loadResults can rebuild the dataclasses exactly. Scalar fields
+# (the conical angles) are stored broadcast to the sweep length.
+RESULT_FORMATS = {
+    ".npz": "npz",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+    ".h5": "hdf5",
+    ".hdf5": "hdf5",
+}
+
+_RESULTS_SCHEMA = 1
+_META_KEY = "prompt"
+
+
+def _result_format(path: Path) -> str:
+    fmt = RESULT_FORMATS.get(path.suffix.lower())
+    if fmt is None:
+        known = ", ".join(RESULT_FORMATS)
+        raise ValueError(f"Unknown results format '{path.suffix}' (expected one of {known}).")
+    return fmt
+
+
+def _needs(module: str, fmt: str, pip_name: str):
+    import importlib
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ValueError(f"{fmt} results files require {pip_name} (pip install {pip_name}).")
+
+
+def _result_columns(results: FullDesignResult) -> tuple[dict[str, np.ndarray], list[str]]:
+    from dataclasses import fields
+
+    n = np.atleast_1d(results.cea.OF_Ratio).size
+    columns, scalars = {}, []
+    for group in ("cea", "perf", "nozzle"):
+        obj = getattr(results, group)
+        for f in fields(obj):
+            name = f"{group}.{f.name}"
+            value = np.asarray(getattr(obj, f.name), dtype=np.float64)
+            if value.ndim == 0:
+                scalars.append(name)
+                value = np.full(n, value)
+            elif value.shape != (n,):
+                raise ValueError(f"{name} has shape {value.shape}, expected ({n},).")
+            columns[name] = value
+    return columns, scalars
+
+
+def exportResults(results: FullDesignResult, inputs=None, out_dir: str = ".", filename: str = "results.npz",
+                  compression: str | None = None) -> dict[str, str]:
+    """
+    Writes the full result set to one binary file, picked by the filename's
+    extension: .npz, .parquet, .feather/.arrow or .h5/.hdf5. The arrays are
+    written as they are (float64, no CSV formatting) together with the
+    inputs, so loadResults gives back the same FullDesignResult.
+
+    compression is passed to the writer: Parquet takes e.g. "zstd", "snappy"
+    or "gzip", Feather "zstd" or "lz4", HDF5 "gzip" or "lzf". NPZ only has
+    zip deflate, used for any non-None value. None writes uncompressed.
+
+    Parquet and Feather need pyarrow and HDF5 needs h5py; NPZ only needs numpy.
+    """
+    import json
+    from dataclasses import asdict
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if not Path(filename).suffix:
+        filename += ".npz"
+    path = out_dir / filename
+    fmt = _result_format(path)
+
+    columns, scalars = _result_columns(results)
+    meta = json.dumps({
+        "schema": _RESULTS_SCHEMA,
+        "nozzle": type(results.nozzle).__name__,
+        "scalars": scalars,
+        "inputs": asdict(inputs) if inputs is not None else None,
+    })
+
+    if fmt == "npz":
+        save = np.savez if compression in (None, "none") else np.savez_compressed
+        # metadata rides along as a 0-d string array so loading never needs pickle
+        save(path, **columns, **{f"__{_META_KEY}__": np.array(meta)})
+
+    elif fmt in ("parquet", "feather"):
+        pa = _needs("pyarrow", fmt.title(), "pyarrow")
+        table = pa.table(columns).replace_schema_metadata({_META_KEY: meta})
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(table, path, compression=compression or "none")
+        else:
+            import pyarrow.feather as feather
+            feather.write_feather(table, path, compression=compression or "uncompressed")
+
+    else:
+        h5py = _needs("h5py", "HDF5", "h5py")
+        with h5py.File(path, "w") as f:
+            f.attrs[_META_KEY] = meta
+            for name, value in columns.items():
+                # "perf.Isp" -> dataset perf/Isp
+                f.create_dataset(name.replace(".", "/", 1), data=value, compression=compression)
+
+    return {"results": str(path)}
+
+
+def _read_results_file(path: Path) -> tuple[dict[str, np.ndarray], str]:
+    fmt = _result_format(path)
+
+    if fmt == "npz":
+        with np.load(path, allow_pickle=False) as data:
+            meta_key = f"__{_META_KEY}__"
+            if meta_key not in data.files:
+                raise ValueError(f"{path} is not a PROMPT results file.")
+            columns = {k: data[k] for k in data.files if k != meta_key}
+            return columns, str(data[meta_key])
+
+    if fmt in ("parquet", "feather"):
+        _needs("pyarrow", fmt.title(), "pyarrow")
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+            table = pq.read_table(path)
+        else:
+            import pyarrow.feather as feather
+            table = feather.read_table(path)
+        meta = (table.schema.metadata or {}).get(_META_KEY.encode())
+        if meta is None:
+            raise ValueError(f"{path} is not a PROMPT results file.")
+        columns = {name: table.column(name).to_numpy() for name in table.column_names}
+        return columns, meta.decode()
+
+    h5py = _needs("h5py", "HDF5", "h5py")
+    with h5py.File(path, "r") as f:
+        if _META_KEY not in f.attrs:
+            raise ValueError(f"{path} is not a PROMPT results file.")
+        columns = {}
+        for group in f.values():
+            for name, ds in group.items():
+                columns[f"{group.name.lstrip('/')}.{name}"] = ds[()]
+        meta = f.attrs[_META_KEY]
+        return columns, meta.decode() if isinstance(meta, bytes) else str(meta)
+
+
+def loadResults(path: str):
+    """
+    Reads a file written by exportResults back into (FullDesignResult,
+    EngineInputs). inputs is None if none were saved with the results.
+    """
+    import json
+    from dataclasses import fields
+
+    from CEA.CEA_Outputs import CEAOutputs
+    from Core.engine_analysis import FullDesignResult
+    from Core.engine_inputs import EngineInputs
+    from Core.nozzle_pipeline import BellNozzleGeometry, ConicalNozzleGeometry, EngineDesignResult
+
+    path = Path(path)
+    columns, meta = _read_results_file(path)
+    meta = json.loads(meta)
+    if meta.get("schema") != _RESULTS_SCHEMA:
+        raise ValueError(f"{path} has results schema {meta.get('schema')}, expected {_RESULTS_SCHEMA}.")
+
+    nozzle_types = {cls.__name__: cls for cls in (ConicalNozzleGeometry, BellNozzleGeometry)}
+    if meta["nozzle"] not in nozzle_types:
+        raise ValueError(f"{path} has unknown nozzle geometry '{meta['nozzle']}'.")
+
+    scalars = set(meta["scalars"])
+
+    def build(cls, group):
+        kwargs = {}
+        for f in fields(cls):
+            name = f"{group}.{f.name}"
+            if name not in columns:
+                raise ValueError(f"{path} is missing column '{name}'.")
+            value = np.asarray(columns[name], dtype=np.float64)
+            kwargs[f.name] = float(value[0]) if name in scalars and value.size else value
+        return cls(**kwargs)
+
+    results = FullDesignResult(
+        cea=build(CEAOutputs, "cea"),
+        perf=build(EngineDesignResult, "perf"),
+        nozzle=build(nozzle_types[meta["nozzle"]], "nozzle"),
+    )
+
+    inputs = None
+    if meta.get("inputs") is not None:
+        known = {f.name for f in fields(EngineInputs)}
+        inputs = EngineInputs(**{k: v for k, v in meta["inputs"].items() if k in known})
+    return results, inputs
@@ -9,9 +9,9 @@ from Isentropic.rao_curves.rao_fit_curves import get_rao_coeffs
 
 from Isentropic import (
     # isentropic_equations.py
-    isentropic_eqns,
-    # engine_performance.py
-    performance_characterization,           
+    mach_from_area_ratio,
+    # kernels.py
+    isentropic_performance,
     # conical_nozzle_geometry.py                                           
     throat_length, chamber_diameter, chamber_length, exit_diameter, divergent_length, convergent_length, total_length,
     # bell_nozzle_geometry.py                   
@@ -39,25 +39,40 @@ class EngineDesignResult:
 
 def engine_analysis(inputs: EngineInputs, cea: CEAOutputs):
     
-    # isentropic equations
-    SGC, mach_exit, T_throat, T_exit, p_throat, p_exit, v_exit, ER = isentropic_eqns(cea.gamma, inputs.chamber_pressure, cea.T_chamber, inputs.ambient_pressure, cea.molecular_weight)
-
-    # characterizing equations
-    mdot, Isp, c_star, a_throat, a_exit = performance_characterization(inputs.thrust, v_exit, cea.T_chamber, inputs.chamber_pressure, cea.gamma, SGC, ER)
+    if inputs.expansion_ratio is None:
+        # expanded to ambient: exit pressure = ambient pressure
+        p_design = inputs.ambient_pressure
+    else:
+        # fixed Ae/At: the exit Mach number (and so the exit pressure) follows from it
+        eps = np.asarray(inputs.expansion_ratio, dtype=float)
+        if np.any(~(eps > 1)):
+            raise ValueError("expansion_ratio must be greater than 1.")
+        mach = mach_from_area_ratio(eps, cea.gamma)
+        p_design = inputs.chamber_pressure * (1 + ((cea.gamma - 1) / 2) * mach**2) ** (-cea.gamma / (cea.gamma - 1))
+
+    # isentropic + characterizing equations in one fused pass (Isentropic/kernels.py). With a fixed ER,
+    # thrust = mdot * v_exit + (p_exit - ambient) * a_exit is sized for, and points so over-expanded that
+    # the pressure term cancels the jet come back NaN
+    fixed = inputs.expansion_ratio is not None
+    k = isentropic_performance(
+        cea.gamma, inputs.chamber_pressure, cea.T_chamber, p_design, cea.molecular_weight, inputs.thrust,
+        ambient_pressure=inputs.ambient_pressure if fixed else None,
+        area_ratio=eps if fixed else None,
+    )
 
     return EngineDesignResult(
-        mach_exit=mach_exit,
-        T_throat=T_throat,
-        T_exit=T_exit,
-        v_exit=v_exit,
-        p_exit=p_exit,
-        p_throat=p_throat,
-        mdot=mdot,
-        a_throat=a_throat,
-        a_exit=a_exit,
-        ER=ER,
-        Isp=Isp,
-        c_star=c_star
+        mach_exit=k["mach_exit"],
+        T_throat=k["T_throat"],
+        T_exit=k["T_exit"],
+        v_exit=k["v_exit"],
+        p_exit=k["p_exit"],
+        p_throat=k["p_throat"],
+        mdot=k["mdot"],
+        a_throat=k["a_throat"],
+        a_exit=k["a_exit"],
+        ER=k["ER"],
+        Isp=k["Isp"],
+        c_star=k["c_star"]
     )   
 
 @dataclass
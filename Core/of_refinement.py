@@ -0,0 +1,189 @@
+from __future__ import annotations
+from dataclasses import dataclass, fields
+from typing import Dict
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .engine_inputs import EngineInputs
+from .nozzle_pipeline import engine_analysis, EngineDesignResult
+from CEA.CEA_Outputs import CEAOutputs
+from CEA.CEARunner import cea_batch
+
+_INV_PHI = (np.sqrt(5.0) - 1.0) / 2.0  # golden ratio conjugate
+
+# objective name -> where it lives ("perf" = EngineDesignResult, "cea" = CEAOutputs)
+OBJECTIVES = {
+    "Isp": ("perf", "Isp"),
+    "c_star": ("perf", "c_star"),
+    "v_exit": ("perf", "v_exit"),
+    "T_chamber": ("cea", "T_chamber"),
+}
+
+
+@dataclass
+class AdaptiveSweepResult:
+    OF_Ratio: NDArray[np.float64]      # non-uniform, sorted sample set
+    cea: CEAOutputs                    # CEA outputs at OF_Ratio
+    perf: EngineDesignResult           # performance at OF_Ratio
+    objective: str
+    OF_optimum: float                  # located optimum O/F
+    objective_optimum: float           # objective value at OF_optimum
+    n_cea_points: int                  # O/F points sent to CEA
+
+
+class _Evaluator:
+    # evaluates batches of O/F points and remembers everything it has seen
+
+    def __init__(self, engine_in: EngineInputs, objective: str, eps: float, use_cache: bool):
+        self.engine_in = engine_in
+        self.source, self.field = OBJECTIVES[objective]
+        self.eps = eps
+        self.use_cache = use_cache
+        self.seen: Dict[float, int] = {}
+        self.cea_parts = []
+        self.perf_parts = []
+        self.values = []
+
+    def __call__(self, of_values) -> NDArray[np.float64]:
+        of_values = np.atleast_1d(np.asarray(of_values, dtype=float))
+        new = np.array(sorted({float(v) for v in of_values} - set(self.seen)), dtype=float)
+
+        if new.size:
+            cea = cea_batch(
+                self.engine_in.oxidizer_name, self.engine_in.fuel_name,
+                self.engine_in.chamber_pressure / 1e5, new,
+                eps=self.eps, frozen=self.engine_in.frozen_flag, use_cache=self.use_cache,
+            )
+            perf = engine_analysis(self.engine_in, cea)
+            obj = np.asarray(getattr(perf if self.source == "perf" else cea, self.field), dtype=float)
+
+            start = len(self.values)
+            for k, v in enumerate(new):
+                self.seen[float(v)] = start + k
+            self.cea_parts.append(cea)
+            self.perf_parts.append(perf)
+            self.values.extend(np.broadcast_to(obj, new.shape).tolist())
+
+        return np.array([self.values[self.seen[float(v)]] for v in of_values], dtype=float)
+
+    def collect(self):
+        order_of = np.array(sorted(self.seen), dtype=float)
+        order = np.array([self.seen[v] for v in order_of], dtype=int)
+
+        def stack(parts, cls):
+            return cls(**{
+                f.name: np.concatenate([np.atleast_1d(getattr(p, f.name)) for p in parts])[order]
+                for f in fields(cls)
+            })
+
+        return order_of, stack(self.cea_parts, CEAOutputs), stack(self.perf_parts, EngineDesignResult)
+
+
+def adaptive_of_sweep(
+    engine_in: EngineInputs,
+    objective: str = "Isp",
+    *,
+    coarse_points: int = 9,
+    of_tol: float = 1e-3,
+    curvature_tol: float = 0.01,
+    max_points: int = 80,
+    eps: float = 40.0,
+    use_cache: bool = True,
+) -> AdaptiveSweepResult:
+    """
+    Samples O/F over [OF_min, OF_max] coarsely, refines only where the
+    objective curve bends, then golden-section searches the bracket around
+    the best sample for the optimum.
+
+    curvature_tol is the allowed deviation of a sample from the chord of its
+    neighbours, relative to the objective's range; of_tol is the width at
+    which refinement and the optimum search stop. max_points caps the coarse
+    and refinement passes; the final search adds roughly
+    log(bracket / of_tol) / log(1.618) more points.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}'. Valid objectives: {sorted(OBJECTIVES)}")
+    if engine_in.OF_min is None or engine_in.OF_max is None:
+        raise ValueError("Adaptive sweep requires OF_min and OF_max.")
+
+    lo, hi = float(engine_in.OF_min), float(engine_in.OF_max)
+    if lo <= 0.0 or hi <= 0.0:
+        raise ValueError("O/F values must be positive.")
+    if lo >= hi:
+        raise ValueError("O/F min must be < O/F max.")
+    if coarse_points < 3:
+        raise ValueError("coarse_points must be >= 3.")
+    if of_tol <= 0.0:
+        raise ValueError("of_tol must be > 0.")
+
+    f = _Evaluator(engine_in, objective, eps, use_cache)
+
+    # -------------------------
+    # coarse pass
+    # -------------------------
+    x = np.linspace(lo, hi, int(coarse_points))
+    y = f(x)
+
+    # -------------------------
+    # curvature-driven refinement
+    # -------------------------
+    while len(f.seen) < max_points:
+        x = np.array(sorted(f.seen), dtype=float)
+        y = f(x)
+        span = float(np.nanmax(y) - np.nanmin(y)) or 1.0
+
+        # deviation of each interior sample from the chord through its neighbours
+        t = (x[1:-1] - x[:-2]) / (x[2:] - x[:-2])
+        chord = y[:-2] + t * (y[2:] - y[:-2])
+        bent = np.abs(y[1:-1] - chord) / span > curvature_tol
+
+        # the intervals on either side of the best sample always get refined
+        best = int(np.nanargmax(y))
+        flag = np.zeros(x.size - 1, dtype=bool)
+        flag[:-1] |= bent
+        flag[1:] |= bent
+        flag[max(best - 1, 0):best + 1] = True
+        flag &= np.diff(x) > 2.0 * of_tol
+
+        if not flag.any():
+            break
+
+        mids = 0.5 * (x[:-1] + x[1:])[flag]
+        f(mids[: max_points - len(f.seen)])
+
+    # -------------------------
+    # golden-section search around the best sample
+    # -------------------------
+    x = np.array(sorted(f.seen), dtype=float)
+    y = f(x)
+    best = int(np.nanargmax(y))
+    a = x[max(best - 1, 0)]
+    b = x[min(best + 1, x.size - 1)]
+
+    c = b - _INV_PHI * (b - a)
+    d = a + _INV_PHI * (b - a)
+    fc, fd = f(c)[0], f(d)[0]
+    while (b - a) > of_tol:
+        if fc > fd:
+            b, d, fd = d, c, fc
+            c = b - _INV_PHI * (b - a)
+            fc = f(c)[0]
+        else:
+            a, c, fc = c, d, fd
+            d = a + _INV_PHI * (b - a)
+            fd = f(d)[0]
+
+    of_values, cea, perf = f.collect()
+    values = f(of_values)
+    i_opt = int(np.nanargmax(values))
+
+    return AdaptiveSweepResult(
+        OF_Ratio=of_values,
+        cea=cea,
+        perf=perf,
+        objective=objective,
+        OF_optimum=float(of_values[i_opt]),
+        objective_optimum=float(values[i_opt]),
+        n_cea_points=len(f.seen),
+    )
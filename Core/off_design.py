@@ -0,0 +1,91 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from .engine_analysis import FullDesignResult
+from Isentropic.isentropic_equations import R, mach_from_area_ratio
+from Isentropic.engine_performance import g
+
+# Summerfield criterion: the jet is taken to separate once p_exit drops below this fraction of ambient
+SEPARATION_RATIO = 0.4
+
+
+@dataclass
+class OffDesignMap:
+    ambient_pressure: np.ndarray   # (n_pa,) Pa
+    chamber_pressure: np.ndarray   # (n_pc,) Pa
+    thrust: np.ndarray             # (..., n_pc, n_pa) N
+    Isp: np.ndarray                # (..., n_pc, n_pa) s
+    p_exit: np.ndarray             # (..., n_pc, 1) Pa; doesn't depend on ambient while the nozzle flows full
+    mdot: np.ndarray               # (..., n_pc, 1) kg/s
+    Cf: np.ndarray                 # (..., n_pc, n_pa) thrust coefficient
+    separated: np.ndarray          # (..., n_pc, n_pa) bool, p_exit < SEPARATION_RATIO * ambient
+    mach_exit: np.ndarray          # (...,) fixed by the area ratio
+    a_throat: np.ndarray           # (...,) m^2
+    a_exit: np.ndarray             # (...,) m^2
+
+    @property
+    def shape(self):
+        return self.thrust.shape
+
+
+def off_design_map(
+    result: FullDesignResult,
+    ambient_pressure,
+    chamber_pressure,
+    idx: Optional[int] = None,
+    separation_ratio: float = SEPARATION_RATIO,
+) -> OffDesignMap:
+    """
+    Performance of the already-sized nozzle (At and Ae frozen) over a grid of
+    ambient pressure x chamber pressure, in one broadcast pass.
+
+    The chamber state (gamma, Tc, MW) is held at the design values, so c*,
+    the exit Mach number and p_exit/Pc don't change with throttle; mdot
+    scales with Pc and the pressure thrust term picks up the ambient.
+    idx picks one O/F point (2-D arrays); None maps every point, with the
+    O/F axis in front.
+    """
+    pa = np.atleast_1d(np.asarray(ambient_pressure, dtype=float))
+    pc = np.atleast_1d(np.asarray(chamber_pressure, dtype=float))
+    if pa.ndim != 1 or pc.ndim != 1:
+        raise ValueError("ambient_pressure and chamber_pressure must be scalars or 1-D.")
+    if np.any(pa < 0) or np.any(pc <= 0):
+        raise ValueError("Pressures must be positive (ambient may be 0 for vacuum).")
+
+    cea, perf = result.cea, result.perf
+    sel = slice(None) if idx is None else int(idx)
+    gamma = np.asarray(cea.gamma, dtype=float)[sel]
+    T_c = np.asarray(cea.T_chamber, dtype=float)[sel]
+    mw = np.asarray(cea.molecular_weight, dtype=float)[sel]
+    a_throat = np.asarray(perf.a_throat, dtype=float)[sel]
+    a_exit = np.asarray(perf.a_exit, dtype=float)[sel]
+    c_star = np.asarray(perf.c_star, dtype=float)[sel]
+
+    # everything per design point is 0-d/1-d; give it two trailing axes for (Pc, Pa)
+    mach = mach_from_area_ratio(a_exit / a_throat, gamma)
+    expand = 1 + ((gamma - 1) / 2) * mach**2
+    v_exit = mach * np.sqrt(gamma * (R / mw * 1000) * T_c / expand)
+    pe_over_pc = expand ** (-gamma / (gamma - 1))
+
+    col = (...,) + (None, None)
+    pc_grid = pc[:, None]
+    mdot = pc_grid * a_throat[col] / c_star[col]
+    p_exit = pc_grid * pe_over_pc[col]
+    thrust = mdot * v_exit[col] + (p_exit - pa) * a_exit[col]
+
+    return OffDesignMap(
+        ambient_pressure=pa,
+        chamber_pressure=pc,
+        thrust=thrust,
+        Isp=thrust / (mdot * g),
+        p_exit=p_exit,
+        mdot=mdot,
+        Cf=thrust / (pc_grid * a_throat[col]),
+        separated=p_exit < separation_ratio * pa,
+        mach_exit=mach,
+        a_throat=a_throat,
+        a_exit=a_exit,
+    )
@@ -3,6 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+from matplotlib.colors import to_rgb
+
 
 @dataclass(frozen=True)
 class PlotTheme:
@@ -77,8 +80,42 @@ THEMES: Dict[str, PlotTheme] = {
 }
 
 
+def plot_theme(theme_name: str) -> PlotTheme:
+    return THEMES.get((theme_name or "system").strip().lower(), THEMES["system"])
+
+
+def use_palette(artist, slot: int, shade=None):
+    """
+    Marks an artist as drawn in palette colour `slot` so apply_mpl_theme can
+    recolour it later. shade holds per-face light factors for shaded 3D
+    surfaces (colour = shade * base colour).
+    """
+    artist._palette_slot = slot
+    artist._palette_shade = shade
+    return artist
+
+
+def recolor_artists(artists, theme_name: str):
+    # palette colours only; artists without use_palette are left alone
+    t = plot_theme(theme_name)
+    for artist in artists:
+        slot = getattr(artist, "_palette_slot", None)
+        if slot is None:
+            continue
+        color = t.colors[slot % len(t.colors)]
+        shade = getattr(artist, "_palette_shade", None)
+        if shade is None:
+            artist.set_color(color)
+        else:
+            artist.set_facecolor(np.clip(shade[:, None] * np.asarray(to_rgb(color)), 0.0, 1.0))
+
+
 def apply_mpl_theme(fig, ax, theme_name: str) -> PlotTheme:
-    t = THEMES.get((theme_name or "system").strip().lower(), THEMES["system"])
+    """
+    Styles fig/ax for the theme. Works on new and already-drawn figures:
+    artists tagged with use_palette and the legend are recoloured in place.
+    """
+    t = plot_theme(theme_name)
 
     fig.patch.set_facecolor(t.fig_bg)
     ax.set_facecolor(t.ax_bg)
@@ -107,4 +144,16 @@ def apply_mpl_theme(fig, ax, theme_name: str) -> PlotTheme:
         ax.yaxis._axinfo["tick"]["color"] = t.fg
         ax.zaxis._axinfo["tick"]["color"] = t.fg
 
+    recolor_artists((*ax.lines, *ax.collections), theme_name)
+
+    legend = ax.get_legend()
+    if legend is not None:
+        legend.get_frame().set_facecolor(t.ax_bg)
+        legend.get_frame().set_edgecolor(t.grid)
+        for text in legend.get_texts():
+            text.set_color(t.fg)
+        labelled = [line for line in ax.lines if not line.get_label().startswith("_")]
+        for handle, line in zip(legend.legend_handles, labelled):
+            handle.set_color(line.get_color())
+
     return t
\ No newline at end of file
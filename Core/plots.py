@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgb, to_rgba
 from matplotlib.figure import Figure
-from Core.plot_style import apply_mpl_theme
+from Core.plot_style import apply_mpl_theme, plot_theme, use_palette
+from Core.profiling import profiled
 import numpy as np
 
 
-def plot_isp_vs_of(of, isp, *, theme: str = "system"):
-    fig = Figure(figsize=(6, 4), dpi=120)
+# the plot_* builders return a new Figure; the draw_* versions redraw into an existing one
+# (GUI/plot_manager.py keeps one Figure per canvas and only ever calls draw_*/update_*)
+
+
+def _line(ax, t, slot, x, y, **kwargs):
+    # palette-coloured line that apply_mpl_theme can recolour on a theme change
+    line, = ax.plot(x, y, linewidth=2.0, color=t.colors[slot], **kwargs)
+    return use_palette(line, slot)
+
+
+@profiled("figures")
+def draw_isp_vs_of(fig, of, isp, *, theme: str = "system"):
+    fig.clear()
     ax = fig.add_subplot(111)
 
     t = apply_mpl_theme(fig, ax, theme)
-    ax.plot(of, isp, linewidth=2.0, color=t.colors[0])
+    _line(ax, t, 0, of, isp)
 
     ax.set_xlabel("O/F Ratio")
     ax.set_ylabel("Isp (s)")
@@ -20,15 +34,16 @@ def plot_isp_vs_of(of, isp, *, theme: str = "system"):
     return fig
 
 
-def plot_velocity_vs_of(of, v_exit, cstar=None, *, theme: str = "system"):
-    fig = Figure(figsize=(6, 4), dpi=120)
+@profiled("figures")
+def draw_velocity_vs_of(fig, of, v_exit, cstar=None, *, theme: str = "system"):
+    fig.clear()
     ax = fig.add_subplot(111)
 
     t = apply_mpl_theme(fig, ax, theme)
-    ax.plot(of, v_exit, linewidth=2.0, color=t.colors[2], label="Exit velocity")
+    _line(ax, t, 2, of, v_exit, label="Exit velocity")
 
     if cstar is not None:
-        ax.plot(of, cstar, linewidth=2.0, color=t.colors[1], label="c*")
+        _line(ax, t, 1, of, cstar, label="c*")
 
     ax.set_xlabel("O/F Ratio")
     ax.set_ylabel("Velocity (m/s)")
@@ -39,18 +54,19 @@ def plot_velocity_vs_of(of, v_exit, cstar=None, *, theme: str = "system"):
     return fig
 
 
-def plot_temp_vs_of(of, t_chamber, t_throat=None, t_exit=None, *, theme: str = "system"):
-    fig = Figure(figsize=(6, 4), dpi=120)
+@profiled("figures")
+def draw_temp_vs_of(fig, of, t_chamber, t_throat=None, t_exit=None, *, theme: str = "system"):
+    fig.clear()
     ax = fig.add_subplot(111)
 
     t = apply_mpl_theme(fig, ax, theme)
-    ax.plot(of, t_chamber, linewidth=2.0, color=t.colors[0], label="Chamber")
+    _line(ax, t, 0, of, t_chamber, label="Chamber")
 
     if t_throat is not None:
-        ax.plot(of, t_throat, linewidth=2.0, color=t.colors[1], label="Throat")
+        _line(ax, t, 1, of, t_throat, label="Throat")
 
     if t_exit is not None:
-        ax.plot(of, t_exit, linewidth=2.0, color=t.colors[3], label="Exit")
+        _line(ax, t, 3, of, t_exit, label="Exit")
 
     ax.set_xlabel("O/F Ratio")
     ax.set_ylabel("Temperature (K)")
@@ -60,38 +76,172 @@ def plot_temp_vs_of(of, t_chamber, t_throat=None, t_exit=None, *, theme: str = "
     fig.tight_layout()
     return fig
 
-def plot_nozzle_geometry(x, y, *, theme: str = "system"):
-    fig = Figure(figsize=(4.5, 7.0), dpi=120)
+
+def plot_isp_vs_of(of, isp, *, theme: str = "system"):
+    return draw_isp_vs_of(Figure(figsize=(6, 4), dpi=120), of, isp, theme=theme)
+
+
+def plot_velocity_vs_of(of, v_exit, cstar=None, *, theme: str = "system"):
+    return draw_velocity_vs_of(Figure(figsize=(6, 4), dpi=120), of, v_exit, cstar, theme=theme)
+
+
+def plot_temp_vs_of(of, t_chamber, t_throat=None, t_exit=None, *, theme: str = "system"):
+    return draw_temp_vs_of(Figure(figsize=(6, 4), dpi=120), of, t_chamber, t_throat, t_exit, theme=theme)
+
+
+def _nozzle_limits(ax, x, y):
+    ax.set_xlim(-3 * float(np.max(x)), 3 * float(np.max(x)))
+    ax.set_ylim(float(np.min(y)), float(np.max(y)))
+
+
+@profiled("figures")
+def draw_nozzle_geometry(fig, x, y, *, theme: str = "system"):
+    fig.clear()
     ax = fig.add_subplot(111)
     t = apply_mpl_theme(fig, ax, theme)
 
-    ax.plot(x, y, linewidth=2.0, color=t.colors[0])
-    ax.plot(-x, y, linewidth=2.0, color=t.colors[0])
+    _line(ax, t, 0, x, y)
+    _line(ax, t, 0, -x, y)
     ax.set_xlabel("Radius (m)")
     ax.set_ylabel("Axial Distance (m)")
     ax.set_title("Engine Contour")
-    ax.set_xlim(-3 * float(np.max(x)), 3 * float(np.max(x)))
-    ax.set_ylim(float(np.min(y)), float(np.max(y)))
+    _nozzle_limits(ax, x, y)
     ax.set_aspect("equal", adjustable="box")
     return fig
 
-def plot_nozzle_revolution(x_radial, y_axial, *, theme="system", n_theta=80):
-    fig = Figure(figsize=(7, 4.5), dpi=120)
-    ax = fig.add_subplot(111, projection="3d")
-    t = apply_mpl_theme(fig, ax, theme)
 
+def plot_nozzle_geometry(x, y, *, theme: str = "system"):
+    return draw_nozzle_geometry(Figure(figsize=(4.5, 7.0), dpi=120), x, y, theme=theme)
+
+
+@profiled("figures")
+def update_nozzle_geometry(fig, x, y):
+    # new contour into the two lines drawn by draw_nozzle_geometry
+    ax = fig.axes[0]
+    right, left = ax.lines[:2]
+    right.set_data(x, y)
+    left.set_data(-x, y)
+    _nozzle_limits(ax, x, y)
+    return fig
+
+
+# level of detail for the 3D nozzle: the contour is thinned by curvature and the
+# number of angles follows the size the nozzle is drawn at
+LOD_TURN_DEG = 3.0      # keep a contour point at least every 3 deg of turning...
+LOD_MAX_SEGMENT = 0.05  # ...and every 5% of the contour length
+LOD_TOL_PX = 0.5        # max gap between the faceted and the true circle, in pixels
+# fixed detail used without lod (plot_nozzle_revolution, toolbar saves): no heavier than the
+# old plot_surface mesh, which strided the 80 x ~400 grid down to 40 x 50 samples
+FULL_N_THETA = 41       # 40 facets around
+FULL_MAX_POINTS = 50    # contour points, placed by lod_contour at a tighter tolerance
+FULL_TURN_DEG = 1.5
+FULL_MAX_SEGMENT = 0.03
+
+
+def lod_contour(x, y, max_turn_deg: float = LOD_TURN_DEG, max_segment: float = LOD_MAX_SEGMENT):
+    """
+    Indices of the contour points to keep for display. A point is kept each
+    time the accumulated turning angle passes another max_turn_deg or the arc
+    length another max_segment (fraction of the total), so the throat and lip
+    keep their detail while straight cones collapse to a few points. The
+    endpoints are always kept.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.size < 3:
+        return np.arange(x.size)
+
+    dx, dy = np.diff(x), np.diff(y)
+    arc = np.concatenate(([0.0], np.cumsum(np.hypot(dx, dy))))
+    heading = np.unwrap(np.arctan2(dy, dx))
+    turn = np.concatenate(([0.0], np.cumsum(np.abs(np.diff(heading))), [0.0]))
+    turn[-1] = turn[-2]
+
+    bucket = np.floor(turn / np.radians(max_turn_deg))
+    if arc[-1] > 0:
+        bucket = bucket + np.floor(arc / (max_segment * arc[-1]))
+    keep = np.flatnonzero(np.diff(bucket)) + 1
+    return np.unique(np.concatenate(([0], keep, [x.size - 1])))
+
+
+def full_contour(x, y, max_points: int = FULL_MAX_POINTS):
+    # lod_contour at the tight full-detail tolerance, loosened until at most max_points remain
+    turn, segment = FULL_TURN_DEG, FULL_MAX_SEGMENT
+    keep = lod_contour(x, y, turn, segment)
+    while keep.size > max_points:
+        turn, segment = 1.25 * turn, 1.25 * segment
+        keep = lod_contour(x, y, turn, segment)
+    return keep
+
+
+def theta_samples(radius_px: float, tol_px: float = LOD_TOL_PX, lo: int = 16, hi: int = FULL_N_THETA) -> int:
+    # fewest angles whose polygon stays within tol_px of a circle radius_px across (sag ~ r*dtheta^2/8)
+    if radius_px <= 0:
+        return lo
+    dtheta = np.sqrt(8.0 * tol_px / radius_px)
+    return int(np.clip(np.ceil(2.0 * np.pi / dtheta) + 1, lo, hi))
+
+
+def screen_theta_samples(ax, x_radial, y_axial) -> int:
+    # n_theta for the nozzle drawn to fit ax (equal aspect, so the longest side spans the axes)
+    r = float(np.max(x_radial))
+    length = max(2.0 * r, float(np.ptp(y_axial)))
+    if length <= 0:
+        return FULL_N_THETA
+    return theta_samples(r / length * min(ax.bbox.width, ax.bbox.height))
+
+
+def _revolve(x_radial, y_axial, n_theta):
+    # (n_theta-1)*(n-1) quads of the surface of revolution, vertices ordered like plot_surface's
     theta = np.linspace(0.0, 2.0*np.pi, n_theta)
+    X = x_radial[None, :] * np.cos(theta[:, None])
+    Y = x_radial[None, :] * np.sin(theta[:, None])
+    Z = np.broadcast_to(y_axial[None, :], X.shape)
+    P = np.stack([X, Y, Z], axis=-1)
+    quads = np.stack([P[:-1, :-1], P[:-1, 1:], P[1:, 1:], P[1:, :-1]], axis=2)
+    return quads.reshape(-1, 4, 3)
 
-    Z = np.tile(y_axial[None, :], (n_theta, 1))
-    R = np.tile(x_radial[None, :], (n_theta, 1))
 
-    X = R * np.cos(theta[:, None])
-    Y = R * np.sin(theta[:, None])
-    
-    H = float(np.max(Z) - np.min(Z))
-    D = float(2.0 * np.max(X))
-    ax.plot_surface(X, Y, Z, linewidth=0,  antialiased=True, alpha=0.95, color=t.colors[0], shade=True)
-    ax.set_title("3D Surface of Revolution")
+@profiled("figures")
+def nozzle_surface(ax, x_radial, y_axial, *, theme: str = "system", n_theta=None, lod: bool = False):
+    """
+    Adds the surface of revolution of (x_radial, y_axial) to a 3D axes and
+    returns it. By default the contour goes through full_contour and n_theta
+    (when not given) is FULL_N_THETA, a fixed detail about the size of the
+    old plot_surface mesh; with lod the contour is thinned further and
+    n_theta follows the axes' size on screen (never above FULL_N_THETA),
+    for interactive views.
+    """
+    from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+    x_radial = np.asarray(x_radial, dtype=float)
+    y_axial = np.asarray(y_axial, dtype=float)
+    if n_theta is None:
+        n_theta = screen_theta_samples(ax, x_radial, y_axial) if lod else FULL_N_THETA
+    keep = lod_contour(x_radial, y_axial) if lod else full_contour(x_radial, y_axial)
+    x_radial, y_axial = x_radial[keep], y_axial[keep]
+
+    # quads built in one go rather than plot_surface's per-face loop (which also strides
+    # the grid down to 50x50 uniformly, losing the throat)
+    color = plot_theme(theme).colors[0]
+    surface = Poly3DCollection(
+        _revolve(x_radial, y_axial, n_theta), facecolors=to_rgba(color), shade=True,
+        linewidth=0, antialiased=True, alpha=0.95,
+    )
+    ax.add_collection3d(surface)
+    surface._n_theta = n_theta
+    surface._lod = lod
+
+    # keep the light factors matplotlib shaded the faces with, so a theme change only rescales them
+    base = np.asarray(to_rgb(color))
+    k = int(np.argmax(base))
+    faces = PolyCollection.get_facecolor(surface)  # unsorted per-face colours, not the depth-sorted 2D ones
+    return use_palette(surface, 0, shade=faces[:, k] / base[k])
+
+
+def style_revolution_axes(fig, ax, theme: str = "system"):
+    apply_mpl_theme(fig, ax, theme)
+
     # CAD-style top-down view
     ax.set_proj_type("ortho")
     # Optional: remove everything except geometry
@@ -111,4 +261,110 @@ def plot_nozzle_revolution(x_radial, y_axial, *, theme="system", n_theta=80):
     ax.yaxis.line.set_visible(False)
     ax.zaxis.line.set_visible(False)
 
-    return fig
\ No newline at end of file
+
+@profiled("figures")
+def draw_nozzle_revolution(fig, x_radial, y_axial, *, theme="system", n_theta=None, lod=False):
+    fig.clear()
+    ax = fig.add_subplot(111, projection="3d")
+    nozzle_surface(ax, x_radial, y_axial, theme=theme, n_theta=n_theta, lod=lod)
+    style_revolution_axes(fig, ax, theme)
+    return fig
+
+
+def plot_nozzle_revolution(x_radial, y_axial, *, theme="system", n_theta=None, lod=False):
+    fig = Figure(figsize=(7, 4.5), dpi=120)
+    return draw_nozzle_revolution(fig, x_radial, y_axial, theme=theme, n_theta=n_theta, lod=lod)
+
+
+def set_nozzle_surface(ax, surface, x_radial, y_axial):
+    """
+    Makes `surface` (from nozzle_surface on this same axes, possibly removed
+    since) the only surface on ax and rescales the view to it. Lets callers
+    keep prebuilt surfaces around instead of re-running plot_surface.
+    """
+    for coll in list(ax.collections):
+        if coll is not surface:
+            coll.remove()
+    if surface.axes is None:
+        ax.add_collection3d(surface)
+
+    r = float(np.max(x_radial))
+    ax.auto_scale_xyz([-r, r], [-r, r], [float(np.min(y_axial)), float(np.max(y_axial))], had_data=False)
+    ax.set_aspect('equal')
+
+
+@profiled("figures")
+def plot_nozzle_overlay(x_radial, y_axial, of, *, theme: str = "system", max_lines: int = 200):
+    # (n_OF, n_points) contours from *_nozzle_contours, one LineCollection per side so the
+    # artist count stays fixed however many O/F points there are
+    from matplotlib.collections import LineCollection
+    from matplotlib.colors import Normalize
+
+    x = np.atleast_2d(np.asarray(x_radial, dtype=float))
+    y = np.atleast_2d(np.asarray(y_axial, dtype=float))
+    of = np.atleast_1d(np.asarray(of, dtype=float))
+
+    if x.shape[0] > max_lines:
+        keep = np.unique(np.linspace(0, x.shape[0] - 1, max_lines).round().astype(int))
+        x, y, of = x[keep], y[keep], of[keep]
+
+    fig = Figure(figsize=(4.5, 7.0), dpi=120)
+    ax = fig.add_subplot(111)
+    t = apply_mpl_theme(fig, ax, theme)
+
+    norm = Normalize(float(np.min(of)), float(np.max(of)) if of.size > 1 else float(np.min(of)) + 1.0)
+    for sign in (1.0, -1.0):
+        lines = LineCollection(np.stack([sign * x, y], axis=-1), cmap="viridis", norm=norm, linewidths=1.0)
+        lines.set_array(of)
+        ax.add_collection(lines)
+
+    cbar = fig.colorbar(lines, ax=ax)
+    cbar.set_label("O/F Ratio", color=t.fg)
+    cbar.ax.tick_params(colors=t.fg)
+
+    ax.set_xlabel("Radius (m)")
+    ax.set_ylabel("Axial Distance (m)")
+    ax.set_title("Engine Contours vs O/F")
+    ax.set_xlim(-3 * float(np.nanmax(x)), 3 * float(np.nanmax(x)))
+    ax.set_ylim(float(np.nanmin(y)), float(np.nanmax(y)))
+    ax.set_aspect("equal", adjustable="box")
+    return fig
+
+
+@profiled("figures")
+def draw_pareto_front(fig, x_all, y_all, x_front, y_front, *, xlabel: str, ylabel: str, theme: str = "system"):
+    """
+    Every evaluated design as faint dots with the non-dominated front on top
+    (lines[1], pickable). lines[2] is an empty marker for highlighting a
+    selected front design with mark_pareto_point.
+    """
+    fig.clear()
+    ax = fig.add_subplot(111)
+    t = apply_mpl_theme(fig, ax, theme)
+
+    _line(ax, t, 2, x_all, y_all, linestyle="none", marker=".", markersize=3, alpha=0.35, label="Evaluated")
+    order = np.argsort(x_front, kind="stable")
+    front = _line(ax, t, 0, np.asarray(x_front)[order], np.asarray(y_front)[order], marker="o", markersize=4,
+                  label="Pareto front", picker=True, pickradius=6)
+    front._pareto_order = order  # plotted position -> index into the front as given
+    _line(ax, t, 3, [], [], linestyle="none", marker="o", markersize=11, markerfacecolor="none",
+          markeredgewidth=2.0, label="_selected")
+
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title("Pareto Front")
+    ax.legend(facecolor=t.ax_bg, edgecolor=t.grid, labelcolor=t.fg)
+
+    fig.tight_layout()
+    return fig
+
+
+def plot_pareto_front(x_all, y_all, x_front, y_front, *, xlabel: str, ylabel: str, theme: str = "system"):
+    return draw_pareto_front(Figure(figsize=(6, 4), dpi=120), x_all, y_all, x_front, y_front,
+                             xlabel=xlabel, ylabel=ylabel, theme=theme)
+
+
+def mark_pareto_point(fig, x, y):
+    # moves the highlight ring drawn by draw_pareto_front
+    fig.axes[0].lines[2].set_data([x], [y])
+    return fig
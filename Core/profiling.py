@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import functools
+import math
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+# opt-in: PROMPT_PROFILE=1 in the environment, set_profiling(True), or the GUI's View menu
+_enabled = os.environ.get("PROMPT_PROFILE", "").strip().lower() in ("1", "true", "yes", "on")
+
+_local = threading.local()        # active Profiler stack for this thread
+_trace_lock = threading.Lock()
+_trace_users = 0                  # profilers currently relying on tracemalloc
+_trace_owned = False              # True if we started tracemalloc (so we stop it)
+_trace_threads: Dict[int, int] = {}   # thread id -> memory profilers entered on it
+
+# stage name -> qualified names of the functions decorated with @profiled(stage)
+STAGES: Dict[str, List[str]] = {}
+
+
+def set_profiling(enabled: bool):
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def profiling_enabled() -> bool:
+    return _enabled
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    wall_s: float = 0.0
+    peak_bytes: int = 0           # largest traced-memory rise seen during one call
+    measured: int = 0             # calls whose memory was tracked (see Profiler)
+
+
+def _start_tracing():
+    global _trace_users, _trace_owned
+    with _trace_lock:
+        if _trace_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _trace_owned = True
+        _trace_users += 1
+        tid = threading.get_ident()
+        _trace_threads[tid] = _trace_threads.get(tid, 0) + 1
+
+
+def _stop_tracing():
+    global _trace_users, _trace_owned
+    with _trace_lock:
+        tid = threading.get_ident()
+        _trace_threads[tid] -= 1
+        if _trace_threads[tid] == 0:
+            del _trace_threads[tid]
+        _trace_users -= 1
+        if _trace_users == 0 and _trace_owned:
+            tracemalloc.stop()
+            _trace_owned = False
+
+
+class Profiler:
+    """
+    Collects per-stage call counts, wall time and peak memory.
+
+    Entering the profiler (`with prof:`) makes it the target of
+    profile_stage / @profiled on this thread; it can be entered repeatedly
+    and keeps accumulating. Stages may nest and are reported flat, so a
+    parent's time includes its children.
+
+    Peak memory comes from tracemalloc, which is process-wide: it roughly
+    doubles the cost of allocation-heavy code, and stages running on two
+    threads at once see each other's allocations. Its peak counter is
+    process-wide too, so a stage is only measured when no profiler is
+    active on another thread (otherwise each would reset the other's
+    peak); a stage that never was reports peak_mb as NaN.
+    """
+
+    def __init__(self, memory: bool = True):
+        self.memory = memory
+        self.stats: Dict[str, StageStats] = {}
+        self._open: List[list] = []   # [start_bytes, running_peak] per open stage
+        self._depth = 0
+
+    def __enter__(self) -> "Profiler":
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(self)
+        if self._depth == 0 and self.memory:
+            _start_tracing()
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._depth -= 1
+        if self._depth == 0 and self.memory:
+            _stop_tracing()
+        _local.stack.pop()
+        return False
+
+    @contextmanager
+    def stage(self, name: str):
+        s = self.stats.get(name)
+        if s is None:
+            s = self.stats[name] = StageStats()  # created on entry so reports list parents first
+
+        # entering this profiler registered our thread, so a second entry means another thread
+        tracing = self.memory and tracemalloc.is_tracing() and len(_trace_threads) == 1
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            # fold the peak so far into the enclosing stage before resetting it
+            if self._open:
+                self._open[-1][1] = max(self._open[-1][1], peak)
+            tracemalloc.reset_peak()
+            self._open.append([current, current])
+
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - t0
+            rise = 0
+            if tracing:
+                start, running = self._open.pop()
+                peak = max(running, tracemalloc.get_traced_memory()[1])
+                rise = peak - start
+                if self._open:
+                    self._open[-1][1] = max(self._open[-1][1], peak)
+                tracemalloc.reset_peak()
+
+            s.calls += 1
+            s.wall_s += wall
+            if tracing:
+                s.measured += 1
+                s.peak_bytes = max(s.peak_bytes, rise)
+
+    def as_dict(self) -> dict:
+        return {
+            name: {
+                "calls": s.calls,
+                "wall_s": s.wall_s,
+                "peak_mb": s.peak_bytes / 1e6 if s.measured else math.nan,
+            }
+            for name, s in self.stats.items()
+        }
+
+
+def active_profiler() -> Optional[Profiler]:
+    stack = getattr(_local, "stack", None)
+    return stack[-1] if stack else None
+
+
+@contextmanager
+def profile_stage(name: str):
+    # no-op unless a Profiler is active on this thread
+    prof = active_profiler()
+    if prof is None:
+        yield
+        return
+    with prof.stage(name):
+        yield
+
+
+def profiled(stage: str) -> Callable:
+    """
+    Decorator: times every call of the function as `stage` when a Profiler
+    is active, and records it in STAGES.
+    """
+    def decorator(fn):
+        STAGES.setdefault(stage, []).append(f"{fn.__module__}.{fn.__qualname__}")
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if active_profiler() is None:
+                return fn(*args, **kwargs)
+            with profile_stage(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def merge_profiles(profiles: Iterable[Optional[dict]]) -> Optional[dict]:
+    # sums calls and wall time per stage, keeps the largest measured peak (NaN if none was)
+    merged: Dict[str, dict] = {}
+    seen = False
+    for p in profiles:
+        if not p:
+            continue
+        seen = True
+        for name, s in p.items():
+            m = merged.setdefault(name, {"calls": 0, "wall_s": 0.0, "peak_mb": math.nan})
+            m["calls"] += s["calls"]
+            m["wall_s"] += s["wall_s"]
+            if not math.isnan(s["peak_mb"]):
+                m["peak_mb"] = s["peak_mb"] if math.isnan(m["peak_mb"]) else max(m["peak_mb"], s["peak_mb"])
+    return merged if seen else None
+
+
+def format_profile(profile: Optional[dict], title: str = "Profile") -> str:
+    if not profile:
+        return f"{title}: no stages recorded."
+
+    width = max(len("stage"), *(len(n) for n in profile))
+    lines = [
+        f"{title}:",
+        f"  {'stage':<{width}}  {'calls':>6}  {'wall ms':>10}  {'peak MB':>8}",
+    ]
+    for name, s in profile.items():
+        peak = "n/a" if math.isnan(s["peak_mb"]) else f"{s['peak_mb']:.2f}"
+        lines.append(f"  {name:<{width}}  {s['calls']:>6}  {1e3 * s['wall_s']:>10.2f}  {peak:>8}")
+    return "\n".join(lines)
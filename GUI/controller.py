@@ -1,21 +1,56 @@
 # GUI/controller.py
 from __future__ import annotations
+import html
+from contextlib import nullcontext
+from pathlib import Path
+
 import numpy as np
-from PySide6.QtWidgets import QTableWidgetItem, QMessageBox, QFileDialog
+from PySide6.QtCore import QThreadPool, QTimer
+from PySide6.QtWidgets import QMessageBox, QFileDialog
 
+from CEA.CEARunner import of_grid
 from Core.engine_inputs import EngineInputs
-from Core.engine_analysis import engine_design_run
-from Core.exports import exportCEAResults, exportEngineData, exportNozzleDatapoints
-from Core.plots import plot_isp_vs_of, plot_temp_vs_of, plot_velocity_vs_of
-from Isentropic.bell_nozzle_geometry import bell_nozzle_graph
-from Isentropic.conical_nozzle_geometry import conical_nozzle_graph
-from Core.plots import plot_nozzle_geometry, plot_nozzle_revolution
+from GUI.workers import EngineRunWorker, ParetoWorker
+from Core.design_optimizer import design_value
+from Core.exports import exportCEAResults, exportEngineData, exportNozzleDatapoints, exportResults, loadResults
+from Core.profiling import Profiler, format_profile, profile_stage, profiling_enabled, set_profiling
+from Isentropic.bell_nozzle_geometry import bell_nozzle_contours
+from Isentropic.conical_nozzle_geometry import conical_nozzle_contours
+from GUI.viz_cache import LRUCache
 
 BAR_TO_PA = 1e5 # unit conversion from bar to pascals
 
+# trade-off combo text -> (pareto_search objectives, x-axis label); Isp is always on the y-axis
+PARETO_TRADES = {
+    "Isp vs Engine Length": (("Isp", "length"), "Engine Length (m)"),
+    "Isp vs Chamber Radius": (("Isp", "chamber_radius"), "Chamber Radius (m)"),
+}
+
+RESULTS_FILE_FILTER = "NumPy (*.npz);;Parquet (*.parquet);;Feather (*.feather);;HDF5 (*.h5 *.hdf5)"
+
+CONTOUR_CACHE_SIZE = 512   # (x, y) contours, a few KB each
+SURFACE_CACHE_SIZE = 12    # prebuilt 3D surface artists; the 2D contour is cheap to redraw
+PRERENDER_RADIUS = 2       # O/F neighbours on each side rendered while the UI is idle
+
 class MainController:
     def __init__(self, view):
         self.view = view
+        self._worker = None
+        self._stream_result = None
+        self._pareto_worker = None
+        self._pareto = None           # last ParetoResult
+        self._pareto_pick = None      # front index picked on the plot
+        self._ui_profiler = None  # set per run while profiling is on
+
+        # contours and 3D surfaces keyed by (run token, O/F index); the token changes per run
+        self._run_token = 0
+        self._contours = LRUCache(CONTOUR_CACHE_SIZE)
+        self._surfaces = LRUCache(SURFACE_CACHE_SIZE)
+        self._prerender_queue = []
+        self._prerender_timer = QTimer()
+        self._prerender_timer.setSingleShot(True)
+        self._prerender_timer.setInterval(0)  # fires once the event loop is idle
+        self._prerender_timer.timeout.connect(self._prerender_next)
         self.view.of_combo.currentIndexChanged.connect(self.on_of_combo_changed)
 
         # Your ui.py will emit these if you added the signals approach
@@ -23,6 +58,8 @@ class MainController:
             view.run_requested.connect(self.on_run)
         if hasattr(view, "reset_requested"):
             view.reset_requested.connect(self.on_reset)
+        if hasattr(view, "cancel_requested"):
+            view.cancel_requested.connect(self.on_cancel)
 
         if hasattr(view, "export_cea_requested"):
             view.export_cea_requested.connect(self.on_export_cea)
@@ -33,6 +70,24 @@ class MainController:
         if hasattr(view, "export_nozzle_requested"):
             view.export_nozzle_requested.connect(self.on_export_nozzle)
 
+        if hasattr(view, "save_results_requested"):
+            view.save_results_requested.connect(self.on_save_results)
+
+        if hasattr(view, "open_results_requested"):
+            view.open_results_requested.connect(self.on_open_results)
+
+        if hasattr(view, "action_profile"):
+            set_profiling(view.action_profile.isChecked())
+            view.action_profile.toggled.connect(self.on_profiling_toggled)
+
+        if hasattr(view, "action_lod"):
+            view.action_lod.toggled.connect(self.on_lod_toggled)
+
+        if hasattr(view, "pareto_requested"):
+            view.pareto_requested.connect(self.on_pareto_search)
+            view.pareto_apply_requested.connect(self.on_pareto_apply)
+            view.plots.on_pareto_pick = self._on_pareto_pick
+
         # If you did NOT add signals and still want controller ownership,
         # you can also directly override by rebinding:
         # view.on_run = self.on_run
@@ -43,16 +98,20 @@ class MainController:
         v._do_reset_ui()
 
         # also clear outputs table
-        for r in range(v.results_table.rowCount()):
-            v.results_table.setItem(r, 1, QTableWidgetItem("—"))
+        v.results_model.clear()
             
         self.view.reset_of_combo()
         self._last_results = None
         self._last_inputs = None
+        self._new_result_set()
 
     def on_run(self):
         v = self.view
 
+        if self._worker is not None:
+            v.statusBar().showMessage("A run is already in progress")
+            return
+
         try:
             eng_in = self._read_engine_inputs()
             self._last_inputs = eng_in
@@ -64,22 +123,107 @@ class MainController:
         v.console.append("Running analysis...")
         v.statusBar().showMessage("Running analysis...")
 
-        try:
-            results = engine_design_run(eng_in)
-        except Exception as e:
-            QMessageBox.critical(v, "Run failed", repr(e))
-            v.console.append(f"Run failed: {repr(e)}")
-            v.statusBar().showMessage("Run failed")
+        # solve off the UI thread; results come back through the worker's signals
+        worker = EngineRunWorker(eng_in, stream=True)
+        worker.signals.progress.connect(self._on_run_progress)
+        worker.signals.partial.connect(self._on_run_chunk)
+        worker.signals.finished.connect(self._on_run_finished)
+        worker.signals.failed.connect(self._on_run_failed)
+        worker.signals.cancelled.connect(self._on_run_cancelled)
+        self._worker = worker
+        self._stream_result = None
+        self._new_result_set()
+        self._progress_logged = -1
+        self._ui_profiler = Profiler() if profiling_enabled() else None
+
+        if hasattr(v, "set_running"):
+            v.set_running(True)
+        QThreadPool.globalInstance().start(worker)
+
+    def on_cancel(self):
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        self.view.statusBar().showMessage("Cancelling...")
+
+    def _run_done(self):
+        self._worker = None
+        self.view.plots.end_stream()
+        if hasattr(self.view, "set_running"):
+            self.view.set_running(False)
+
+    def _on_run_progress(self, done: int, total: int):
+        v = self.view
+        v.statusBar().showMessage(f"Solving CEA: {done}/{total} O/F points")
+
+        # console gets a line every 10%
+        pct = (100 * done) // max(total, 1)
+        if pct // 10 > self._progress_logged:
+            self._progress_logged = pct // 10
+            v.console.append(f"  CEA {done}/{total} ({pct}%)")
+
+    def _on_run_chunk(self, chunk):
+        with self._ui_profiler or nullcontext():
+            self._show_chunk(chunk)
+
+    def _show_chunk(self, so_far):
+        # so_far holds every point streamed in yet (views of the worker's buffer);
+        # the first one builds the table/plots, later ones append just the new rows
+        if self._stream_result is None:
+            self._stream_result = so_far
+            self._last_results = so_far
+            # pin the x-axis to the whole sweep so later slices can be blitted in
+            grid = of_grid(self._last_inputs)
+            more = grid.size > np.atleast_1d(so_far.cea.OF_Ratio).size
+            self._write_results(so_far, x_range=(float(grid.min()), float(grid.max())) if more else None)
+            self._populate_of_combo(so_far)
             return
 
+        start = np.atleast_1d(self._stream_result.cea.OF_Ratio).size
+        self._stream_result = so_far
+        self._last_results = so_far
+        self._append_results(so_far, start)
+
+    def _on_run_finished(self, results):
+        v = self.view
+        self._run_done()
+
         # Cache results ONLY after they exist
         self._last_results = results
 
-        self._write_results(results)
-        self._populate_of_combo(results)
+        if self._stream_result is None:
+            with self._ui_profiler or nullcontext():
+                self._write_results(results)
+                self._populate_of_combo(results)
+        self._stream_result = None
         v.console.append("Complete.")
         v.statusBar().showMessage("Complete")
 
+        # prerendering is held off while chunks are streaming in
+        shown = getattr(self, "_last_nozzle_xy", None)
+        if shown is not None:
+            self._schedule_prerender(shown["idx"])
+
+        if self._ui_profiler is not None:
+            self._log_profile(results.profile, "Run profile (worker thread)")
+            self._log_profile(self._ui_profiler.as_dict(), "Display profile (UI thread)")
+            self._ui_profiler = None
+
+    def _on_run_failed(self, message: str):
+        v = self.view
+        self._run_done()
+        QMessageBox.critical(v, "Run failed", message)
+        v.console.append(f"Run failed: {message}")
+        v.statusBar().showMessage("Run failed")
+
+    def _on_run_cancelled(self):
+        v = self.view
+        self._run_done()
+        self._stream_result = None  # partial rows stay on screen
+        self._ui_profiler = None
+        v.console.append("Run cancelled.")
+        v.statusBar().showMessage("Cancelled")
+
     def _choose_export_folder(self) -> str | None:
         folder = QFileDialog.getExistingDirectory(
             self.view,
@@ -149,19 +293,67 @@ class MainController:
             f"Exported nozzle datapoints (OF={of_val:.3f})"
         )
     
-    def on_theme_changed(self):
+    def on_save_results(self):
         if getattr(self, "_last_results", None) is None:
+            QMessageBox.warning(self.view, "No data", "Run an analysis first.")
+            return
+
+        path, _ = QFileDialog.getSaveFileName(self.view, "Save Results", "results.npz", RESULTS_FILE_FILTER)
+        if not path:
             return
-        self._write_results(self._last_results)
+
+        try:
+            paths = exportResults(self._last_results, self._last_inputs, str(Path(path).parent), Path(path).name)
+        except ValueError as e:
+            QMessageBox.warning(self.view, "Save failed", str(e))
+            return
+
+        for p in paths.values():
+            self.view.console.append(f"Saved results → {p}")
+
+    def on_open_results(self):
+        if self._worker is not None:
+            self.view.statusBar().showMessage("A run is already in progress")
+            return
+
+        path, _ = QFileDialog.getOpenFileName(self.view, "Open Results", "", RESULTS_FILE_FILTER)
+        if not path:
+            return
+
+        try:
+            results, inputs = loadResults(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self.view, "Open failed", str(e))
+            return
+        if inputs is None:
+            QMessageBox.warning(self.view, "Open failed", "This file has no engine inputs saved with it.")
+            return
+
+        # shown like a finished run; CEA isn't touched
+        self._last_inputs = inputs
+        self._last_results = results
+        self._new_result_set()
+        self._write_results(results)
+        self._populate_of_combo(results)
+        self.view.console.append(f"Opened results ← {path} ({results.cea.OF_Ratio.size} O/F points)")
+        self.view.statusBar().showMessage("Results loaded")
+
+    def on_theme_changed(self):
+        # plots are restyled in place; the table and the cached contours/surfaces stay as they are
+        self.view.plots.set_theme(self.view.theme_mode())
     # -----------------------
     # Build EngineInputs
     # -----------------------
-    def _read_engine_inputs(self) -> EngineInputs:
+    def _read_engine_inputs(self, pc_pa: float | None = None, of: float | None = None) -> EngineInputs:
+        # pc_pa / of override the panel's chamber pressure / O/F fields (e.g. for searches over them)
         v = self.view
 
         # UI label says bar; EngineInputs wants Pa
-        pc_bar = self._float_required(v.pc.text(), "Chamber Pressure (bar)")
-        chamber_pressure_pa = pc_bar * BAR_TO_PA
+        if pc_pa is None:
+            pc_bar = self._float_required(v.pc.text(), "Chamber Pressure (bar)")
+            chamber_pressure_pa = pc_bar * BAR_TO_PA
+        else:
+            chamber_pressure_pa = pc_pa
 
         thrust_n = self._float_required(v.thrust.text(), "Thrust (N)")
 
@@ -173,11 +365,19 @@ class MainController:
             amb_bar = self._float_required(v.amb.text(), "Ambient Pressure (bar)")
             amb_pa = amb_bar * BAR_TO_PA
 
+        eps_text = v.eps.text().strip()
+        expansion_ratio = self._float_required(eps_text, "Expansion ratio (Ae/At)") if eps_text else None
+        if expansion_ratio is not None and expansion_ratio <= 1.0:
+            raise ValueError("Expansion ratio (Ae/At) must be greater than 1.")
+
         frozen_flag = v.frozen.isChecked()
 
         # O/F single or sweep
         sweep = v.of_sweep.isChecked()
-        if sweep:
+        if of is not None:
+            of_val = of
+            of_min = of_max = of_inc = None
+        elif sweep:
             of_val = None
             of_min = self._float_required(v.of_min.text(), "O/F min")
             of_max = self._float_required(v.of_max.text(), "O/F max")
@@ -219,6 +419,7 @@ class MainController:
 
             external_pressure_flag=external_pressure_flag,
             ambient_pressure=amb_pa,
+            expansion_ratio=expansion_ratio,
 
             frozen_flag=frozen_flag,
 
@@ -239,13 +440,17 @@ class MainController:
     def _populate_of_combo(self, results):
         self.view.of_combo.blockSignals(True)
         self.view.of_combo.clear()
+        self._extend_of_combo(results, 0)
+        self.view.of_combo.setCurrentIndex(0)
+        self.view.of_combo.blockSignals(False)
 
+    def _extend_of_combo(self, results, start: int):
         of_values = results.cea.OF_Ratio
 
-        for i, of in enumerate(of_values):
-            self.view.of_combo.addItem(f"O/F = {of:.3f}", i)
+        # one addItems call rather than addItem per point; item i is O/F index i
+        self.view.of_combo.blockSignals(True)
+        self.view.of_combo.addItems([f"O/F = {of:.3f}" for of in of_values[start:].tolist()])
 
-        self.view.of_combo.setCurrentIndex(0)
         self.view.of_combo.setEnabled(len(of_values) > 1)
         self.view.of_combo.blockSignals(False)
 
@@ -253,19 +458,140 @@ class MainController:
         if getattr(self, "_last_results", None) is None:
             return
 
-        idx = self.view.of_combo.currentData()
-        if idx is None:
+        idx = self.view.of_combo.currentIndex()
+        if idx < 0:
+            return
+
+        if not profiling_enabled():
+            self._update_visualizations(idx)
             return
-        self._update_visualizations(idx)
+        with Profiler() as prof:
+            self._update_visualizations(idx)
+        self._log_profile(prof.as_dict(), f"O/F change profile (index {idx})")
+        c = self._surfaces.stats()
+        self.view.console.append(
+            f"Surface cache: {c['entries']}/{c['max_entries']} entries, {c['hits']} hits, {c['misses']} misses"
+        )
+
+    def on_lod_toggled(self, enabled: bool):
+        self.view.plots.set_lod(enabled)
+        self._surfaces.clear()
+        shown = getattr(self, "_last_nozzle_xy", None)
+        if getattr(self, "_last_results", None) is not None and shown is not None:
+            self._update_visualizations(shown["idx"])
+
     # -----------------------
-    # Write outputs
+    # pareto search
     # -----------------------
+    def on_pareto_search(self):
+        v = self.view
+        if self._pareto_worker is not None:
+            self._pareto_worker.cancel()
+            v.statusBar().showMessage("Stopping Pareto search...")
+            return
+
+        try:
+            of_lo = self._float_required(v.pareto_of_min.text(), "Pareto O/F min")
+            of_hi = self._float_required(v.pareto_of_max.text(), "Pareto O/F max")
+            pc_lo = self._float_required(v.pareto_pc_min.text(), "Pareto Pc min (bar)") * BAR_TO_PA
+            pc_hi = self._float_required(v.pareto_pc_max.text(), "Pareto Pc max (bar)") * BAR_TO_PA
+            # O/F and Pc come from the search box, everything else from the inputs panel
+            base = self._read_engine_inputs(pc_pa=pc_lo, of=of_lo)
+        except ValueError as e:
+            QMessageBox.warning(v, "Input error", str(e))
+            return
+
+        objectives, _ = PARETO_TRADES[v.pareto_trade.currentText()]
+        worker = ParetoWorker(
+            base, {"OF": (of_lo, of_hi), "chamber_pressure": (pc_lo, pc_hi)}, objectives,
+            pop_size=v.pareto_pop.value(), generations=v.pareto_gens.value(),
+        )
+        worker.signals.progress.connect(self._on_pareto_progress)
+        worker.signals.finished.connect(self._on_pareto_finished)
+        worker.signals.failed.connect(self._on_pareto_failed)
+        self._pareto_worker = worker
+        self._pareto_trade = v.pareto_trade.currentText()
+
+        v.pareto_run.setText("Stop")
+        v.console.append(f"Pareto search: {self._pareto_trade}...")
+        QThreadPool.globalInstance().start(worker)
 
-    def _write_results(self, results):
+    def _pareto_done(self):
+        self._pareto_worker = None
+        self.view.pareto_run.setText("Search")
+
+    def _on_pareto_progress(self, gen: int, total: int):
+        self.view.statusBar().showMessage(f"Pareto search: generation {gen}/{total}")
+
+    def _on_pareto_failed(self, message: str):
+        self._pareto_done()
+        QMessageBox.critical(self.view, "Pareto search failed", message)
+        self.view.console.append(f"Pareto search failed: {message}")
+
+    def _on_pareto_finished(self, result):
         v = self.view
-        if not hasattr(v, "results_table"):
+        self._pareto_done()
+        self._pareto = result
+        self._pareto_pick = None
+        v.pareto_apply.setEnabled(False)
+        v.pareto_detail.setText("Click a design on the front to see it here.")
+
+        _, xlabel = PARETO_TRADES[self._pareto_trade]
+        size = result.objectives[1]
+        v.plots.show_pareto(
+            design_value(result.history, size), design_value(result.history, "Isp"),
+            result.values[:, 1], result.values[:, 0],
+            xlabel, "Isp (s)", v.theme_mode(),
+        )
+        v.console.append(
+            f"Pareto search: {result.size} non-dominated designs from {result.n_evaluations} evaluated "
+            f"({result.n_cea_states} CEA states, {result.n_generations} generations)"
+        )
+        v.statusBar().showMessage("Pareto search complete")
+
+    def _on_pareto_pick(self, i: int):
+        result = self._pareto
+        if result is None:
+            return
+        self._pareto_pick = i
+        f = result.front
+        length = design_value(f, "length")[i]
+        radius = design_value(f, "chamber_radius")[i]
+        self.view.pareto_detail.setText(
+            f"O/F {f['OF'][i]:.3f}   Pc {f['chamber_pressure'][i] / BAR_TO_PA:.2f} bar   "
+            f"Isp {f['Isp'][i]:.2f} s   length {length:.4f} m   chamber radius {radius:.4f} m   ER {f['ER'][i]:.2f}"
+        )
+        self.view.pareto_apply.setEnabled(True)
+
+    def on_pareto_apply(self):
+        # copies the picked design's O/F and Pc into the inputs panel, ready to Run
+        if self._pareto is None or self._pareto_pick is None:
             return
+        v = self.view
+        inputs = self._pareto.inputs_at(self._pareto_pick)
+        v.of_sweep.setChecked(False)
+        v.mr.setText(f"{inputs.OF:.4f}")
+        v.pc.setText(f"{inputs.chamber_pressure / BAR_TO_PA:.3f}")
+        v.console.append(f"Inputs set to Pareto design: O/F {inputs.OF:.4f}, Pc {inputs.chamber_pressure / BAR_TO_PA:.3f} bar")
+
+    # -----------------------
+    # profiling
+    # -----------------------
+    def on_profiling_toggled(self, enabled: bool):
+        set_profiling(enabled)
+        self.view.console.append(
+            "Profiling on: runs report per-stage time and peak memory here." if enabled else "Profiling off."
+        )
+
+    def _log_profile(self, profile, title: str):
+        # <pre> keeps the columns aligned in the console
+        self.view.console.append(f"<pre>{html.escape(format_profile(profile, title))}</pre>")
+
+    # -----------------------
+    # Write outputs
+    # -----------------------
 
+    def _result_columns(self, results):
         # O/F array (adjust field name if yours differs)
         OF = np.asarray(results.cea.OF_Ratio)
 
@@ -279,46 +605,52 @@ class MainController:
         Tt = np.asarray(perf.T_throat)           # throat temperature from isentropic/analysis
         Te = np.asarray(perf.T_exit)             # exit temperature from isentropic/analysis
 
-        n = OF.size
-        v.results_table.setRowCount(n)
-
-        for i in range(n):
-            row = [
-                f"{float(OF[i]):.3f}",
-                f"{float(Isp[i]):.2f}",
-                f"{float(cstar[i]):.1f}",
-                f"{float(vexit[i]):.1f}",
-                f"{float(mdot[i]):.6f}",
-                f"{float(Tc[i]):.1f}",
-                f"{float(Tt[i]):.1f}",
-                f"{float(Te[i]):.1f}",
-            ]
-            for j, txt in enumerate(row):
-                v.results_table.setItem(i, j, QTableWidgetItem(txt))
+        return OF, Isp, cstar, vexit, mdot, Tc, Tt, Te
 
-        theme = self.view.theme_mode()  # expects "system" | "light" | "dark" | "barbie" / "brat"
+    def _performance_series(self, results):
+        OF, Isp, cstar, vexit, mdot, Tc, Tt, Te = self._result_columns(results)
+        # y arrays per metric, in the order Core.plots' draw_*_vs_of functions take them
+        return OF, {
+            "Isp vs O/F": (Isp,),
+            "Velocity vs O/F": (vexit, cstar),
+            "T vs O/F": (Tc, Tt, Te),
+        }
+
+    def _write_results(self, results, x_range=None):
+        v = self.view
+        if not hasattr(v, "results_table"):
+            return
 
-        fig_isp = plot_isp_vs_of(OF, Isp, theme=theme)
-        fig_vel = plot_velocity_vs_of(OF, vexit, cstar, theme=theme)
-        fig_tmp = plot_temp_vs_of(OF, Tc, Tt, Te, theme=theme)
+        with profile_stage("table"):
+            v.results_model.set_columns(self._result_columns(results))
 
-        self.view.set_plot_figures({
-            "Isp vs O/F": fig_isp,
-            "Velocity vs O/F": fig_vel,
-            "T vs O/F": fig_tmp,
-        })
+        theme = self.view.theme_mode()  # expects "system" | "light" | "dark" | "barbie" / "brat"
+
+        OF, series = self._performance_series(results)
+        with profile_stage("canvas"):
+            v.plots.set_performance(OF, series, theme, x_range=x_range)
         self._update_visualizations(idx=0)
-    
+
+    def _append_results(self, results, start: int):
+        # rows [start:] are new; the table and plots get views of the worker buffer, nothing is concatenated
+        v = self.view
+        if not hasattr(v, "results_table"):
+            return
+
+        with profile_stage("table"):
+            v.results_model.append_columns(self._result_columns(results))
+
+        OF, series = self._performance_series(results)
+        with profile_stage("canvas"):
+            v.plots.append_performance(OF, series)
+
+        self._extend_of_combo(results, start)
+
     def _update_visualizations(self, idx: int):
         results = self._last_results
-        inputs = self._last_inputs
         v = self.view
 
-        if results.nozzle.__class__.__name__.lower().startswith("bell"):
-            y, x = bell_nozzle_graph(results, inputs, idx=idx)
-        else:
-            xx, yy = conical_nozzle_graph(results, idx=idx)
-            x, y = xx, yy
+        (x, y), = self._contours_for([idx])
         # caches results
         self._last_nozzle_xy = {
             "idx": idx,
@@ -329,10 +661,74 @@ class MainController:
         }
 
         theme = v.theme_mode()
-        fig2d = plot_nozzle_geometry(x, y, theme=theme)
-        fig3d = plot_nozzle_revolution(x, y, theme=theme, n_theta=80)
+        key = (self._run_token, idx)
+        surface = self._surfaces.get(key)
+
+        with profile_stage("canvas"):
+            surface = v.plots.show_nozzle(x, y, theme, surface)
+        self._surfaces.put(key, surface)
+
+        if self._worker is None:
+            self._schedule_prerender(idx)
+
+    # -----------------------
+    # contour / surface caches
+    # -----------------------
+    def _new_result_set(self):
+        self._run_token += 1
+        self._contours.clear()
+        self._surfaces.clear()
+        self._prerender_queue = []
+        self._prerender_timer.stop()
+
+    def _contours_for(self, indices):
+        # (x radial, y axial) per O/F index; misses are generated together in one batched call
+        results = self._last_results
+        token = self._run_token
+        missing = [i for i in indices if (token, i) not in self._contours]
+
+        if missing:
+            with profile_stage("contour"):
+                if results.nozzle.__class__.__name__.lower().startswith("bell"):
+                    axial, radial = bell_nozzle_contours(results, self._last_inputs, idx=missing)
+                else:
+                    radial, axial = conical_nozzle_contours(results, idx=missing)
+            for k, i in enumerate(missing):
+                self._contours.put((token, i), (radial[k], axial[k]))
+
+        return [self._contours.get((token, i)) for i in indices]
+
+    def _schedule_prerender(self, idx: int):
+        # nearest neighbours first; replaces whatever was queued for the previous selection
+        n = np.atleast_1d(self._last_results.cea.OF_Ratio).size
+        token = self._run_token
+        order = [idx + d * side for d in range(1, PRERENDER_RADIUS + 1) for side in (1, -1)]
+        self._prerender_queue = [
+            (token, i) for i in order
+            if 0 <= i < n and (token, i) not in self._surfaces
+        ]
+        if self._prerender_queue:
+            self._prerender_timer.start()
+
+    def _prerender_next(self):
+        # one surface per idle tick so clicks and scrolling are handled in between
+        if not self._prerender_queue or self._last_results is None:
+            return
+
+        if self._prerender_queue[0][0] != self._run_token:
+            self._prerender_queue = []
+            return
+
+        # contours for the whole queue in one batch (already-cached ones are skipped)
+        queued = [i for _, i in self._prerender_queue]
+        (x, y), = self._contours_for(queued)[:1]
+
+        key = self._prerender_queue.pop(0)
+        if key not in self._surfaces:
+            self._surfaces.put(key, self.view.plots.prepare_surface(x, y, self.view.theme_mode()))
 
-        v.set_viz_figures(fig2d, fig3d)
+        if self._prerender_queue:
+            self._prerender_timer.start()
 
     # -----------------------
     # parsing helpers
@@ -0,0 +1,406 @@
+# GUI/plot_manager.py
+from __future__ import annotations
+
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+
+import numpy as np
+
+STREAM_Y_HEADROOM = 0.25   # fraction of the data span added above/below while streaming, so most chunks fit
+
+
+@lru_cache(maxsize=None)
+def _toolbar_class():
+    # defined on first use so the Qt backend isn't imported with this module
+    from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
+
+    class Toolbar(NavigationToolbar2QT):
+        # the save button runs inside save_context(), e.g. to swap in full detail
+        def __init__(self, canvas, parent, save_context=None):
+            self._save_context = save_context
+            super().__init__(canvas, parent)
+
+        def save_figure(self, *args):
+            with (self._save_context or nullcontext)():
+                return super().save_figure(*args)
+
+    return Toolbar
+
+
+def _mpl_canvas(fig, parent, save_context=None):
+    # matplotlib's Qt backend is only imported once there's a figure to show
+    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+
+    canvas = FigureCanvasQTAgg(fig)
+    toolbar = _toolbar_class()(canvas, parent, save_context)
+    return canvas, toolbar
+
+
+def _performance_drawers():
+    from Core.plots import draw_isp_vs_of, draw_temp_vs_of, draw_velocity_vs_of
+
+    return {
+        "Isp vs O/F": draw_isp_vs_of,
+        "Velocity vs O/F": draw_velocity_vs_of,
+        "T vs O/F": draw_temp_vs_of,
+    }
+
+
+class _View:
+    # one Figure/canvas/toolbar that lives as long as the window
+    def __init__(self, layout, parent, figsize, save_context=None):
+        from matplotlib.figure import Figure
+
+        self.fig = Figure(figsize=figsize, dpi=120)
+        self.canvas, self.toolbar = _mpl_canvas(self.fig, parent, save_context)
+        layout.addWidget(self.toolbar)
+        layout.addWidget(self.canvas)
+        self.theme = None
+
+    def redraw(self):
+        # new data means a new "home" view for the toolbar's back/forward/home
+        self.toolbar.update()
+        self.canvas.draw_idle()
+
+
+class PlotManager:
+    """
+    Owns the plot canvases of the main window: one persistent figure per view
+    (performance, 2D nozzle, 3D nozzle, Pareto front), created on first use
+    and updated in place afterwards instead of building new figures and
+    canvases per update.
+
+    While a run is streaming the performance lines are animated and new chunks
+    are blitted over a cached background; a full redraw only happens when the
+    data leaves the current y-limits (or the canvas is resized).
+
+    With lod on, the 3D nozzle is drawn at a level of detail matched to its
+    size on screen (Core.plots.nozzle_surface), drops to a coarser surface
+    while it's being rotated, and is saved from the toolbar at full detail.
+    """
+
+    def __init__(self, parent, performance_layout, nozzle2d_layout, nozzle3d_layout, lod: bool = True,
+                 pareto_layout=None):
+        self._parent = parent
+        self._layouts = {
+            "performance": (performance_layout, (6, 4)),
+            "nozzle2d": (nozzle2d_layout, (4.5, 7.0)),
+            "nozzle3d": (nozzle3d_layout, (7, 4.5)),
+            "pareto": (pareto_layout, (6, 4)),
+        }
+        self._views = {}
+
+        self.on_pareto_pick = None    # called with the front index of a clicked Pareto design
+
+        self.metric = "Isp vs O/F"
+        self._perf = None             # (of, {metric: (y, ...)}, theme)
+        self._streaming = False
+        self._background = None
+
+        self.lod = lod
+        self._nozzle = None           # (x, y, theme) of the contour on screen
+        self._surface = None          # its 3D surface
+        self._coarse = None           # lower-detail stand-in used while rotating
+
+    def _view(self, name: str) -> _View:
+        v = self._views.get(name)
+        if v is None:
+            layout, figsize = self._layouts[name]
+            if name == "nozzle3d":
+                v = self._views[name] = _View(layout, self._parent, figsize, save_context=self._full_detail)
+                v.canvas.mpl_connect("button_press_event", self._on_3d_press)
+                v.canvas.mpl_connect("button_release_event", self._on_3d_release)
+            else:
+                v = self._views[name] = _View(layout, self._parent, figsize)
+            if name == "performance":
+                v.canvas.mpl_connect("draw_event", self._on_performance_draw)
+            if name == "pareto":
+                v.canvas.mpl_connect("pick_event", self._on_pareto_pick)
+        return v
+
+    # -----------------------
+    # performance plots
+    # -----------------------
+    def set_performance(self, of, series: dict, theme: str, x_range=None):
+        """
+        series maps metric name -> y arrays in the order the draw_*_vs_of
+        functions take them. Passing x_range (the full O/F sweep) starts
+        streaming mode: x-limits stay put and append_performance blits.
+        """
+        self._perf = (of, series, theme)
+        self._streaming = x_range is not None
+        self._draw_metric(x_range)
+
+    def append_performance(self, of, series: dict):
+        if self._perf is None:
+            return
+        self._perf = (of, series, self._perf[2])
+
+        v = self._view("performance")
+        ax = v.fig.axes[0]
+        for line, y in zip(ax.lines, series[self.metric]):
+            line.set_data(of, y)
+
+        if not self._streaming:
+            ax.relim()
+            ax.autoscale_view()
+            v.canvas.draw_idle()
+            return
+
+        lo, hi = ax.get_ylim()
+        ymin, ymax = self._y_span(series[self.metric])
+        if self._background is None or ymin < lo or ymax > hi:
+            self._fit_stream_ylim(ax, series[self.metric])
+            v.canvas.draw_idle()  # draw_event grabs a new background
+            return
+
+        v.canvas.restore_region(self._background)
+        for line in ax.lines:
+            v.fig.draw_artist(line)
+        v.canvas.blit(v.fig.bbox)
+
+    def end_stream(self):
+        if not self._streaming:
+            return
+        self._streaming = False
+        self._background = None
+        if self._perf is None:
+            return
+
+        v = self._view("performance")
+        ax = v.fig.axes[0]
+        for line in ax.lines:
+            line.set_animated(False)
+        ax.relim()
+        ax.autoscale_view()
+        v.redraw()
+
+    def select_performance(self, name: str):
+        self.metric = name
+        if self._perf is None:
+            return
+        x_range = self._view("performance").fig.axes[0].get_xlim() if self._streaming else None
+        self._draw_metric(x_range)
+
+    def _draw_metric(self, x_range=None):
+        of, series, theme = self._perf
+        v = self._view("performance")
+        _performance_drawers()[self.metric](v.fig, of, *series[self.metric], theme=theme)
+        v.theme = theme
+        self._background = None
+
+        if x_range is not None:
+            ax = v.fig.axes[0]
+            ax.set_xlim(*x_range)
+            self._fit_stream_ylim(ax, series[self.metric])
+            for line in ax.lines:
+                line.set_animated(True)
+        v.redraw()
+
+    @staticmethod
+    def _y_span(ys):
+        finite = [np.asarray(y, dtype=float) for y in ys if y is not None and np.size(y)]
+        if not finite:
+            return 0.0, 1.0
+        return min(float(np.nanmin(y)) for y in finite), max(float(np.nanmax(y)) for y in finite)
+
+    def _fit_stream_ylim(self, ax, ys):
+        ymin, ymax = self._y_span(ys)
+        pad = STREAM_Y_HEADROOM * ((ymax - ymin) or abs(ymax) or 1.0)
+        ax.set_ylim(ymin - pad, ymax + pad)
+
+    def _on_performance_draw(self, _event):
+        # full redraws (resize, zoom, new limits) leave the animated lines out: keep
+        # that as the blit background, then draw the lines on top
+        if not self._streaming:
+            return
+        v = self._views["performance"]
+        self._background = v.canvas.copy_from_bbox(v.fig.bbox)
+        for line in v.fig.axes[0].lines:
+            v.fig.draw_artist(line)
+
+    # -----------------------
+    # pareto front
+    # -----------------------
+    def show_pareto(self, x_all, y_all, x_front, y_front, xlabel: str, ylabel: str, theme: str):
+        from Core.plots import draw_pareto_front
+
+        v = self._view("pareto")
+        draw_pareto_front(v.fig, x_all, y_all, x_front, y_front, xlabel=xlabel, ylabel=ylabel, theme=theme)
+        v.theme = theme
+        v.redraw()
+
+    def mark_pareto(self, i: int):
+        # ring front design i (index into the x_front/y_front given to show_pareto)
+        from Core.plots import mark_pareto_point
+
+        v = self._views.get("pareto")
+        if v is None or not v.fig.axes:
+            return
+        front = v.fig.axes[0].lines[1]
+        pos = int(np.flatnonzero(front._pareto_order == i)[0])
+        mark_pareto_point(v.fig, front.get_xdata()[pos], front.get_ydata()[pos])
+        v.canvas.draw_idle()
+
+    def _on_pareto_pick(self, event):
+        line = event.artist
+        order = getattr(line, "_pareto_order", None)
+        if order is None or not len(event.ind):
+            return
+
+        # of the points within the pick radius, the one closest to the click
+        ind = np.asarray(event.ind)
+        px = line.axes.transData.transform(line.get_xydata()[ind])
+        pos = int(ind[np.argmin(np.hypot(px[:, 0] - event.mouseevent.x, px[:, 1] - event.mouseevent.y))])
+        i = int(order[pos])
+
+        self.mark_pareto(i)
+        if self.on_pareto_pick is not None:
+            self.on_pareto_pick(i)
+
+    # -----------------------
+    # nozzle views
+    # -----------------------
+    def _axes3d(self, theme: str):
+        from Core.plots import style_revolution_axes
+
+        v = self._view("nozzle3d")
+        if not v.fig.axes:
+            ax = v.fig.add_subplot(111, projection="3d")
+            style_revolution_axes(v.fig, ax, theme)
+            v.theme = theme
+        return v.fig.axes[0]
+
+    def _detached_surface(self, ax, x, y, theme: str, **kwargs):
+        # nozzle_surface adds to ax and rescales it; undo both so the view on screen is untouched
+        from Core.plots import nozzle_surface
+
+        limits = ax.get_xlim3d(), ax.get_ylim3d(), ax.get_zlim3d()
+        surface = nozzle_surface(ax, x, y, theme=theme, **kwargs)
+        surface.remove()
+        ax.set_xlim3d(limits[0])
+        ax.set_ylim3d(limits[1])
+        ax.set_zlim3d(limits[2])
+        return surface
+
+    def prepare_surface(self, x, y, theme: str):
+        """
+        Builds the 3D surface for (x, y) without showing it; the returned
+        artist can be handed to show_nozzle later.
+        """
+        return self._detached_surface(self._axes3d(theme), x, y, theme, lod=self.lod)
+
+    def _surface_fits(self, surface, ax, x, y) -> bool:
+        # cached surfaces go stale when lod is toggled or the canvas is resized enough to change n_theta
+        from Core.plots import screen_theta_samples
+
+        if getattr(surface, "_lod", None) != self.lod:
+            return False
+        return not self.lod or surface._n_theta == screen_theta_samples(ax, x, y)
+
+    def show_nozzle(self, x, y, theme: str, surface=None):
+        """
+        Shows the contour (x radial, y axial) in both nozzle views and returns
+        the 3D surface artist so callers can cache it.
+        """
+        from Core.plot_style import apply_mpl_theme, recolor_artists
+        from Core.plots import draw_nozzle_geometry, set_nozzle_surface, style_revolution_axes, update_nozzle_geometry
+
+        v2 = self._view("nozzle2d")
+        if not v2.fig.axes:
+            draw_nozzle_geometry(v2.fig, x, y, theme=theme)
+        else:
+            update_nozzle_geometry(v2.fig, x, y)
+            if v2.theme != theme:
+                apply_mpl_theme(v2.fig, v2.fig.axes[0], theme)
+        v2.theme = theme
+        v2.redraw()
+
+        v3 = self._view("nozzle3d")
+        ax = self._axes3d(theme)
+        if v3.theme != theme:
+            style_revolution_axes(v3.fig, ax, theme)
+            v3.theme = theme
+        if surface is None or not self._surface_fits(surface, ax, x, y):
+            surface = self.prepare_surface(x, y, theme)
+        else:
+            recolor_artists([surface], theme)  # cached surfaces may predate a theme change
+        set_nozzle_surface(ax, surface, x, y)
+        v3.redraw()
+
+        self._nozzle = (x, y, theme)
+        self._surface = surface
+        self._coarse = None
+        return surface
+
+    def set_lod(self, enabled: bool):
+        # takes effect from the next show_nozzle
+        self.lod = bool(enabled)
+
+    def _swap_surface(self, old, new):
+        ax = self._views["nozzle3d"].fig.axes[0]
+        if old.axes is not None:
+            old.remove()
+        if new.axes is None:
+            ax.add_collection3d(new, autolim=False)
+
+    def _on_3d_press(self, event):
+        # rotate a coarse copy: mplot3d re-sorts and redraws every face on each mouse move
+        from Core.plot_style import recolor_artists
+        from Core.plots import LOD_MAX_SEGMENT, LOD_TURN_DEG, lod_contour
+
+        if not self.lod or self._surface is None or event.inaxes is None or self._surface.axes is None:
+            return
+        x, y, theme = self._nozzle
+        if self._coarse is None:
+            keep = lod_contour(x, y, 2 * LOD_TURN_DEG, 2 * LOD_MAX_SEGMENT)
+            n_theta = max(8, self._surface._n_theta // 2)
+            self._coarse = self._detached_surface(event.inaxes, x[keep], y[keep], theme, n_theta=n_theta, lod=True)
+        recolor_artists([self._coarse], self._views["nozzle3d"].theme)
+        self._swap_surface(self._surface, self._coarse)
+
+    def _on_3d_release(self, _event):
+        if self._coarse is None or self._coarse.axes is None:
+            return
+        self._swap_surface(self._coarse, self._surface)
+        self._views["nozzle3d"].canvas.draw_idle()
+
+    @contextmanager
+    def _full_detail(self):
+        # exports get the fixed full detail (Core.plots.full_contour, FULL_N_THETA), whatever is on screen
+        if not self.lod or self._surface is None or self._surface.axes is None:
+            yield
+            return
+        x, y, _ = self._nozzle
+        v = self._views["nozzle3d"]
+        full = self._detached_surface(v.fig.axes[0], x, y, v.theme, lod=False)
+        self._swap_surface(self._surface, full)
+        try:
+            yield
+        finally:
+            self._swap_surface(full, self._surface)
+            v.canvas.draw_idle()
+
+    # -----------------------
+    # theme
+    # -----------------------
+    def set_theme(self, theme: str):
+        """
+        Restyles every plot already on screen in place: colours change, data
+        and layout don't, so the cost doesn't depend on the sweep size.
+        """
+        from Core.plot_style import apply_mpl_theme
+        from Core.plots import style_revolution_axes
+
+        if self._perf is not None:
+            self._perf = (self._perf[0], self._perf[1], theme)
+
+        for name, v in self._views.items():
+            if not v.fig.axes or v.theme == theme:
+                continue
+            if name == "nozzle3d":
+                style_revolution_axes(v.fig, v.fig.axes[0], theme)
+            else:
+                apply_mpl_theme(v.fig, v.fig.axes[0], theme)
+            v.theme = theme
+            v.canvas.draw_idle()  # also refreshes the blit background mid-stream
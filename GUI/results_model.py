@@ -0,0 +1,160 @@
+# GUI/results_model.py
+from __future__ import annotations
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# (header, format spec) per column, in MainController._result_columns order
+RESULT_COLUMNS = [
+    ("O/F", ".3f"),
+    ("Isp (s)", ".2f"),
+    ("c* (m/s)", ".1f"),
+    ("Exit Velocity (m/s)", ".1f"),
+    ("mdot (kg/s)", ".6f"),
+    ("Chamber Temp (K)", ".1f"),
+    ("Throat Temp (K)", ".1f"),
+    ("Exit Temp (K)", ".1f"),
+]
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """
+    Read-only table over the result arrays themselves. Cells are formatted
+    when the view asks for them (so only the visible ones are), and sorting
+    and filtering only reorder an index array with NumPy; nothing is created
+    per cell, so 100k+ row sweeps cost about what the arrays do.
+
+    The vertical header shows each row's position in the sweep, which stays
+    put when the table is sorted or filtered.
+    """
+
+    def __init__(self, columns=RESULT_COLUMNS, parent=None):
+        super().__init__(parent)
+        self._headers = [h for h, _ in columns]
+        self._formats = [f for _, f in columns]
+        self._data = [np.empty(0) for _ in columns]
+        self._rows = np.arange(0)     # sweep row shown at each table row
+        self._sort = None             # (column, Qt.SortOrder)
+        self._filter = None           # (column, lo, hi); None bounds are open
+
+    # -----------------------
+    # Qt model interface
+    # -----------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else int(self._rows.size)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            c = index.column()
+            return format(float(self._data[c][self._rows[index.row()]]), self._formats[c])
+        if role == Qt.UserRole:
+            return float(self._data[index.column()][self._rows[index.row()]])
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        return str(int(self._rows[section]) + 1)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort = (column, order)
+        self._relayout()
+
+    # -----------------------
+    # data
+    # -----------------------
+    @property
+    def source_rows(self) -> int:
+        return int(self._data[0].size)
+
+    def clear(self):
+        self.set_columns([np.empty(0) for _ in self._headers])
+
+    def set_columns(self, columns):
+        # one array per column, all the same length
+        self.beginResetModel()
+        self._data = [np.asarray(col, dtype=float) for col in columns]
+        self._rows = self._view_rows()
+        self.endResetModel()
+
+    def append_columns(self, columns):
+        """
+        columns are the full arrays with new rows on the end (a streamed run
+        growing). When the new rows land after everything already shown, as
+        in sweep order or sorted by O/F, the rows are inserted; otherwise the
+        view is rebuilt.
+        """
+        old = self._rows
+        self._data = [np.asarray(col, dtype=float) for col in columns]
+        rows = self._view_rows()
+
+        if rows.size >= old.size and np.array_equal(rows[:old.size], old):
+            if rows.size > old.size:
+                self.beginInsertRows(QModelIndex(), old.size, rows.size - 1)
+                self._rows = rows
+                self.endInsertRows()
+            return
+
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def set_range_filter(self, column: int, lo=None, hi=None):
+        self._filter = None if lo is None and hi is None else (column, lo, hi)
+        self.beginResetModel()
+        self._rows = self._view_rows()
+        self.endResetModel()
+
+    def clear_filter(self):
+        self.set_range_filter(0)
+
+    def column_values(self, column: int) -> np.ndarray:
+        # values in table order, e.g. for exporting what's on screen
+        return self._data[column][self._rows]
+
+    # -----------------------
+    # helpers
+    # -----------------------
+    def _view_rows(self) -> np.ndarray:
+        rows = np.arange(self.source_rows)
+
+        if self._filter is not None:
+            column, lo, hi = self._filter
+            values = self._data[column]
+            keep = np.ones(rows.size, dtype=bool)
+            if lo is not None:
+                keep &= values >= lo
+            if hi is not None:
+                keep &= values <= hi
+            rows = rows[keep]
+
+        if self._sort is not None:
+            column, order = self._sort
+            values = self._data[column][rows]
+            # negated rather than reversed, so both directions keep ties in sweep order and NaN rows last
+            if order == Qt.DescendingOrder:
+                values = -values
+            rows = rows[np.argsort(values, kind="stable")]
+        return rows
+
+    def _relayout(self):
+        # same rows, new order: keep selections/current index on the same sweep rows
+        self.layoutAboutToBeChanged.emit()
+        old = self._rows
+        self._rows = self._view_rows()
+
+        where = np.empty(self.source_rows, dtype=np.intp)
+        where[self._rows] = np.arange(self._rows.size)
+        persistent = self.persistentIndexList()
+        moved = [self.index(int(where[old[i.row()]]), i.column()) for i in persistent]
+        self.changePersistentIndexList(persistent, moved)
+        self.layoutChanged.emit()
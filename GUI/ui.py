@@ -1,17 +1,17 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QDockWidget, QTabWidget, QApplication,
-    QTreeWidget, QTreeWidgetItem, QTextEdit, QTableWidget,
+    QTreeWidget, QTreeWidgetItem, QTextEdit, QTableView, QHeaderView,
     QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox,
-    QLineEdit, QComboBox, QLabel, QToolBar, QMessageBox, QCheckBox, 
+    QLineEdit, QComboBox, QLabel, QToolBar, QMessageBox, QCheckBox, QPushButton, QSpinBox,
 )
 from PySide6.QtGui import QAction, QDoubleValidator, QActionGroup
 from PySide6.QtCore import Qt, Signal, QSettings, QSignalBlocker
 from .themes import apply_theme
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from Data import Fuels, Oxidizers
 from .widgets import make_searchable
 from .version import __version__
+from .plot_manager import PlotManager
+from .results_model import RESULT_COLUMNS, ResultsTableModel
 
 
 class MainWindow(QMainWindow):
@@ -19,11 +19,18 @@ class MainWindow(QMainWindow):
     # run and reset 
     run_requested = Signal()
     reset_requested = Signal()
+    cancel_requested = Signal()
 
     # exports
     export_cea_requested = Signal()
     export_engine_requested = Signal()
     export_nozzle_requested = Signal()
+    save_results_requested = Signal()
+    open_results_requested = Signal()
+
+    # pareto search
+    pareto_requested = Signal()
+    pareto_apply_requested = Signal()
 
     def __init__(self):
         super().__init__()
@@ -55,6 +62,19 @@ class MainWindow(QMainWindow):
         self.action_toggle_bottom = self._action("Toggle Console", self._toggle_bottom)
         view_menu.addActions([self.action_toggle_left, self.action_toggle_right, self.action_toggle_bottom])
 
+        # per-stage timings in the console; the controller reads and connects this
+        view_menu.addSeparator()
+        self.action_profile = QAction("Profile Runs", self, checkable=True)
+        self.action_profile.setChecked(self.settings.value("debug/profile", False, type=bool))
+        self.action_profile.toggled.connect(lambda on: self.settings.setValue("debug/profile", on))
+        view_menu.addAction(self.action_profile)
+
+        # 3D nozzle drawn at screen resolution (full detail when saved); the controller connects this
+        self.action_lod = QAction("Level-of-Detail 3D View", self, checkable=True)
+        self.action_lod.setChecked(self.settings.value("viz/lod", True, type=bool))
+        self.action_lod.toggled.connect(lambda on: self.settings.setValue("viz/lod", on))
+        view_menu.addAction(self.action_lod)
+
         help_menu = self.menuBar().addMenu("Help")
         help_menu.addAction(self._action("About", self._about))
 
@@ -128,8 +148,11 @@ class MainWindow(QMainWindow):
         # Create toolbars for each tab
         self.tb_inputs = self._make_toolbar("Inputs", [
             ("Run", self.on_run),
+            ("Cancel", self.cancel_requested.emit),
             ("Reset", self.on_reset),
         ])
+        self.action_run, self.action_cancel, self.action_reset = self.tb_inputs.actions()
+        self.action_cancel.setEnabled(False)
         #self.tb_nozzle = self._make_toolbar("Nozzle", [
             #("Generate", self._noop),
             #("Preview", self._noop),
@@ -138,6 +161,8 @@ class MainWindow(QMainWindow):
             ("Export CEA", self.export_cea_requested.emit),
             ("Export Engine Data", self.export_engine_requested.emit),
             ("Export CAD Datapoints", self.export_nozzle_requested.emit),
+            ("Save Results", self.save_results_requested.emit),
+            ("Open Results", self.open_results_requested.emit),
         ])
 
         # Add tabs (each tab content is a small placeholder widget)
@@ -292,6 +317,10 @@ class MainWindow(QMainWindow):
         self.amb.setEnabled(False)
         self.std_amb.toggled.connect(self._on_std_ambient_toggled)
 
+        # fixed expansion ratio; blank = expand to the ambient pressure
+        self.eps = QLineEdit()
+        self.eps.setPlaceholderText("Match ambient")
+
         # convergence angle
         self.convergence_angle = QLineEdit()
         self.convergence_angle.setPlaceholderText("45")
@@ -331,6 +360,7 @@ class MainWindow(QMainWindow):
         # ambient pressure
         f2.addRow(self.std_amb)
         f2.addRow("Ambient:", self.amb)
+        f2.addRow("Expansion Ratio (Ae/At):", self.eps)
 
         # nozzle paramters
         f2.addRow("Convergence Angle (degrees):", self.convergence_angle)
@@ -384,12 +414,44 @@ class MainWindow(QMainWindow):
         results = QWidget()
         results_layout = QVBoxLayout(results)
 
-        self.results_table = QTableWidget(0, 8)
-        self.results_table.setHorizontalHeaderLabels([
-            "O/F", "Isp (s)", "c* (m/s)", "Exit Velocity (m/s)", "mdot (kg/s)",
-            "Chamber Temp (K)", "Throat Temp (K)", "Exit Temp (K)"
-            ])
-        
+        # filter: rows whose chosen column lies in [min, max] (either bound may be blank)
+        filter_row = QHBoxLayout()
+        self.filter_column = QComboBox()
+        self.filter_column.addItems([h for h, _ in RESULT_COLUMNS])
+        self.filter_min = QLineEdit()
+        self.filter_min.setPlaceholderText("min")
+        self.filter_max = QLineEdit()
+        self.filter_max.setPlaceholderText("max")
+        self.filter_clear = QPushButton("Clear")
+        self.filter_count = QLabel("")
+        for edit in (self.filter_min, self.filter_max):
+            edit.setValidator(QDoubleValidator())
+            edit.editingFinished.connect(self._apply_results_filter)
+        self.filter_column.currentIndexChanged.connect(self._apply_results_filter)
+        self.filter_clear.clicked.connect(self._clear_results_filter)
+
+        filter_row.addWidget(QLabel("Filter:"))
+        filter_row.addWidget(self.filter_column)
+        filter_row.addWidget(self.filter_min)
+        filter_row.addWidget(QLabel("to"))
+        filter_row.addWidget(self.filter_max)
+        filter_row.addWidget(self.filter_clear)
+        filter_row.addStretch(1)
+        filter_row.addWidget(self.filter_count)
+        results_layout.addLayout(filter_row)
+
+        # model reads the result arrays directly; cells are formatted only when drawn
+        self.results_model = ResultsTableModel(parent=self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        self.results_table.setSortingEnabled(True)
+        self.results_table.sortByColumn(0, Qt.AscendingOrder)
+        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)  # no per-row size hints
+        self.results_table.verticalHeader().setDefaultSectionSize(22)
+        for sig in (self.results_model.modelReset, self.results_model.rowsInserted):
+            sig.connect(self._update_filter_count)
+
         results_layout.addWidget(self.results_table)
         tabs.addTab(results, "Results")
 
@@ -400,7 +462,7 @@ class MainWindow(QMainWindow):
         top_row = QHBoxLayout()
         self.metric_combo = QComboBox()
         self.metric_combo.addItems(["Isp vs O/F", "Velocity vs O/F", "T vs O/F"])
-        self.metric_combo.currentIndexChanged.connect(self._render_selected_plot)
+        self.metric_combo.currentTextChanged.connect(self._on_metric_changed)
         top_row.addWidget(QLabel("Metric:"))
         top_row.addWidget(self.metric_combo)
         top_row.addStretch(1)
@@ -409,10 +471,6 @@ class MainWindow(QMainWindow):
         self.plot_widget = QWidget()
         self.plot_widget_layout = QVBoxLayout(self.plot_widget)
 
-        # Keep references to avoid GC
-        self._plot_toolbar = None
-        self._plot_canvas = None
-
         plots_layout.addWidget(self.plot_widget, 1)
 
         tabs.addTab(plots, "Plots")
@@ -448,9 +506,70 @@ class MainWindow(QMainWindow):
         # add plots row to main vertical layout
         viz_layout.addLayout(plots_row, 1)
 
-
         tabs.addTab(viz, "Visualization")
 
+        # Pareto: Isp against engine size over an O/F x Pc box
+        pareto = QWidget()
+        pareto_layout = QVBoxLayout(pareto)
+
+        search_row = QHBoxLayout()
+        self.pareto_trade = QComboBox()
+        self.pareto_trade.addItems(["Isp vs Engine Length", "Isp vs Chamber Radius"])
+        self.pareto_of_min = QLineEdit("1.5")
+        self.pareto_of_max = QLineEdit("3.5")
+        self.pareto_pc_min = QLineEdit("10")
+        self.pareto_pc_max = QLineEdit("60")
+        for edit in (self.pareto_of_min, self.pareto_of_max, self.pareto_pc_min, self.pareto_pc_max):
+            edit.setValidator(QDoubleValidator(0.0, 5000.0, 4, self))
+            edit.setMaximumWidth(70)
+        self.pareto_pop = QSpinBox()
+        self.pareto_pop.setRange(8, 400)
+        self.pareto_pop.setValue(40)
+        self.pareto_gens = QSpinBox()
+        self.pareto_gens.setRange(1, 500)
+        self.pareto_gens.setValue(30)
+        self.pareto_run = QPushButton("Search")
+        self.pareto_run.clicked.connect(self.pareto_requested.emit)
+
+        search_row.addWidget(QLabel("Trade:"))
+        search_row.addWidget(self.pareto_trade)
+        search_row.addWidget(QLabel("O/F"))
+        search_row.addWidget(self.pareto_of_min)
+        search_row.addWidget(QLabel("to"))
+        search_row.addWidget(self.pareto_of_max)
+        search_row.addWidget(QLabel("Pc (Bar)"))
+        search_row.addWidget(self.pareto_pc_min)
+        search_row.addWidget(QLabel("to"))
+        search_row.addWidget(self.pareto_pc_max)
+        search_row.addWidget(QLabel("Population:"))
+        search_row.addWidget(self.pareto_pop)
+        search_row.addWidget(QLabel("Generations:"))
+        search_row.addWidget(self.pareto_gens)
+        search_row.addWidget(self.pareto_run)
+        search_row.addStretch(1)
+        pareto_layout.addLayout(search_row)
+
+        self.pareto_widget = QWidget()
+        self.pareto_plot_layout = QVBoxLayout(self.pareto_widget)
+        pareto_layout.addWidget(self.pareto_widget, 1)
+
+        detail_row = QHBoxLayout()
+        self.pareto_detail = QLabel("Click a design on the front to see it here.")
+        self.pareto_apply = QPushButton("Use Design")
+        self.pareto_apply.setEnabled(False)
+        self.pareto_apply.clicked.connect(self.pareto_apply_requested.emit)
+        detail_row.addWidget(self.pareto_detail, 1)
+        detail_row.addWidget(self.pareto_apply)
+        pareto_layout.addLayout(detail_row)
+
+        tabs.addTab(pareto, "Pareto")
+
+        # one canvas per view, created on first use and reused for every update
+        self.plots = PlotManager(
+            self, self.plot_widget_layout, self.viz2d_layout, self.viz3d_layout, lod=self.action_lod.isChecked(),
+            pareto_layout=self.pareto_plot_layout,
+        )
+
 
         # Drawing
         #drawing = QLabel("Dimensioned drawing output will appear here.")
@@ -508,7 +627,7 @@ class MainWindow(QMainWindow):
         if hasattr(self, "amb"):
             self.amb.setText("1.01325")
 
-        for name in ["convergence_angle", "divergence_angle", "cr", "throat_ratio", "lstar"]:
+        for name in ["eps", "convergence_angle", "divergence_angle", "cr", "throat_ratio", "lstar"]:
             if hasattr(self, name):
                 getattr(self, name).clear()
 
@@ -524,6 +643,12 @@ class MainWindow(QMainWindow):
     def on_reset(self):
        self.reset_requested.emit()
 
+    def set_running(self, running: bool):
+        # while a run is in flight only Cancel is live on the inputs toolbar
+        self.action_run.setEnabled(not running)
+        self.action_reset.setEnabled(not running)
+        self.action_cancel.setEnabled(running)
+
     def _apply_validators(self):
         def dv(lo, hi, dec=6):
             v = QDoubleValidator(lo, hi, dec, self)
@@ -543,6 +668,7 @@ class MainWindow(QMainWindow):
         self.thrust.setValidator(dv(0.0, 1e8, 3))        # N
 
         self.amb.setValidator(dv(0.0, 50.0, 5))          # bar
+        self.eps.setValidator(dv(1.0, 1000.0, 3))        # Ae/At
 
         self.convergence_angle.setValidator(dv(1.0, 75.0, 2))  # deg
         self.divergence_angle.setValidator(dv(1.0, 60.0, 2))   # deg
@@ -555,57 +681,28 @@ class MainWindow(QMainWindow):
 
         self.lstar.setValidator(dv(0.01, 50.0, 4))       # m
 
-    def set_plot_figures(self, figures: dict):
-        self._figures = figures
-        self._render_selected_plot()
-
-    def _render_selected_plot(self):
-        if not hasattr(self, "_figures") or not self._figures:
-            return
-
-        key = self.metric_combo.currentText()
-        fig = self._figures.get(key)
-        if fig is None:
-            return
-
-        # Clear old widgets from plot_widget_layout
-        while self.plot_widget_layout.count():
-            item = self.plot_widget_layout.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.setParent(None)
-
-        # Create new canvas + toolbar for this figure
-        self._plot_canvas = FigureCanvas(fig)
-        self._plot_toolbar = NavigationToolbar(self._plot_canvas, self)
-
-        self.plot_widget_layout.addWidget(self._plot_toolbar)
-        self.plot_widget_layout.addWidget(self._plot_canvas)
-
-    def set_viz_figures(self, fig2d, fig3d):
-        # --- 2D ---
-        while self.viz2d_layout.count():
-            item = self.viz2d_layout.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.setParent(None)
-
-        self._viz2d_canvas = FigureCanvas(fig2d)
-        self._viz2d_toolbar = NavigationToolbar(self._viz2d_canvas, self)
-        self.viz2d_layout.addWidget(self._viz2d_toolbar)
-        self.viz2d_layout.addWidget(self._viz2d_canvas)
-
-        # --- 3D ---
-        while self.viz3d_layout.count():
-            item = self.viz3d_layout.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.setParent(None)
-
-        self._viz3d_canvas = FigureCanvas(fig3d)
-        self._viz3d_toolbar = NavigationToolbar(self._viz3d_canvas, self)
-        self.viz3d_layout.addWidget(self._viz3d_toolbar)
-        self.viz3d_layout.addWidget(self._viz3d_canvas)
+    def _on_metric_changed(self, name: str):
+        self.plots.select_performance(name)
+
+    def _apply_results_filter(self):
+        def bound(edit):
+            text = edit.text().strip()
+            try:
+                return float(text) if text else None
+            except ValueError:
+                return None
+        self.results_model.set_range_filter(
+            self.filter_column.currentIndex(), bound(self.filter_min), bound(self.filter_max)
+        )
+
+    def _clear_results_filter(self):
+        self.filter_min.clear()
+        self.filter_max.clear()
+        self.results_model.clear_filter()
+
+    def _update_filter_count(self, *_):
+        shown, total = self.results_model.rowCount(), self.results_model.source_rows
+        self.filter_count.setText(f"{shown} of {total} rows" if shown != total else f"{total} rows")
 
     def _toggle_left(self):
         self.left_dock.setVisible(not self.left_dock.isVisible())
@@ -0,0 +1,106 @@
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from Core.engine_analysis import engine_design_run, engine_design_stream, ResultBuffer
+from Core.design_optimizer import pareto_search
+from CEA.CEARunner import CEACancelled, of_grid
+
+
+class RunSignals(QObject):
+    progress = Signal(int, int)      # CEA states / O/F points done, total
+    partial = Signal(object)         # FullDesignResult for every O/F point so far, as views (stream mode)
+    finished = Signal(object)        # FullDesignResult for the whole run
+    failed = Signal(str)
+    cancelled = Signal()
+
+
+class EngineRunWorker(QRunnable):
+    # runs engine_design_run off the UI thread; results come back through self.signals
+
+    def __init__(self, inputs, stream: bool = False, chunk_size: int = 64):
+        super().__init__()
+        self.inputs = inputs
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.signals = RunSignals()
+        self._cancel = threading.Event()
+        self.setAutoDelete(False)  # controller keeps a reference until it hears back
+
+    def cancel(self):
+        self._cancel.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def _progress(self, done: int, total: int):
+        # throttle to ~200 updates per run so large sweeps don't flood the UI event queue
+        step = max(1, total // 200)
+        if done == total or done % step == 0:
+            self.signals.progress.emit(done, total)
+
+    def _run_stream(self):
+        # chunks are copied once into a preallocated buffer; partial and finished hand out
+        # views of it, so the UI never concatenates and holds no second copy of the sweep
+        total = of_grid(self.inputs).size
+        buffer = ResultBuffer(total)
+        for chunk in engine_design_stream(self.inputs, chunk_size=self.chunk_size, cancel=self._cancel.is_set):
+            so_far = buffer.append(chunk)
+            self.signals.partial.emit(so_far)
+            self.signals.progress.emit(buffer.size, total)
+            if self._cancel.is_set():
+                raise CEACancelled("CEA run cancelled.")
+        return buffer.result()
+
+    def run(self):
+        try:
+            if self.stream:
+                results = self._run_stream()
+            else:
+                results = engine_design_run(
+                    self.inputs,
+                    progress=self._progress,
+                    cancel=self._cancel.is_set,
+                )
+        except CEACancelled:
+            self.signals.cancelled.emit()
+            return
+        except Exception as e:
+            self.signals.failed.emit(repr(e))
+            return
+
+        if self._cancel.is_set():
+            self.signals.cancelled.emit()
+        else:
+            self.signals.finished.emit(results)
+
+
+class ParetoWorker(QRunnable):
+    # runs pareto_search off the UI thread; progress is reported per generation.
+    # Cancelling stops after the current generation and still delivers the front found so far.
+
+    def __init__(self, inputs, bounds, objectives, pop_size: int = 40, generations: int = 30):
+        super().__init__()
+        self.inputs = inputs
+        self.bounds = bounds
+        self.objectives = objectives
+        self.pop_size = pop_size
+        self.generations = generations
+        self.signals = RunSignals()
+        self._cancel = threading.Event()
+        self.setAutoDelete(False)
+
+    def cancel(self):
+        self._cancel.set()
+
+    def run(self):
+        try:
+            result = pareto_search(
+                self.inputs, self.bounds, self.objectives,
+                pop_size=self.pop_size, generations=self.generations,
+                progress=self.signals.progress.emit, cancel=self._cancel.is_set,
+            )
+        except Exception as e:
+            self.signals.failed.emit(repr(e))
+            return
+        self.signals.finished.emit(result)
@@ -1,9 +1,13 @@
 from .isentropic_equations import (
-    isentropic_eqns,
+    isentropic_eqns, area_ratio_from_mach, mach_from_area_ratio,
 )
 
 from .engine_performance import (
-    performance_characterization
+    performance_characterization, effective_exhaust_velocity
+)
+
+from .kernels import (
+    isentropic_performance, set_kernel_backend, kernel_backend, KERNEL_BACKENDS
 )
 
 from .geometry import (
@@ -11,9 +15,9 @@ from .geometry import (
 )
 
 from .conical_nozzle_geometry import (
-    throat_length, chamber_diameter, chamber_length, exit_diameter, divergent_length, convergent_length, total_length, conical_nozzle_graph # conical nozzle equations
+    throat_length, chamber_diameter, chamber_length, exit_diameter, divergent_length, convergent_length, total_length, conical_nozzle_graph, conical_nozzle_contours # conical nozzle equations
 )
 
 from .bell_nozzle_geometry import (
-    initial_angle_fit, exit_angle_fit, divergent_length_bell, throat_entry_curve, throat_exit_curve, create_bell_curves
+    initial_angle_fit, exit_angle_fit, divergent_length_bell, throat_entry_curve, throat_exit_curve, create_bell_curves, bell_nozzle_graph, bell_nozzle_contours
 )
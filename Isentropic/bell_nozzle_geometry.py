@@ -1,7 +1,6 @@
 from __future__ import annotations
 import numpy as np
-import matplotlib.pyplot as plt
-from Isentropic.geometry import radius_from_area, line_plot
+from Isentropic.geometry import radius_from_area, line_plot, _per_point
 
 
 from typing import TYPE_CHECKING
@@ -28,21 +27,27 @@ def divergent_length_bell(throat_area, exit_area, bell_length):
     r_exit = radius_from_area(exit_area)
     return ((r_exit - r_throat) / np.tan(np.radians(15))) * bell_length 
 
+# the curve helpers take scalars or arrays of per-point values (one per O/F point);
+# curves come back along the last axis, i.e. (n_points,) or (n_OF, n_points)
+
 def throat_entry_curve(a_throat):
-    throat_radius = radius_from_area(a_throat)
+    throat_radius = radius_from_area(np.asarray(a_throat, dtype=float)[..., None])
     theta_angles = np.linspace(np.radians(-135), np.radians(-90), 50) # radians
     x = 1.5 * throat_radius * np.cos(theta_angles) 
     y = 1.5 * throat_radius * np.sin(theta_angles) + 1.5 * throat_radius + throat_radius
     return (x , y)
 
 def throat_exit_curve(a_throat, initial_angle):
-    throat_radius = radius_from_area(a_throat)
-    theta_angles = np.linspace(np.radians(-90), np.radians(initial_angle - 90), 50) # radians
+    throat_radius = radius_from_area(np.asarray(a_throat, dtype=float)[..., None])
+    theta_angles = np.linspace(np.radians(-90), np.radians(np.asarray(initial_angle, dtype=float) - 90), 50, axis=-1) # radians
     x = 0.382 * throat_radius * np.cos(theta_angles) 
     y = 0.382 * throat_radius * np.sin(theta_angles) + 0.382 * throat_radius + throat_radius    
     return (x , y)
 
 def create_bell_curves(initial_angle, final_angle, nozzle_length, exit_area, N_x, N_y): # take conical nozzle geometry class
+    initial_angle, final_angle, nozzle_length, exit_area, N_x, N_y = (
+        np.asarray(v, dtype=float)[..., None] for v in (initial_angle, final_angle, nozzle_length, exit_area, N_x, N_y)
+    )
     # Bezier curve variables
     E_y = radius_from_area(exit_area)
     E_x = nozzle_length
@@ -50,9 +55,6 @@ def create_bell_curves(initial_angle, final_angle, nozzle_length, exit_area, N_x
     m_1 = np.tan(np.radians(initial_angle))
     m_2 = np.tan(np.radians(final_angle))
 
-    N_x = N_x
-    N_y = N_y
-
     c_1 = N_y - m_1 * N_x
     c_2 = E_y - m_2 * E_x
 
@@ -67,8 +69,10 @@ def create_bell_curves(initial_angle, final_angle, nozzle_length, exit_area, N_x
     return (x_t, y_t)
 
 def chamber_converging_curve(chamber_length, converging_length, CR, a_throat, x1, y1):
-    A_c = CR * a_throat # chamber area
+    A_c = CR * np.asarray(a_throat, dtype=float)[..., None] # chamber area
     r_c = radius_from_area(A_c)    # radius of chamber
+    chamber_length = np.asarray(chamber_length, dtype=float)
+    converging_length = np.asarray(converging_length, dtype=float)
     '''
     x0, y0 = -converging_length, r_c        # chamber end
     x2, y2 = x1[0], y1[0]          # entry start
@@ -90,45 +94,52 @@ def chamber_converging_curve(chamber_length, converging_length, CR, a_throat, x1
     x_converging = (1 - t)**2 * x0 + 2*(1 - t)*t * xc + t**2 * x2
     y_converging = (1 - t)**2 * y0 + 2*(1 - t)*t * yc + t**2 * y2
     '''
-    throat_entry_length = abs(x1[0] + x1[-1]) # entry curve length 
-    x_ch = np.linspace(-(chamber_length + converging_length + throat_entry_length), -(converging_length + throat_entry_length), 100) # chamber length
-    y_ch = np.full_like(x_ch, r_c) # same length as x_ch but with 1 value; similar to x_ch * ones(1, 100) in matlab
+    throat_entry_length = np.abs(x1[..., 0] + x1[..., -1]) # entry curve length 
+    x_ch = np.linspace(-(chamber_length + converging_length + throat_entry_length), -(converging_length + throat_entry_length), 100, axis=-1) # chamber length
+    y_ch = np.broadcast_to(r_c, x_ch.shape) # same length as x_ch but with 1 value; similar to x_ch * ones(1, 100) in matlab
     
-    x0, y0 = x_ch[-1], y_ch[-1]   # chamber end
-    x2, y2 = x1[0], y1[0]         # entry start
+    x0, y0 = x_ch[..., -1:], r_c   # chamber end
+    x2, y2 = x1[..., :1], y1[..., :1]         # entry start
     
-    y_converging = np.linspace(y0, y2, 100) 
+    y_converging = np.linspace(y0[..., 0], y2[..., 0], 100, axis=-1) 
     x_converging = line_plot(x0, y0, x2, y2, y_converging)
     
-    x_points = np.concatenate([x_ch, x_converging[1:]])
-    y_points = np.concatenate([y_ch, y_converging[1:]])
+    x_points = np.concatenate([x_ch, x_converging[..., 1:]], axis=-1)
+    y_points = np.concatenate([y_ch, y_converging[..., 1:]], axis=-1)
 
     return x_points, y_points
 
-def bell_nozzle_graph(result: FullDesignResult, inputs: EngineInputs, idx: int = 0):
+def bell_nozzle_contours(result: FullDesignResult, inputs: EngineInputs, idx=None):
+    # every O/F point (or the indices in idx) in one broadcasted pass through the curve helpers
+    # returns (axial, radial), each (n_OF, 399)
+    n = np.atleast_1d(result.cea.OF_Ratio).size
+    sel = slice(None) if idx is None else np.atleast_1d(idx)
 
-    At = float(np.atleast_1d(result.perf.a_throat)[idx])
-    Ae = float(np.atleast_1d(result.perf.a_exit)[idx])
+    At = _per_point(result.perf.a_throat, n, sel)[:, 0]
+    Ae = _per_point(result.perf.a_exit, n, sel)[:, 0]
 
-    theta_n = float(np.atleast_1d(result.nozzle.initial_angle)[idx])
-    theta_e = float(np.atleast_1d(result.nozzle.exit_angle)[idx])
-    L_div   = float(np.atleast_1d(result.nozzle.nozzle_length)[idx])
+    theta_n = _per_point(result.nozzle.initial_angle, n, sel)[:, 0]
+    theta_e = _per_point(result.nozzle.exit_angle, n, sel)[:, 0]
+    L_div   = _per_point(result.nozzle.nozzle_length, n, sel)[:, 0]
 
-    L_ch   = float(np.atleast_1d(result.nozzle.length_chamber)[idx])
-    L_conv = float(np.atleast_1d(result.nozzle.length_convergent)[idx])
+    L_ch   = _per_point(result.nozzle.length_chamber, n, sel)[:, 0]
+    L_conv = _per_point(result.nozzle.length_convergent, n, sel)[:, 0]
 
     x1, y1 = throat_entry_curve(At)
     x2, y2 = throat_exit_curve(At, theta_n)
-    x3, y3 = create_bell_curves(theta_n, theta_e, L_div, Ae, x2[-1], y2[-1])
+    x3, y3 = create_bell_curves(theta_n, theta_e, L_div, Ae, x2[:, -1], y2[:, -1])
     x_ch, y_ch = chamber_converging_curve(L_ch, L_conv, inputs.contraction_ratio, At, x1, y1)
 
-    axial = np.concatenate([x_ch, x1, x2, x3]) # connects axial points together
-    radial = np.concatenate([y_ch, y1, y2, y3]) # connects radial points together
+    axial = np.concatenate([x_ch, x1, x2, x3], axis=1)
+    radial = np.concatenate([y_ch, y1, y2, y3], axis=1)
     # post processing and translation
-    axial = axial - np.nanmin(axial)
+    axial = axial - np.nanmin(axial, axis=1, keepdims=True)
     axial = -axial
     return(axial, radial)
 
+def bell_nozzle_graph(result: FullDesignResult, inputs: EngineInputs, idx: int = 0):
+    axial, radial = bell_nozzle_contours(result, inputs, idx=[idx])
+    return(axial[0], radial[0])
 
 
 '''
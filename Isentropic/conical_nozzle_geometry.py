@@ -1,6 +1,6 @@
 
 from __future__ import annotations
-from .geometry import diameter_from_area, radius_from_area, line_plot
+from .geometry import diameter_from_area, radius_from_area, line_plot, _per_point
 from typing import TYPE_CHECKING
 import numpy as np
 
@@ -35,36 +35,45 @@ def convergent_length(throat_area, diameter_chamber, convergent_half_angle):
 def total_length(l_chamber, l_convergent, l_throat, l_divergent):
     return l_chamber + l_convergent + l_throat + l_divergent # m
 
-# to be used for graphs of conical nozzle or for plugging into 3D CAD softwares
-def conical_nozzle_graph(result: FullDesignResult, idx: int = 0):
-    # idx of OF ratio; int = 0 to just take first value if extra values not present
-    L_div = float(np.atleast_1d(result.nozzle.length_divergent)[idx])
-    L_thr = float(np.atleast_1d(result.nozzle.length_throat)[idx])
-    L_con = float(np.atleast_1d(result.nozzle.length_convergent)[idx])
-    L_ch  = float(np.atleast_1d(result.nozzle.length_chamber)[idx])
+# every O/F point (or the indices in idx) in one broadcasted pass; returns (radial, axial), each (n_OF, 400)
+def conical_nozzle_contours(result: FullDesignResult, idx=None):
+    n = np.atleast_1d(result.cea.OF_Ratio).size
+    sel = slice(None) if idx is None else np.atleast_1d(idx)
 
-    r_t = float(np.atleast_1d(result.nozzle.radius_throat)[idx])
-    r_e = float(np.atleast_1d(result.nozzle.radius_exit)[idx])
-    r_c = float(np.atleast_1d(result.nozzle.radius_chamber)[idx])
+    L_div = _per_point(result.nozzle.length_divergent, n, sel)
+    L_thr = _per_point(result.nozzle.length_throat, n, sel)
+    L_con = _per_point(result.nozzle.length_convergent, n, sel)
+    L_ch  = _per_point(result.nozzle.length_chamber, n, sel)
+
+    r_t = _per_point(result.nozzle.radius_throat, n, sel)
+    r_e = _per_point(result.nozzle.radius_exit, n, sel)
+    r_c = _per_point(result.nozzle.radius_chamber, n, sel)
+
+    ones = np.ones(100)
 
-    
     # diverging section
-    y_1 = np.linspace(0, L_div, 100)
+    y_1 = np.linspace(0, L_div[:, 0], 100, axis=-1)
     x_1 = line_plot(r_t, L_div, r_e, 0, y_1)
 
     # throat section
-    y_2 = np.linspace(L_div, (L_thr + L_div), 100)
-    x_2 = r_t * np.ones(100)
+    y_2 = np.linspace(L_div[:, 0], (L_thr + L_div)[:, 0], 100, axis=-1)
+    x_2 = r_t * ones
 
     # converging section
-    y_3 = np.linspace((L_thr + L_div), (L_thr + L_div + L_con), 100)
+    y_3 = np.linspace((L_thr + L_div)[:, 0], (L_thr + L_div + L_con)[:, 0], 100, axis=-1)
     x_3 = line_plot(r_c, (L_thr + L_div + L_con), r_t, (L_thr + L_div), y_3)
 
     # chamber section
-    y_4 = np.linspace((L_thr + L_div + L_con), (L_thr + L_div + L_con + L_ch), 100)
-    x_4 = r_c * np.ones(100)
-    
-    x_points = np.concatenate([x_1, x_2, x_3, x_4]) # radial
-    y_points = np.concatenate([y_1, y_2, y_3, y_4]) # axial
-    
+    y_4 = np.linspace((L_thr + L_div + L_con)[:, 0], (L_thr + L_div + L_con + L_ch)[:, 0], 100, axis=-1)
+    x_4 = r_c * ones
+
+    x_points = np.concatenate([x_1, x_2, x_3, x_4], axis=1) # radial
+    y_points = np.concatenate([y_1, y_2, y_3, y_4], axis=1) # axial
+
     return(x_points, y_points)
+
+# to be used for graphs of conical nozzle or for plugging into 3D CAD softwares
+def conical_nozzle_graph(result: FullDesignResult, idx: int = 0):
+    # idx of OF ratio; int = 0 to just take first value if extra values not present
+    x_points, y_points = conical_nozzle_contours(result, idx=[idx])
+    return(x_points[0], y_points[0])
@@ -1,5 +1,6 @@
 import numpy as np
-from scipy.constants import g
+
+g = 9.80665  # standard gravity, m/s^2 (same value as scipy.constants.g)
 
 
 def performance_characterization(thrust, exit_velocity, chamber_temperature, chamber_pressure, gamma, sgc, area_ratio):
@@ -16,3 +17,10 @@ def performance_characterization(thrust, exit_velocity, chamber_temperature, cha
 
     return m_dot, Isp, c_star, throat_area, exit_area
 
+
+
+def effective_exhaust_velocity(exit_velocity, exit_pressure, ambient_pressure, area_ratio, chamber_temperature, chamber_pressure, gamma, sgc):
+    # v_exit plus the pressure thrust per unit mdot, (pe - pa) * Ae / mdot, for a nozzle not expanded to ambient;
+    # Ae / mdot = area_ratio * c* / Pc, and c* only depends on the chamber state
+    c_star = np.sqrt(sgc * chamber_temperature / gamma) * ((gamma + 1)/2) ** ((gamma + 1)/(2 * (gamma - 1)))
+    return exit_velocity + (exit_pressure - ambient_pressure) * area_ratio * c_star / chamber_pressure
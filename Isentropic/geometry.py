@@ -23,4 +23,9 @@ def line_plot(x_upper, y_upper, x_lower, y_lower, y_point):
     slope = (y_upper - y_lower) / (x_upper - x_lower)
     y_intercept = y_lower - (slope * x_lower)
     x_point = (y_point - y_intercept) / slope;
-    return(x_point)
\ No newline at end of file
+    return(x_point)
+
+
+def _per_point(values, n, sel):
+    # (n_sel, 1) column of a per-O/F field; scalars are broadcast to every point
+    return np.broadcast_to(np.atleast_1d(np.asarray(values, dtype=float)), (n,))[sel][:, None]
@@ -1,5 +1,6 @@
 import numpy as np
-from scipy.constants import R
+
+R = 8.31446261815324  # molar gas constant, J/(mol*K) (same value as scipy.constants.R)
 
 def isentropic_eqns(Gamma, Chamber_Pressure, Chamber_Temperature, Ambient_Pressure, Molecular_Weight):
 
@@ -30,3 +31,78 @@ def isentropic_eqns(Gamma, Chamber_Pressure, Chamber_Temperature, Ambient_Pressu
     return Specific_Gas_Constant, Exit_Mach, Throat_Temperature, Exit_Temperature, Throat_Pressure, Exit_Pressure, Exit_Velocity, Expansion_Ratio
 
 
+
+
+# equation 6 on its own: A/A* for a given Mach number
+def area_ratio_from_mach(Mach, Gamma):
+    k = (Gamma + 1) / (2 * (Gamma - 1))
+    return ((2 / (Gamma + 1)) * (1 + ((Gamma - 1) / 2) * Mach**2)) ** k / Mach
+
+
+def _log_area_ratio(Mach, Gamma):
+    # ln(A/A*), which doesn't overflow at high Mach / low gamma
+    k = (Gamma + 1) / (2 * (Gamma - 1))
+    return k * np.log((2 / (Gamma + 1)) * (1 + ((Gamma - 1) / 2) * Mach**2)) - np.log(Mach)
+
+
+def mach_from_area_ratio(Area_Ratio, Gamma, supersonic=True, tol=1e-12, max_iter=60):
+    # inverse of equation 6 for whole arrays at once (no loop over points). Halley's
+    # method on ln(A/A*), which is nearly linear in ln(M) on the supersonic branch,
+    # kept inside a bracket that is bisected whenever a step would leave it.
+    # Each point stops once its step is below tol*M; points still moving after
+    # max_iter come back NaN, as do area ratios below 1 (no solution), gamma <= 1
+    # and non-finite inputs.
+    eps, gam = np.broadcast_arrays(np.asarray(Area_Ratio, dtype=float), np.asarray(Gamma, dtype=float))
+    shape = eps.shape
+    eps, gam = eps.ravel(), gam.ravel()
+    valid = np.isfinite(eps) & np.isfinite(gam) & (gam > 1)
+    # invalid points are carried along as NaN without tripping warnings
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        target = np.log(eps, where=valid & (eps > 0), out=np.full(eps.shape, np.nan))
+        half = (gam - 1) / 2
+
+        if supersonic:
+            lo = np.ones_like(eps)
+            # M = eps is past the root for any realistic gamma; widen the few that aren't
+            hi = np.maximum(eps, 2.0)
+            short = _log_area_ratio(hi, gam) < target
+            while short.any():
+                hi[short] *= 2
+                short[short] = _log_area_ratio(hi[short], gam[short]) < target[short]
+            # large-M asymptote as the first guess; far better than the bracket midpoint at high eps
+            M = np.clip((eps * ((gam + 1) / 2) ** ((gam + 1) / (2 * (gam - 1)))) ** ((gam - 1) / gam) / np.sqrt(half),
+                        1.0 + 1e-6, hi)
+            M = np.where(np.isfinite(M), M, 2.0)
+        else:
+            lo = np.zeros_like(eps)
+            hi = np.ones_like(eps)
+            M = np.clip(1 / eps, 1e-6, 1 - 1e-6)
+
+        active = valid & (eps > 1)
+        for _ in range(max_iter):
+            if not active.any():
+                break
+            m, g = M[active], gam[active]
+            h = half[active]
+            f = _log_area_ratio(m, g) - target[active]
+            num, den = m**2 - 1, m + h * m**3
+            df = num / den
+            d2f = (2 * m * den - num * (1 + 3 * h * m**2)) / den**2
+
+            # f rises with M on the supersonic branch and falls on the subsonic one
+            rising = f > 0 if supersonic else f < 0
+            l, u = lo[active], hi[active]
+            u = np.where(rising, m, u)
+            l = np.where(rising, l, m)
+
+            # Halley step, falling back to bisection if it leaves the bracket
+            new = m - 2 * f * df / (2 * df**2 - f * d2f)
+            out = ~((new >= l) & (new <= u))  # also catches nan
+            new = np.where(out, (l + u) / 2, new)
+
+            lo[active], hi[active], M[active] = l, u, new
+            active[active] = np.abs(new - m) > tol * new
+
+    # whatever is still active didn't converge
+    M = np.where(valid & (eps > 1) & ~active, M, np.where(valid & (eps == 1), 1.0, np.nan))
+    return M.reshape(shape)
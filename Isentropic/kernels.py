@@ -0,0 +1,309 @@
+"""
+Fused isentropic_eqns + performance_characterization: every output of both
+in one pass, with the shared sub-expressions ((Gamma-1)/2, Mach^2, the
+1 + (Gamma-1)/2 Mach^2 term, ...) computed once and written into
+preallocated arrays instead of a temporary per sub-expression.
+
+    numpy    in-place ufuncs, same operations in the same order as the
+             reference functions (bit-identical); always available
+    numexpr  each output is one compiled expression, evaluated blockwise
+    numba    one JIT-compiled loop over the points (first call compiles)
+
+The backend comes from set_kernel_backend() or PROMPT_KERNEL, default numpy.
+"""
+from __future__ import annotations
+
+import importlib
+import math
+import os
+from typing import Dict, Optional
+
+import numpy as np
+
+from .isentropic_equations import R
+from .engine_performance import g
+
+KERNEL_BACKENDS = ("numpy", "numexpr", "numba")
+
+# in the order isentropic_eqns + performance_characterization return them
+KERNEL_OUTPUTS = (
+    "sgc", "mach_exit", "T_throat", "T_exit", "p_throat", "p_exit", "v_exit", "ER",
+    "mdot", "Isp", "c_star", "a_throat", "a_exit",
+)
+
+# points per block for the numpy backend; about what keeps its scratch and outputs in L2
+NUMPY_BLOCK = 8192
+
+_backend = os.environ.get("PROMPT_KERNEL", "").strip().lower() or "numpy"
+_numba_kernel = None
+
+
+def _require(name: str):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ValueError(f"The {name} kernel backend requires {name} (pip install {name}).")
+
+
+def set_kernel_backend(name: str):
+    global _backend
+    name = str(name).strip().lower()
+    if name not in KERNEL_BACKENDS:
+        raise ValueError(f"Unknown kernel backend '{name}'. Choose from {list(KERNEL_BACKENDS)}.")
+    if name != "numpy":
+        _require(name)
+    _backend = name
+
+
+def kernel_backend() -> str:
+    return _backend
+
+
+def isentropic_performance(
+    gamma,
+    chamber_pressure,
+    chamber_temperature,
+    exit_pressure,
+    molecular_weight,
+    thrust,
+    ambient_pressure=None,
+    area_ratio=None,
+    out: Optional[Dict[str, np.ndarray]] = None,
+    backend: Optional[str] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    isentropic_eqns(gamma, Pc, Tc, exit_pressure, MW) followed by
+    performance_characterization, as {name: array} over the broadcast shape
+    of the inputs (names as in KERNEL_OUTPUTS).
+
+    With area_ratio given (a fixed-expansion nozzle) ER is that ratio, and
+    the pressure thrust (exit_pressure - ambient_pressure) * Ae is counted
+    when sizing for thrust; designs left with no net thrust come back NaN.
+    out may hold arrays of that shape to write into; missing ones are
+    allocated.
+    """
+    backend = backend or _backend
+    if backend not in KERNEL_BACKENDS:
+        raise ValueError(f"Unknown kernel backend '{backend}'. Choose from {list(KERNEL_BACKENDS)}.")
+
+    args = [np.asarray(a, dtype=float) for a in (gamma, chamber_pressure, chamber_temperature, exit_pressure, molecular_weight, thrust)]
+    fixed = area_ratio is not None
+    if fixed:
+        if ambient_pressure is None:
+            raise ValueError("A fixed area_ratio needs the ambient_pressure it operates at.")
+        args += [np.asarray(ambient_pressure, dtype=float), np.asarray(area_ratio, dtype=float)]
+    shape = np.broadcast_shapes(*(a.shape for a in args))
+
+    out = dict(out or {})
+    for name in KERNEL_OUTPUTS:
+        buf = out.get(name)
+        if buf is None:
+            out[name] = np.empty(shape)
+        elif buf.shape != shape or buf.dtype != np.float64 or not buf.flags.c_contiguous:
+            raise ValueError(f"out['{name}'] must be a C-contiguous float64 array of shape {shape}.")
+
+    if backend == "numexpr":
+        _numexpr_kernel(args, out, fixed)
+    elif backend == "numba":
+        _run_numba(args, out, fixed, shape)
+    else:
+        _run_numpy(args, out, fixed, shape)
+    return out
+
+
+def _run_numpy(args, out, fixed, shape):
+    n = int(np.prod(shape))
+    if n <= NUMPY_BLOCK:
+        _numpy_kernel(args, out, fixed, [np.empty(shape) for _ in range(4)])
+        return
+
+    # blockwise, so the ~45 passes below stay in cache instead of streaming every array through memory
+    flat = [np.broadcast_to(a, shape).reshape(n) for a in args]
+    flat_out = {name: buf.reshape(n) for name, buf in out.items()}
+    scratch = np.empty((4, NUMPY_BLOCK))
+    for lo in range(0, n, NUMPY_BLOCK):
+        hi = min(lo + NUMPY_BLOCK, n)
+        _numpy_kernel(
+            [a[lo:hi] for a in flat], {name: buf[lo:hi] for name, buf in flat_out.items()},
+            fixed, scratch[:, :hi - lo],
+        )
+
+
+def _numpy_kernel(args, out, fixed, scratch):
+    gam, pc, tc, pd, mw, thrust = args[:6]
+    o = out
+    # scratch: a, b, c hold the shared terms, t is reused for everything short-lived
+    a, b, c, t = scratch
+    np.subtract(gam, 1, out=a)                                      # Gamma - 1
+    np.add(gam, 1, out=b)                                           # Gamma + 1
+
+    # equation 1
+    np.divide(R, mw, out=o["sgc"])
+    np.multiply(o["sgc"], 1000, out=o["sgc"])
+
+    # equation 2, with the intermediate 1 + (Gamma-1)/2 * Mach^2 kept in c for 3, 4 and 6
+    np.divide(pc, pd, out=t)
+    np.power(t, np.divide(a, gam, out=o["T_exit"]), out=t)
+    np.subtract(t, 1, out=t)
+    np.multiply(np.divide(2, a, out=o["p_exit"]), t, out=t)
+    np.sqrt(t, out=o["mach_exit"])
+
+    np.divide(a, 2, out=a)                                          # a = (Gamma - 1) / 2 from here on
+    np.square(o["mach_exit"], out=c)
+    np.multiply(a, c, out=c)
+    np.add(c, 1, out=c)
+    np.add(a, 1, out=t)                                             # 1 + (Gamma - 1) / 2
+
+    # equations 14 and 3
+    np.multiply(tc, np.reciprocal(t, out=o["T_throat"]), out=o["T_throat"])
+    np.multiply(tc, np.reciprocal(c, out=o["T_exit"]), out=o["T_exit"])
+
+    # equations 15 and 4; -Gamma / (Gamma - 1) goes through p_exit as scratch
+    np.multiply(a, 2, out=a)                                        # a = Gamma - 1 again
+    np.divide(np.negative(gam, out=o["p_exit"]), a, out=o["p_exit"])
+    np.multiply(pc, np.power(t, o["p_exit"], out=o["p_throat"]), out=o["p_throat"])
+    np.multiply(pc, np.power(c, o["p_exit"], out=o["p_exit"]), out=o["p_exit"])
+
+    # equation 5
+    np.multiply(gam, o["sgc"], out=t)
+    np.multiply(t, o["T_exit"], out=t)
+    np.multiply(o["mach_exit"], np.sqrt(t, out=t), out=o["v_exit"])
+
+    # equation 6; a becomes the exponent (Gamma + 1) / (2 (Gamma - 1)) shared with the throat area
+    np.multiply(a, 2, out=a)
+    np.divide(b, a, out=a)
+    np.divide(b, 2, out=b)                                          # b = (Gamma + 1) / 2
+    if fixed:
+        pa, eps = args[6:]
+        np.copyto(o["ER"], eps)
+    else:
+        np.power(b, np.negative(a, out=t), out=o["ER"])
+        np.divide(np.power(c, a, out=c), o["mach_exit"], out=c)
+        np.multiply(o["ER"], c, out=o["ER"])
+
+    # characterizing equations; c = sqrt(sgc / gamma) * ((Gamma + 1) / 2) ** exponent
+    np.divide(o["sgc"], gam, out=c)
+    np.sqrt(c, out=c)
+    np.multiply(c, np.power(b, a, out=t), out=c)
+
+    v = o["v_exit"]
+    if fixed:
+        # effective_exhaust_velocity: v_exit + (p_exit - ambient) * ER * c* / Pc, a_exit holds c* meanwhile
+        cs = o["a_exit"]
+        np.multiply(o["sgc"], tc, out=cs)
+        np.divide(cs, gam, out=cs)
+        np.multiply(np.sqrt(cs, out=cs), np.power(b, a, out=t), out=cs)
+        v = o["mdot"]
+        np.subtract(o["p_exit"], pa, out=v)
+        np.multiply(v, o["ER"], out=v)
+        np.multiply(v, cs, out=v)
+        np.divide(v, pc, out=v)
+        np.add(o["v_exit"], v, out=v)
+        v[~(v > 0)] = np.nan
+
+    np.divide(thrust, v, out=o["mdot"])
+    np.divide(thrust, np.multiply(o["mdot"], g, out=t), out=o["Isp"])
+    np.multiply(o["mdot"], np.sqrt(tc, out=t), out=t)
+    np.divide(t, pc, out=t)
+    np.multiply(t, c, out=o["a_throat"])
+    np.multiply(o["a_throat"], o["ER"], out=o["a_exit"])
+    np.multiply(pc, o["a_throat"], out=t)
+    np.divide(t, o["mdot"], out=o["c_star"])
+
+
+def _numexpr_kernel(args, out, fixed):
+    ne = _require("numexpr")
+    gam, pc, tc, pd, mw, thrust = args[:6]
+    o = out
+    v = dict(gam=gam, pc=pc, tc=tc, pd=pd, mw=mw, thrust=thrust, R=R, g=g, nan=np.nan)
+
+    # ln of 1 + (Gamma-1)/2 Mach^2 (= (Pc/pe)^((Gamma-1)/Gamma)) and of (Gamma+1)/2; every power below is an exp of these
+    v["lnq"] = lnq = ne.evaluate("(gam - 1) / gam * log(pc / pd)", local_dict=v)
+    v["lnb"] = ne.evaluate("log((gam + 1) / 2)", local_dict=v)
+
+    ne.evaluate("(R / mw) * 1000", local_dict=v, out=o["sgc"])
+    ne.evaluate("sqrt(2 / (gam - 1) * expm1(lnq))", local_dict=v, out=o["mach_exit"])
+    ne.evaluate("tc * 2 / (gam + 1)", local_dict=v, out=o["T_throat"])
+    ne.evaluate("tc * exp(-lnq)", local_dict=v, out=o["T_exit"])
+    ne.evaluate("pc * exp(-gam / (gam - 1) * lnb)", local_dict=v, out=o["p_throat"])
+    np.copyto(o["p_exit"], pd)  # expanded to exactly the pressure asked for
+    v.update(sgc=o["sgc"], me=o["mach_exit"], te=o["T_exit"], pe=o["p_exit"])
+    ne.evaluate("me * sqrt(gam * sgc * te)", local_dict=v, out=o["v_exit"])
+    if fixed:
+        np.copyto(o["ER"], args[7])
+    else:
+        ne.evaluate("exp((gam + 1) / (2 * (gam - 1)) * (lnq - lnb)) / me", local_dict=v, out=o["ER"])
+    v.update(ve=o["v_exit"], er=o["ER"])
+
+    # sqrt(sgc / gamma) * ((Gamma + 1) / 2) ** ((Gamma + 1) / (2 (Gamma - 1))), shared by the throat area and c*
+    v["c"] = c = ne.evaluate("sqrt(sgc / gam) * exp((gam + 1) / (2 * (gam - 1)) * lnb)", local_dict=v, out=lnq)
+    if fixed:
+        # mdot holds the effective exhaust velocity until it's divided into the thrust
+        v["pa"] = args[6]
+        ne.evaluate("ve + (pe - pa) * er * sqrt(tc) * c / pc", local_dict=v, out=o["mdot"])
+        v["ve"] = ne.evaluate("where(ve > 0, ve, nan)", local_dict={**v, "ve": o["mdot"]}, out=o["mdot"])
+
+    ne.evaluate("thrust / ve", local_dict=v, out=o["mdot"])
+    v["mdot"] = o["mdot"]
+    ne.evaluate("thrust / (mdot * g)", local_dict=v, out=o["Isp"])
+    ne.evaluate("(mdot * sqrt(tc) / pc) * c", local_dict=v, out=o["a_throat"])
+    v["at"] = o["a_throat"]
+    ne.evaluate("at * er", local_dict=v, out=o["a_exit"])
+    ne.evaluate("pc * at / mdot", local_dict=v, out=o["c_star"])
+
+
+def _run_numba(args, out, fixed, shape):
+    global _numba_kernel
+    if _numba_kernel is None:
+        _numba_kernel = _compile_numba()
+
+    n = int(np.prod(shape))
+    flat = [np.broadcast_to(a, shape).reshape(n) for a in args]
+    if not fixed:
+        zero = np.broadcast_to(np.zeros(1), (n,))
+        flat += [zero, zero]
+    # the outputs are fresh or caller-given C-contiguous arrays, so these are views
+    _numba_kernel(*flat, fixed, *(np.ravel(out[name]) for name in KERNEL_OUTPUTS))
+
+
+def _compile_numba():
+    numba = _require("numba")
+
+    # same algebra as the numexpr kernel, one point per iteration, no temporaries at all
+    @numba.njit(cache=True, parallel=True)
+    def kernel(gam, pc, tc, pd, mw, thrust, pa, eps, fixed,
+               sgc, me, t_throat, t_exit, p_throat, p_exit, v_exit, er, mdot, isp, c_star, a_throat, a_exit):
+        for i in numba.prange(gam.size):
+            gm = gam[i]
+            k = (gm + 1) / (2 * (gm - 1))
+            lnq = (gm - 1) / gm * math.log(pc[i] / pd[i])
+            lnb = math.log((gm + 1) / 2)
+            r = (R / mw[i]) * 1000
+            m = math.sqrt(2 / (gm - 1) * math.expm1(lnq))
+            te = tc[i] * math.exp(-lnq)
+            ve = m * math.sqrt(gm * r * te)
+            ratio = eps[i] if fixed else math.exp(k * (lnq - lnb)) / m
+            c = math.sqrt(r / gm) * math.exp(k * lnb)
+            v = ve
+            if fixed:
+                v = ve + (pd[i] - pa[i]) * ratio * math.sqrt(tc[i]) * c / pc[i]
+                if not v > 0:
+                    v = math.nan
+            md = thrust[i] / v
+            at = (md * math.sqrt(tc[i]) / pc[i]) * c
+
+            sgc[i] = r
+            me[i] = m
+            t_throat[i] = tc[i] * 2 / (gm + 1)
+            t_exit[i] = te
+            p_throat[i] = pc[i] * math.exp(-gm / (gm - 1) * lnb)
+            p_exit[i] = pd[i]
+            v_exit[i] = ve
+            er[i] = ratio
+            mdot[i] = md
+            isp[i] = thrust[i] / (md * g)
+            c_star[i] = pc[i] * at / md
+            a_throat[i] = at
+            a_exit[i] = at * ratio
+
+    return kernel
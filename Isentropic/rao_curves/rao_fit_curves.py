@@ -62,11 +62,16 @@ rao_fit_parameters = {
 DATA_DIR = Path(__file__).parent
 OUTPUT_PATH = DATA_DIR / "rao_fit_params.json"
 
-# ---- Write JSON ----
-with OUTPUT_PATH.open("w") as f:
-    json.dump(rao_fit_parameters, f, indent=4)
 
-print(f"Saved Rao fit parameters to: {OUTPUT_PATH}")
+def write_rao_fit_params(path: Path = OUTPUT_PATH) -> Path:
+    """
+    Writes rao_fit_parameters to JSON. Only run by hand (python -m
+    Isentropic.rao_curves.rao_fit_curves), never on import.
+    """
+    path = Path(path)
+    with path.open("w") as f:
+        json.dump(rao_fit_parameters, f, indent=4)
+    return path
 
 
 def _parse_bell_percent(bell_percent: str) -> str:
@@ -88,11 +93,10 @@ def _parse_bell_percent(bell_percent: str) -> str:
 @lru_cache(maxsize=1)
 def load_rao_fit_params() -> dict:
     """
-    Loads rao_fit_params.json once and caches it.
+    Returns the Rao fit parameters (the dict above; rao_fit_params.json is
+    just an exported copy of it).
     """
-    path = Path(__file__).parent / "rao_fit_params.json"
-    with path.open("r") as f:
-        return json.load(f)
+    return rao_fit_parameters
 
 
 def get_rao_coeffs(bell_percent: str) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
@@ -104,7 +108,7 @@ def get_rao_coeffs(bell_percent: str) -> Tuple[Tuple[float, float, float], Tuple
 
     if key_n not in params or key_e not in params:
         raise KeyError(
-            f"Missing Rao fit keys '{key_n}' or '{key_e}' in rao_fit_params.json"
+            f"Missing Rao fit keys '{key_n}' or '{key_e}' in rao_fit_parameters"
         )
 
     n = params[key_n]
@@ -114,3 +118,7 @@ def get_rao_coeffs(bell_percent: str) -> Tuple[Tuple[float, float, float], Tuple
         (float(n["a"]), float(n["b"]), float(n["c"])),
         (float(e["a"]), float(e["b"]), float(e["c"])),
     )
+
+
+if __name__ == "__main__":
+    print(f"Saved Rao fit parameters to: {write_rao_fit_params()}")
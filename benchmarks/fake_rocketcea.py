@@ -0,0 +1,88 @@
+"""
+Offline stand-in for rocketcea used by the benchmarks.
+
+install() registers a tiny `rocketcea` package in sys.modules whose CEA_Obj
+answers get_Tcomb / get_Chamber_MolWt_gamma / get_Densities from smooth
+closed-form fits. Results are deterministic and need no Fortran build, so
+timings measure PROMPT's own code rather than the CEA solver. The numbers
+are plausible for LOX/hydrocarbon but are not thermochemistry.
+
+install() has to run before anything imports rocketcea (CEA.CEARunner only
+imports it on the first solve, so importing CEA first is fine).
+"""
+from __future__ import annotations
+
+import math
+import sys
+import types
+
+FAKE_VERSION = "0.0.0+benchmark-stand-in"
+
+_R_UNIVERSAL = 8.31446261815324  # J/(mol*K)
+
+
+def _state(pc_bar: float, mr: float):
+    # flame temperature peaks a little rich of stoichiometric and rises slowly with Pc
+    x = math.log(mr / 2.6)
+    t_c = (1200.0 + 2400.0 * math.exp(-1.6 * x * x)) * (1.0 + 0.02 * math.log10(pc_bar / 10.0))
+    mw = 16.0 + 4.5 * math.tanh(0.8 * (mr - 1.8)) + 2.0 * mr / (1.0 + mr)   # g/mol
+    gamma = 1.24 - 0.06 * math.exp(-1.6 * x * x) + 0.005 * math.log10(pc_bar / 10.0)
+    rho = pc_bar * 1e5 * mw * 1e-3 / (_R_UNIVERSAL * t_c)                     # kg/m^3
+    return t_c, mw, gamma, rho
+
+
+class CEA_Obj:
+    # mirrors the slice of rocketcea.cea_obj_w_units.CEA_Obj that PROMPT calls;
+    # cea_obj is None so CEARunner takes its public-API path
+
+    cea_obj = None
+
+    def __init__(self, oxName="LOX", fuelName="RP1", pressure_units="bar",
+                 temperature_units="K", density_units="kg/m^3", **kwargs):
+        self.oxName = oxName
+        self.fuelName = fuelName
+
+    def get_Tcomb(self, Pc=100.0, MR=1.0):
+        return _state(Pc, MR)[0]
+
+    def get_Chamber_MolWt_gamma(self, Pc=100.0, MR=1.0, eps=40.0):
+        _, mw, gamma, _ = _state(Pc, MR)
+        return mw, gamma
+
+    def get_Densities(self, Pc=100.0, MR=1.0, eps=40.0, frozen=0, frozenAtThroat=0):
+        rho_c = _state(Pc, MR)[3]
+        return rho_c, 0.6 * rho_c, 0.01 * rho_c
+
+
+def install():
+    """
+    Registers the stand-in as `rocketcea`. Raises if the real package has
+    already been imported in this process.
+    """
+    existing = sys.modules.get("rocketcea")
+    if existing is not None and getattr(existing, "__benchmark_stand_in__", False):
+        return
+    if existing is not None:
+        raise RuntimeError("rocketcea is already imported; install the stand-in before any CEA solve.")
+
+    pkg = types.ModuleType("rocketcea")
+    pkg.__path__ = []
+    pkg.__benchmark_stand_in__ = True
+
+    version = types.ModuleType("rocketcea._version")
+    version.__version__ = FAKE_VERSION
+
+    with_units = types.ModuleType("rocketcea.cea_obj_w_units")
+    with_units.CEA_Obj = CEA_Obj
+
+    cea_obj = types.ModuleType("rocketcea.cea_obj")  # no py_cea, like a moved internal API
+
+    pkg._version = version
+    pkg.cea_obj_w_units = with_units
+    pkg.cea_obj = cea_obj
+    sys.modules.update({
+        "rocketcea": pkg,
+        "rocketcea._version": version,
+        "rocketcea.cea_obj_w_units": with_units,
+        "rocketcea.cea_obj": cea_obj,
+    })
@@ -0,0 +1,171 @@
+"""
+Small asv-style timing harness shared by the benchmark scripts.
+
+A benchmark is a callable timed in repeated samples; each sample loops the
+callable enough times to last at least `min_time` seconds, and the median
+per-call time is reported. Results are written as JSON keyed by benchmark
+name so runs from different commits can be compared.
+"""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+@dataclass
+class Timing:
+    name: str
+    median_s: float
+    min_s: float
+    stdev_s: float
+    number: int       # calls per sample
+    repeat: int       # samples
+
+
+def time_callable(name: str, fn: Callable[[], object], repeat: int = 5, min_time: float = 0.05,
+                  max_time: float = 20.0) -> Timing:
+    """
+    Times fn() and returns per-call statistics. One warm-up call (lazy
+    imports, first-use caches) is followed by a timed call that calibrates
+    how many calls go into each sample; very slow benchmarks get fewer
+    samples so one entry can't run away with max_time.
+    """
+    fn()
+    t0 = time.perf_counter()
+    fn()
+    first = time.perf_counter() - t0
+
+    number = max(1, int(min_time / first)) if first > 0 else 1000
+    repeat = max(1, min(repeat, int(max_time / max(first * number, 1e-9))))
+
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - t0) / number)
+
+    return Timing(
+        name=name,
+        median_s=statistics.median(samples),
+        min_s=min(samples),
+        stdev_s=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        number=number,
+        repeat=repeat,
+    )
+
+
+def format_seconds(s: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if s >= scale:
+            return f"{s / scale:.3g} {unit}"
+    return f"{s / 1e-9:.3g} ns"
+
+
+def git_commit() -> str:
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=REPO_ROOT, capture_output=True, text=True).stdout.strip()
+
+    sha = git("rev-parse", "--short", "HEAD") or "unknown"
+    dirty = bool(git("status", "--porcelain", "--untracked-files=no"))
+    return f"{sha}-dirty" if dirty else sha
+
+
+def machine_info() -> dict:
+    import numpy as np
+
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save_results(suite: str, timings: List[Timing], extra: Optional[dict] = None,
+                 path: Optional[Path] = None) -> Path:
+    commit = git_commit()
+    if path is None:
+        path = RESULTS_DIR / f"{suite}-{commit}.json"
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    payload = {
+        "suite": suite,
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": machine_info(),
+        **(extra or {}),
+        "results": {t.name: asdict(t) for t in timings},
+    }
+    path.write_text(json.dumps(payload, indent=2))
+    return path
+
+
+def load_results(ref: str, suite: str) -> dict:
+    """
+    ref is a results file path or a commit (short sha) with a stored run.
+    """
+    path = Path(ref)
+    if not path.is_file():
+        path = RESULTS_DIR / f"{suite}-{ref}.json"
+    if not path.is_file():
+        raise FileNotFoundError(f"No stored '{suite}' results for '{ref}' (looked in {RESULTS_DIR}).")
+    return json.loads(path.read_text())
+
+
+def compare(baseline: dict, timings: List[Timing], threshold: float = 1.2) -> int:
+    """
+    Prints current vs baseline median per benchmark; returns the number of
+    benchmarks slower than threshold x baseline.
+    """
+    base = baseline.get("results", {})
+    regressions = 0
+
+    print(f"\ncompared with {baseline.get('commit', '?')} ({baseline.get('timestamp', '?')}):")
+    print(f"{'benchmark':<44}{'before':>12}{'after':>12}{'ratio':>8}")
+    for t in timings:
+        old = base.get(t.name)
+        if old is None:
+            print(f"{t.name:<44}{'-':>12}{format_seconds(t.median_s):>12}{'new':>8}")
+            continue
+        ratio = t.median_s / old["median_s"] if old["median_s"] > 0 else float("inf")
+        flag = ""
+        if ratio > threshold:
+            flag = "  slower"
+            regressions += 1
+        elif ratio < 1.0 / threshold:
+            flag = "  faster"
+        print(f"{t.name:<44}{format_seconds(old['median_s']):>12}{format_seconds(t.median_s):>12}{ratio:>8.2f}{flag}")
+    return regressions
+
+
+def print_timings(timings: List[Timing]):
+    print(f"{'benchmark':<44}{'median':>12}{'min':>12}{'runs':>10}")
+    for t in timings:
+        print(f"{t.name:<44}{format_seconds(t.median_s):>12}{format_seconds(t.min_s):>12}"
+              f"{t.repeat:>5}x{t.number:<4}")
+
+
+def select(names: Dict[str, object], patterns: List[str]) -> List[str]:
+    # substring filter, like asv's -b / pytest's -k
+    if not patterns:
+        return list(names)
+    return [n for n in names if any(p in n for p in patterns)]
+
+
+def ensure_repo_on_path():
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
@@ -0,0 +1,138 @@
+"""
+Cold-start import benchmark.
+
+Imports each target in a fresh interpreter under `python -X importtime`,
+reports the time spent importing it (interpreter start-up excluded) and
+fails if a target goes over its budget or pulls in a module it is meant to
+defer (pandas, matplotlib, rocketcea, scipy, ...).
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 7 --scale 2.0
+
+Budgets are in milliseconds for a typical desktop; --scale stretches them
+for slower machines or CI runners.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Set, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+HEADLESS_DEFERRED = ("pandas", "matplotlib", "rocketcea", "scipy", "numexpr", "numba", "PySide6")
+GUI_DEFERRED = ("pandas", "matplotlib", "rocketcea", "scipy", "numexpr", "numba")
+
+
+@dataclass
+class ImportTarget:
+    module: str
+    budget_ms: float
+    deferred: Tuple[str, ...] = ()     # must not be imported as a side effect
+    requires: Optional[str] = None     # skipped if this package isn't installed
+
+
+TARGETS = [
+    ImportTarget("Isentropic", 200.0, HEADLESS_DEFERRED),
+    ImportTarget("CEA", 300.0, HEADLESS_DEFERRED),
+    ImportTarget("Core.engine_analysis", 300.0, HEADLESS_DEFERRED),
+    ImportTarget("Core.batch", 300.0, HEADLESS_DEFERRED),
+    ImportTarget("GUI.controller", 600.0, GUI_DEFERRED, requires="PySide6"),
+    ImportTarget("main", 600.0, GUI_DEFERRED, requires="PySide6"),
+]
+
+
+def _importtime(code: str) -> Tuple[List[Tuple[str, float]], Set[str]]:
+    """
+    Runs `code` under -X importtime. Returns the top-level import entries as
+    (module, cumulative_ms) and the set of every module that was imported.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    env["PROMPT_CEA_CACHE"] = "off"  # don't let a cache file open count against the budget
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"`{code}` failed:\n{proc.stderr.strip()[-2000:]}")
+
+    top, seen = [], set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        module = name.strip()
+        seen.add(module)
+        if not name[1:].startswith(" "):  # nested imports are indented under their parent
+            top.append((module, int(cumulative) / 1000.0))
+    return top, seen
+
+
+def measure(module: str, repeat: int = 5) -> Tuple[float, Set[str]]:
+    """
+    Median import time of `module` in ms over `repeat` fresh interpreters,
+    plus the modules it imported.
+    """
+    startup = {m for m, _ in _importtime("pass")[0]}
+
+    times, seen = [], set()
+    for _ in range(repeat):
+        top, seen = _importtime(f"import {module}")
+        times.append(sum(ms for m, ms in top if m not in startup))
+    return statistics.median(times), seen
+
+
+def _installed(package: str) -> bool:
+    import importlib.util
+    return importlib.util.find_spec(package) is not None
+
+
+def run(targets: Sequence[ImportTarget], repeat: int = 5, scale: float = 1.0) -> int:
+    failures = 0
+    print(f"{'module':<24}{'import ms':>11}{'budget':>9}  status")
+
+    for t in targets:
+        if t.requires and not _installed(t.requires):
+            print(f"{t.module:<24}{'-':>11}{'-':>9}  skipped ({t.requires} not installed)")
+            continue
+
+        ms, seen = measure(t.module, repeat)
+        budget = t.budget_ms * scale
+        leaked = sorted(p for p in t.deferred if p in seen)
+
+        problems = []
+        if ms > budget:
+            problems.append("over budget")
+        if leaked:
+            problems.append("imports " + ", ".join(leaked))
+        failures += bool(problems)
+
+        print(f"{t.module:<24}{ms:>11.1f}{budget:>9.0f}  {'; '.join(problems) or 'ok'}")
+
+    return 1 if failures else 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check cold-start import times against their budgets.")
+    parser.add_argument("modules", nargs="*", help="only check these targets (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per target (median is reported)")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget by this factor")
+    args = parser.parse_args(argv)
+
+    targets = [t for t in TARGETS if not args.modules or t.module in args.modules]
+    if not targets:
+        parser.error(f"no targets match {args.modules}; known: {[t.module for t in TARGETS]}")
+    return run(targets, repeat=max(1, args.repeat), scale=args.scale)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
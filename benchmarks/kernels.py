@@ -0,0 +1,161 @@
+"""
+Microbenchmark for the fused isentropic + performance kernel
+(Isentropic/kernels.py) against the reference isentropic_eqns followed by
+performance_characterization, on random chamber states.
+
+    python benchmarks/kernels.py                        # every installed backend
+    python benchmarks/kernels.py --sizes 1000 1000000 --backend numpy
+
+Before anything is timed, every backend is checked against the reference:
+numpy must match bit for bit, numexpr and numba (which use exp/log forms of
+the same equations) to --rtol. A mismatch fails the run. Results go to
+benchmarks/results/kernels-<commit>.json, like the other suites.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import sys
+from typing import Callable, Dict, List, Optional, Sequence
+
+import harness
+import numpy as np
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+
+
+def chamber_states(n: int, seed: int = 0) -> Dict[str, np.ndarray]:
+    # spread of states a real sweep produces
+    rng = np.random.default_rng(seed)
+    return {
+        "gamma": rng.uniform(1.1, 1.3, n),
+        "pc": rng.uniform(1e6, 2e7, n),
+        "tc": rng.uniform(2500.0, 3600.0, n),
+        "mw": rng.uniform(18.0, 26.0, n),
+    }
+
+
+def reference(s: Dict[str, np.ndarray], p_exit, thrust: float, pa: Optional[float] = None,
+              eps: Optional[float] = None) -> Dict[str, np.ndarray]:
+    # what engine_analysis computed before the fused kernel
+    from Isentropic import effective_exhaust_velocity, isentropic_eqns, performance_characterization
+    from Isentropic.kernels import KERNEL_OUTPUTS
+
+    sgc, mach, t_t, t_e, p_t, p_e, v_e, er = isentropic_eqns(s["gamma"], s["pc"], s["tc"], p_exit, s["mw"])
+    v = v_e
+    if eps is not None:
+        er = np.broadcast_to(eps, np.shape(er)).astype(float)
+        v = effective_exhaust_velocity(v_e, p_e, pa, er, s["tc"], s["pc"], s["gamma"], sgc)
+        v = np.where(v > 0, v, np.nan)
+    perf = performance_characterization(thrust, v, s["tc"], s["pc"], s["gamma"], sgc, er)
+    return dict(zip(KERNEL_OUTPUTS, (sgc, mach, t_t, t_e, p_t, p_e, v_e, er) + perf))
+
+
+def check(backend: str, s: Dict[str, np.ndarray], pa: float, thrust: float, rtol: float) -> Optional[str]:
+    # None if the backend agrees with the reference (expanded to ambient and at a fixed ER), else what went wrong
+    from Isentropic import mach_from_area_ratio
+    from Isentropic.kernels import isentropic_performance
+
+    gam, eps = s["gamma"], 8.0
+    p_fixed = s["pc"] * (1 + ((gam - 1) / 2) * mach_from_area_ratio(eps, gam) ** 2) ** (-gam / (gam - 1))
+    cases = {
+        "matched": (reference(s, pa, thrust), pa, {}),
+        "fixed ER": (reference(s, p_fixed, thrust, pa, eps), p_fixed, {"ambient_pressure": pa, "area_ratio": eps}),
+    }
+    for case, (ref, p_exit, extra) in cases.items():
+        got = isentropic_performance(gam, s["pc"], s["tc"], p_exit, s["mw"], thrust, backend=backend, **extra)
+        for name, expected in ref.items():
+            expected = np.broadcast_to(expected, got[name].shape)
+            if backend == "numpy":
+                if not np.array_equal(got[name], expected, equal_nan=True):
+                    return f"{case}: {name} is not bit-identical"
+            elif not np.allclose(got[name], expected, rtol=rtol, atol=0.0, equal_nan=True):
+                err = np.nanmax(np.abs(got[name] / expected - 1))
+                return f"{case}: {name} differs by {err:.2e} (rtol {rtol:g})"
+    return None
+
+
+def build_benchmarks(sizes: Sequence[int], backends: Sequence[str]) -> Dict[str, Callable[[], object]]:
+    from Isentropic.kernels import KERNEL_OUTPUTS, isentropic_performance
+
+    pa, thrust = 101325.0, 4500.0
+    benches: Dict[str, Callable[[], object]] = {}
+    for n in sizes:
+        s = chamber_states(n)
+        benches[f"reference[{n}]"] = lambda s=s: reference(s, pa, thrust)
+        for backend in backends:
+            fused = lambda s=s, b=backend, out=None: isentropic_performance(
+                s["gamma"], s["pc"], s["tc"], pa, s["mw"], thrust, out=out, backend=b
+            )
+            buffers = {name: np.empty(n) for name in KERNEL_OUTPUTS}
+            benches[f"{backend}[{n}]"] = fused
+            benches[f"{backend}+out[{n}]"] = lambda f=fused, out=buffers: f(out=out)
+    return benches
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Time the fused isentropic/performance kernels against the reference equations.")
+    parser.add_argument("--backend", action="append", default=[], help="only these backends (repeatable; default: all installed)")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="points per call")
+    parser.add_argument("--rtol", type=float, default=1e-12, help="allowed relative error for numexpr/numba")
+    parser.add_argument("--repeat", type=int, default=5, help="samples per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per sample")
+    parser.add_argument("--compare", metavar="REF", help="stored results to compare with (commit sha or JSON path)")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio that counts as a regression")
+    parser.add_argument("--no-save", action="store_true", help="don't write a results file")
+    parser.add_argument("-o", "--output", help="results JSON path (default: benchmarks/results/kernels-<commit>.json)")
+    args = parser.parse_args(argv)
+
+    harness.ensure_repo_on_path()
+    from Isentropic.kernels import KERNEL_BACKENDS
+
+    unknown = sorted(set(args.backend) - set(KERNEL_BACKENDS))
+    if unknown:
+        parser.error(f"unknown backend(s) {unknown}; choose from {list(KERNEL_BACKENDS)}")
+    backends: List[str] = []
+    for b in args.backend or KERNEL_BACKENDS:
+        if b == "numpy" or importlib.util.find_spec(b) is not None:
+            backends.append(b)
+        else:
+            print(f"  {b:<42}{'skipped (not installed)':>12}", file=sys.stderr)
+
+    # equivalence first, including the numba compile, so neither lands in the timings
+    states = chamber_states(100_003, seed=1)
+    failed = False
+    for b in backends:
+        problem = check(b, states, 101325.0, 4500.0, args.rtol)
+        failed |= problem is not None
+        print(f"  {b:<42}{problem or 'matches reference':>12}", file=sys.stderr)
+    if failed:
+        return 1
+
+    baseline = harness.load_results(args.compare, "kernels") if args.compare else None
+    benches = build_benchmarks(args.sizes, backends)
+
+    timings: List[harness.Timing] = []
+    for name, fn in benches.items():
+        timings.append(harness.time_callable(name, fn, repeat=args.repeat, min_time=args.min_time))
+        print(f"  {name:<42}{harness.format_seconds(timings[-1].median_s):>12}", file=sys.stderr)
+
+    print()
+    harness.print_timings(timings)
+
+    # speedup over the reference at each size
+    medians = {t.name: t.median_s for t in timings}
+    print(f"\n{'speedup vs reference':<44}" + "".join(f"{n:>12}" for n in args.sizes))
+    for b in backends:
+        for variant in (b, f"{b}+out"):
+            row = "".join(f"{medians[f'reference[{n}]'] / medians[f'{variant}[{n}]']:>11.2f}x" for n in args.sizes)
+            print(f"{variant:<44}{row}")
+
+    if not args.no_save:
+        path = harness.save_results("kernels", timings, extra={"backends": backends}, path=args.output)
+        print(f"\nsaved {path}")
+
+    if baseline is not None and harness.compare(baseline, timings, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
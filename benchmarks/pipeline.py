@@ -0,0 +1,178 @@
+"""
+Benchmarks for every stage of engine_design_run, from the O/F grid to the
+CSV and binary exports, over small, medium and large O/F sweeps.
+
+    python benchmarks/pipeline.py                     # run and store results
+    python benchmarks/pipeline.py -b CEArun -b plots  # only matching benchmarks
+    python benchmarks/pipeline.py --compare abc1234   # diff against a stored commit
+
+CEA runs against benchmarks/fake_rocketcea.py unless --real-cea is given, so
+the default run is deterministic, offline and measures PROMPT rather than
+the CEA solver. Results go to benchmarks/results/pipeline-<commit>.json.
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import sys
+import tempfile
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import harness
+import numpy as np
+
+# (OF_min, OF_max, OF_increment) -> 31, 701 and 70001 O/F points
+SIZES: Dict[str, Tuple[float, float, float]] = {
+    "small": (1.0, 4.0, 0.1),
+    "medium": (1.0, 8.0, 0.01),
+    "large": (1.0, 8.0, 0.0001),
+}
+
+
+def base_inputs(nozzle_type: str, size: str):
+    from Core.engine_inputs import EngineInputs
+
+    of_min, of_max, of_inc = SIZES[size]
+    return EngineInputs(
+        chamber_pressure=2.0e6,
+        thrust=4500.0,
+        nozzle_type=nozzle_type,
+        convergent_angle=45.0,
+        divergent_angle=15.0,
+        contraction_ratio=4.0,
+        throat_ratio=0.05,
+        l_star=0.8,
+        bell_percent=80 if nozzle_type == "bell" else None,
+        fuel_name="RP1",
+        oxidizer_name="LOX",
+        OF_min=of_min,
+        OF_max=of_max,
+        OF_increment=of_inc,
+        source="benchmark",
+    )
+
+
+def build_benchmarks(sizes: Sequence[str], out_dir: str) -> Dict[str, Callable[[], object]]:
+    """
+    Runs the pipeline once per size to get realistic inputs for each stage,
+    then returns {name: zero-argument callable} for the stages themselves.
+    """
+    from CEA.CEARunner import CEArun, of_grid
+    from Core.design_optimizer import optimize_design, pareto_search
+    from Core.engine_analysis import FullDesignResult
+    from Core.exports import exportCEAResults, exportEngineData, exportNozzleDatapoints, exportResults, loadResults
+    from Core.off_design import off_design_map
+    from Core.nozzle_pipeline import bell_nozzle_sizing, conical_nozzle_sizing, engine_analysis
+    from Core.plots import (
+        plot_isp_vs_of, plot_nozzle_geometry, plot_nozzle_revolution, plot_temp_vs_of, plot_velocity_vs_of,
+    )
+    from Isentropic.bell_nozzle_geometry import bell_nozzle_contours, bell_nozzle_graph
+    from Isentropic.conical_nozzle_geometry import conical_nozzle_contours, conical_nozzle_graph
+
+    benches: Dict[str, Callable[[], object]] = {}
+    # sea level to vacuum x 25-150 % throttle, for the off-design maps
+    pa_grid = np.linspace(101325.0, 0.0, 32)
+    pc_grid = np.linspace(0.5e6, 3.0e6, 16)
+
+    for size in sizes:
+        conical = base_inputs("conical", size)
+        bell = dataclasses.replace(conical, nozzle_type="bell", bell_percent=80)
+
+        cea = CEArun(conical, use_cache=False, workers=1)
+        perf = engine_analysis(conical, cea)
+        conical_result = FullDesignResult(cea=cea, perf=perf, nozzle=conical_nozzle_sizing(perf, conical))
+        bell_result = FullDesignResult(cea=cea, perf=perf, nozzle=bell_nozzle_sizing(perf, bell))
+        mid = cea.OF_Ratio.size // 2
+
+        benches.update({
+            f"of_grid[{size}]": lambda c=conical: of_grid(c),
+            f"CEArun[{size}]": lambda c=conical: CEArun(c, use_cache=False, workers=1),
+            f"engine_analysis[{size}]": lambda c=conical, x=cea: engine_analysis(c, x),
+            f"conical_nozzle_sizing[{size}]": lambda c=conical, p=perf: conical_nozzle_sizing(p, c),
+            f"bell_nozzle_sizing[{size}]": lambda b=bell, p=perf: bell_nozzle_sizing(p, b),
+            f"conical_nozzle_graph[{size}]": lambda r=conical_result, i=mid: conical_nozzle_graph(r, idx=i),
+            f"bell_nozzle_graph[{size}]": lambda r=bell_result, b=bell, i=mid: bell_nozzle_graph(r, b, idx=i),
+            f"conical_nozzle_contours[{size}]": lambda r=conical_result: conical_nozzle_contours(r),
+            f"bell_nozzle_contours[{size}]": lambda r=bell_result, b=bell: bell_nozzle_contours(r, b),
+            f"plots.isp_vs_of[{size}]": lambda x=cea, p=perf: plot_isp_vs_of(x.OF_Ratio, p.Isp),
+            f"plots.velocity_vs_of[{size}]": lambda x=cea, p=perf: plot_velocity_vs_of(x.OF_Ratio, p.v_exit, p.c_star),
+            f"plots.temp_vs_of[{size}]": lambda x=cea, p=perf: plot_temp_vs_of(x.OF_Ratio, x.T_chamber, p.T_throat, p.T_exit),
+            f"exports.cea_csv[{size}]": lambda x=cea: exportCEAResults(x, out_dir, f"cea_{size}.csv"),
+            f"exports.engine_csv[{size}]": lambda r=conical_result, c=conical: exportEngineData(r, c, out_dir, f"engine_{size}.csv"),
+            f"exports.results_npz[{size}]": lambda r=conical_result, c=conical: exportResults(r, c, out_dir, f"results_{size}.npz"),
+            f"off_design_map[{size}]": lambda r=conical_result: off_design_map(r, pa_grid, pc_grid),
+        })
+        exportResults(conical_result, conical, out_dir, f"saved_{size}.npz")
+        benches[f"exports.load_npz[{size}]"] = lambda p=f"{out_dir}/saved_{size}.npz": loadResults(p)
+
+    # the contour plots and nozzle export only see one O/F point, so they don't scale with the sweep
+    x, y = conical_nozzle_graph(conical_result, idx=mid)
+    benches.update({
+        "plots.nozzle_geometry": lambda: plot_nozzle_geometry(x, y),
+        "plots.nozzle_revolution": lambda: plot_nozzle_revolution(x, y),
+        "plots.nozzle_revolution_lod": lambda: plot_nozzle_revolution(x, y, lod=True),
+        "exports.nozzle_csv": lambda: exportNozzleDatapoints(x, y, out_dir, "nozzle.csv"),
+        "optimize_design[OF,Pc]": lambda: optimize_design(
+            conical, {"OF": (1.0, 4.0), "chamber_pressure": (1e6, 6e6)}, "Isp", seed=0, use_cache=False
+        ),
+        "pareto_search[OF,Pc]": lambda: pareto_search(
+            conical, {"OF": (1.0, 4.0), "chamber_pressure": (1e6, 6e6)}, ("Isp", "length"), seed=0, use_cache=False
+        ),
+    })
+    return benches
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Time each stage of the PROMPT design pipeline.")
+    parser.add_argument("-b", "--bench", action="append", default=[], help="only run benchmarks whose name contains this (repeatable)")
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(SIZES), help="O/F sweep sizes to run")
+    parser.add_argument("--repeat", type=int, default=5, help="samples per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per sample")
+    parser.add_argument("--real-cea", action="store_true", help="time the installed rocketcea instead of the offline stand-in")
+    parser.add_argument("--compare", metavar="REF", help="stored results to compare with (commit sha or JSON path)")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio that counts as a regression")
+    parser.add_argument("--no-save", action="store_true", help="don't write a results file")
+    parser.add_argument("-o", "--output", help="results JSON path (default: benchmarks/results/pipeline-<commit>.json)")
+    args = parser.parse_args(argv)
+
+    harness.ensure_repo_on_path()
+    if not args.real_cea:
+        import fake_rocketcea
+        fake_rocketcea.install()
+
+    # time the work itself, not the persistent cache or registered tables
+    from CEA import clear_cea_tables, set_cea_cache
+    set_cea_cache(None)
+    clear_cea_tables()
+
+    baseline = harness.load_results(args.compare, "pipeline") if args.compare else None
+
+    with tempfile.TemporaryDirectory(prefix="prompt-bench-") as out_dir:
+        benches = build_benchmarks(args.sizes, out_dir)
+        names = harness.select(benches, args.bench)
+        if not names:
+            parser.error(f"no benchmarks match {args.bench}")
+
+        timings: List[harness.Timing] = []
+        for name in names:
+            timings.append(harness.time_callable(name, benches[name], repeat=args.repeat, min_time=args.min_time))
+            print(f"  {name:<42}{harness.format_seconds(timings[-1].median_s):>12}", file=sys.stderr)
+
+    print()
+    harness.print_timings(timings)
+
+    backend = "rocketcea" if args.real_cea else "stand-in"
+    if not args.no_save:
+        path = harness.save_results("pipeline", timings, extra={"cea_backend": backend}, path=args.output)
+        print(f"\nsaved {path}")
+
+    if baseline is not None:
+        if baseline.get("cea_backend") != backend:
+            print(f"\nnote: baseline used CEA backend '{baseline.get('cea_backend')}', this run used '{backend}'.")
+        if harness.compare(baseline, timings, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,7 +8,7 @@ def main():
     app = QApplication(sys.argv)
 
     w = MainWindow()
-    controller = MainController(w)  # keep reference if you want: w.controller = controller
+    w.controller = MainController(w)  # the window calls back into it on theme changes
 
     w.showMaximized()
     sys.exit(app.exec())
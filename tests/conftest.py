@@ -0,0 +1,41 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# the packages (CEA, Core, Isentropic, ...) live at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+@pytest.fixture
+def make_design():
+    """
+    make_design(nozzle_type="conical", expansion_ratio=None) -> (inputs, FullDesignResult)
+    for three O/F points, sized from fixed chamber states rather than a CEA run.
+    """
+    from CEA.CEA_Outputs import CEAOutputs
+    from Core.engine_analysis import FullDesignResult
+    from Core.engine_inputs import EngineInputs
+    from Core.nozzle_pipeline import bell_nozzle_sizing, conical_nozzle_sizing, engine_analysis
+
+    def make(nozzle_type="conical", expansion_ratio=None):
+        inputs = EngineInputs(
+            chamber_pressure=2.0e6, thrust=4500.0, nozzle_type=nozzle_type, convergent_angle=45.0,
+            divergent_angle=15.0, contraction_ratio=4.0, throat_ratio=0.05, l_star=0.8,
+            bell_percent=80 if nozzle_type == "bell" else None, fuel_name="RP1", oxidizer_name="LOX",
+            expansion_ratio=expansion_ratio, OF_min=2.0, OF_max=3.0, OF_increment=0.5,
+        )
+        cea = CEAOutputs(
+            OF_Ratio=np.array([2.0, 2.5, 3.0]),
+            p_chamber=np.full(3, 20.0),
+            gamma=np.array([1.22, 1.19, 1.20]),
+            T_chamber=np.array([3300.0, 3550.0, 3500.0]),
+            molecular_weight=np.array([20.5, 22.0, 23.4]),
+            density_chamber=np.array([1.49, 1.49, 1.61]),
+        )
+        perf = engine_analysis(inputs, cea)
+        sizing = conical_nozzle_sizing if nozzle_type == "conical" else bell_nozzle_sizing
+        return inputs, FullDesignResult(cea=cea, perf=perf, nozzle=sizing(perf, inputs))
+
+    return make
@@ -0,0 +1,75 @@
+import sqlite3
+
+import pytest
+
+from CEA.cea_cache import CEACache
+
+
+def state(i):
+    return (3000.0 + i, 20.0, 1.2, 1.5)
+
+
+def test_lru_eviction_drops_least_recently_used(tmp_path):
+    cache = CEACache(tmp_path / "cache.sqlite", max_entries=3, version="1.0")
+    cache.put_many({"a": state(0), "b": state(1), "c": state(2)})
+    cache.get("a")                 # a is now more recent than b and c
+    cache.put("d", state(3))
+
+    assert cache.evictions == 1
+    assert set(cache.get_many(["a", "b", "c", "d"])) == {"a", "c", "d"}
+    assert cache.get("a") == state(0)
+
+
+def test_rocketcea_version_change_wipes_entries(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = CEACache(path, version="1.0")
+    cache.put("a", state(0))
+    cache.close()
+
+    assert len(CEACache(path, version="1.0")) == 1
+    fresh = CEACache(path, version="2.0")
+    assert len(fresh) == 0 and fresh.get("a") is None
+
+
+def test_corrupt_file_is_rebuilt(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    path.write_bytes(b"this is not a database" * 100)
+
+    cache = CEACache(path, version="1.0")
+    assert cache.path == str(path)
+    cache.put("a", state(0))
+    assert cache.get("a") == state(0)
+
+
+def test_locked_file_degrades_to_misses(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = CEACache(path, version="1.0", timeout=0.05)
+    cache.put("a", state(0))
+
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN EXCLUSIVE")
+    try:
+        cache.put("b", state(1))              # skipped, not raised
+        # WAL still lets the read through; only the recency update fails
+        assert cache.get_many(["a", "b"]) == {"a": state(0)}
+        assert cache.errors == 2
+    finally:
+        other.execute("ROLLBACK")
+        other.close()
+    assert cache.get("a") == state(0)
+
+
+def test_unopenable_file_falls_back_to_memory(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("CREATE TABLE t (x)")
+    other.execute("BEGIN EXCLUSIVE")
+    try:
+        with pytest.warns(RuntimeWarning, match="in memory"):
+            cache = CEACache(path, version="1.0", timeout=0.05)
+    finally:
+        other.execute("ROLLBACK")
+        other.close()
+    assert cache.path == ":memory:"
+    cache.put("a", state(0))
+    assert cache.get("a") == state(0)
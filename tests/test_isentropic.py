@@ -0,0 +1,39 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from Isentropic import area_ratio_from_mach, mach_from_area_ratio
+
+GAMMAS = np.array([1.1, 1.2, 1.3, 1.4, 1.67])
+
+
+@pytest.mark.parametrize("supersonic, mach", [
+    (True, np.geomspace(1.01, 20.0, 40)),
+    (False, np.linspace(0.02, 0.99, 40)),
+])
+def test_round_trip(supersonic, mach):
+    M, gam = np.meshgrid(mach, GAMMAS)
+    eps = area_ratio_from_mach(M, gam)
+    np.testing.assert_allclose(mach_from_area_ratio(eps, gam, supersonic=supersonic), M, rtol=1e-10)
+
+
+def test_throat_and_shape():
+    assert mach_from_area_ratio(1.0, 1.2) == 1.0
+    assert mach_from_area_ratio(1.0, 1.2, supersonic=False) == 1.0
+    assert mach_from_area_ratio(np.full((3, 2), 4.0), 1.2).shape == (3, 2)
+
+
+def test_invalid_inputs_are_nan_without_warnings():
+    eps = np.array([0.5, 4.0, 4.0, 4.0, np.nan, np.inf, 4.0])
+    gam = np.array([1.2, 1.0, 0.9, np.nan, 1.2, 1.2, 1.2])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        M = mach_from_area_ratio(eps, gam)
+    assert np.isnan(M[:-1]).all()
+    assert M[-1] == pytest.approx(mach_from_area_ratio(4.0, 1.2))
+
+
+def test_not_converged_is_nan():
+    assert np.isnan(mach_from_area_ratio(1e6, 1.2, max_iter=2))
+    assert np.isfinite(mach_from_area_ratio(1e6, 1.2))
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from Core.off_design import off_design_map
+
+
+@pytest.mark.parametrize("expansion_ratio", [None, 4.0, 8.0])
+def test_design_point_reproduces_design(make_design, expansion_ratio):
+    inputs, result = make_design(expansion_ratio=expansion_ratio)
+    m = off_design_map(result, inputs.ambient_pressure, inputs.chamber_pressure)
+    perf = result.perf
+
+    assert m.shape == (3, 1, 1)
+    np.testing.assert_allclose(m.thrust[:, 0, 0], inputs.thrust, rtol=1e-9)
+    np.testing.assert_allclose(m.Isp[:, 0, 0], perf.Isp, rtol=1e-9)
+    np.testing.assert_allclose(m.mdot[:, 0, 0], perf.mdot, rtol=1e-9)
+    np.testing.assert_allclose(m.p_exit[:, 0, 0], perf.p_exit, rtol=1e-9)
+    np.testing.assert_allclose(m.mach_exit, perf.mach_exit, rtol=1e-9)
+    # eps = 8 over-expands far enough at 20 bar / 1 atm to separate
+    np.testing.assert_array_equal(m.separated[:, 0, 0], expansion_ratio == 8.0)
+
+
+def test_grid_and_single_point(make_design):
+    inputs, result = make_design()
+    pa = np.array([0.0, 50e3, 101325.0])
+    pc = np.array([0.5e6, 2.0e6])
+    m = off_design_map(result, pa, pc, idx=1)
+
+    assert m.thrust.shape == (2, 3)
+    # thrust falls with ambient pressure, mdot scales with chamber pressure
+    assert np.all(np.diff(m.thrust, axis=1) < 0)
+    np.testing.assert_allclose(m.mdot[1, 0] / m.mdot[0, 0], 4.0)
+    # expanded to 1 atm at 2 MPa; throttled to a quarter, p_exit is below 0.4 atm at sea level
+    assert m.separated[0, 2] and not m.separated[1, 2]
@@ -0,0 +1,80 @@
+from dataclasses import fields
+
+import numpy as np
+import pytest
+
+import Core.exports as exports
+from Core.exports import exportResults, loadResults
+
+# extension -> module the format needs (None: numpy only)
+FORMATS = {
+    ".npz": None,
+    ".parquet": "pyarrow",
+    ".feather": "pyarrow",
+    ".h5": "h5py",
+}
+
+
+def needs(ext):
+    if FORMATS[ext] is not None:
+        pytest.importorskip(FORMATS[ext])
+
+
+def assert_bit_exact(a, b):
+    a, b = np.asarray(a), np.asarray(b)
+    assert a.dtype == np.float64 and a.shape == b.shape
+    np.testing.assert_array_equal(a.view(np.int64), np.asarray(b, dtype=np.float64).view(np.int64))
+
+
+@pytest.mark.parametrize("ext", list(FORMATS))
+@pytest.mark.parametrize("nozzle_type", ["conical", "bell"])
+def test_round_trip(tmp_path, make_design, ext, nozzle_type):
+    needs(ext)
+    inputs, result = make_design(nozzle_type)
+    result.perf.Isp[1] = np.nan  # failed points must survive too
+
+    path = exportResults(result, inputs, out_dir=tmp_path, filename="results" + ext)["results"]
+    loaded, loaded_inputs = loadResults(path)
+
+    assert type(loaded.nozzle) is type(result.nozzle)
+    for group in ("cea", "perf", "nozzle"):
+        for f in fields(getattr(result, group)):
+            want, got = getattr(getattr(result, group), f.name), getattr(getattr(loaded, group), f.name)
+            if np.ndim(want) == 0:
+                # per-design scalars (the conical angles) come back as scalars
+                assert np.ndim(got) == 0 and got == want, f"{group}.{f.name}"
+            else:
+                assert_bit_exact(got, want)
+    assert loaded_inputs == inputs
+
+
+def test_conical_results_have_scalar_fields(make_design):
+    # guards the test above: the conical geometry does carry per-design scalars
+    _, result = make_design("conical")
+    assert any(np.ndim(getattr(result.nozzle, f.name)) == 0 for f in fields(result.nozzle))
+
+
+@pytest.mark.parametrize("ext", list(FORMATS))
+def test_without_inputs(tmp_path, make_design, ext):
+    needs(ext)
+    _, result = make_design()
+    path = exportResults(result, None, out_dir=tmp_path, filename="results" + ext)["results"]
+    assert loadResults(path)[1] is None
+
+
+@pytest.mark.parametrize("ext", list(FORMATS))
+def test_schema_mismatch(tmp_path, make_design, monkeypatch, ext):
+    needs(ext)
+    inputs, result = make_design()
+    monkeypatch.setattr(exports, "_RESULTS_SCHEMA", 99)
+    path = exportResults(result, inputs, out_dir=tmp_path, filename="results" + ext)["results"]
+    monkeypatch.undo()
+
+    with pytest.raises(ValueError, match=f"schema 99, expected {exports._RESULTS_SCHEMA}"):
+        loadResults(path)
+
+
+def test_unknown_extension(tmp_path, make_design):
+    inputs, result = make_design()
+    with pytest.raises(ValueError, match="Unknown results format"):
+        exportResults(result, inputs, out_dir=tmp_path, filename="results.xlsx")
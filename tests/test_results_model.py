@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("PySide6")
+from PySide6.QtCore import Qt
+
+from GUI.results_model import RESULT_COLUMNS, ResultsTableModel
+
+
+def model(isp):
+    m = ResultsTableModel()
+    n = len(isp)
+    m.set_columns([np.arange(n, dtype=float), np.asarray(isp, dtype=float)] + [np.zeros(n)] * (len(RESULT_COLUMNS) - 2))
+    return m
+
+
+@pytest.mark.parametrize("order, expected", [
+    (Qt.AscendingOrder, [5, 0, 3, 2, 1, 4]),
+    (Qt.DescendingOrder, [2, 0, 3, 5, 1, 4]),
+])
+def test_sort_keeps_nan_last_and_ties_in_sweep_order(order, expected):
+    m = model([300.0, np.nan, 310.0, 300.0, np.nan, 290.0])
+    m.sort(1, order)
+    assert m._rows.tolist() == expected